@@ -0,0 +1,80 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of converting affinity masks of queues on host with 1024 logical CPUs against per-CPU loops."""
+
+import time
+
+from mfd_typing.cpu_mask import (
+    cpulist_to_int,
+    hex_mask_to_cpulist,
+    hex_masks_to_cpulists,
+    int_to_hex_mask,
+    ints_to_hex_masks,
+)
+
+CPU_COUNT = 1024
+QUEUES = 4096
+REPEAT = 1000
+
+
+def _per_cpu_hex_mask(cpulist: str, cpu_count: int = CPU_COUNT) -> str:
+    """Hex mask built CPU by CPU into list of 32-bit groups."""
+    groups = [0] * ((cpu_count + 31) // 32)
+    for part in cpulist.split(","):
+        first, _, last = part.partition("-")
+        for cpu in range(int(first), int(last or first) + 1):
+            groups[cpu // 32] |= 1 << (cpu % 32)
+    return ",".join(f"{group:08x}" for group in reversed(groups))
+
+
+def _per_cpu_cpulist(hex_mask: str) -> str:
+    """cpulist built by testing every bit of hex mask."""
+    mask = int(hex_mask.replace(",", ""), 16)
+    cpus = [cpu for cpu in range(mask.bit_length()) if mask >> cpu & 1]
+    parts, start = [], None
+    for index, cpu in enumerate(cpus):
+        if start is None:
+            start = cpu
+        if index + 1 == len(cpus) or cpus[index + 1] != cpu + 1:
+            parts.append(str(start) if start == cpu else f"{start}-{cpu}")
+            start = None
+    return ",".join(parts)
+
+
+def cpulist_to_hex_mask(cpulist: str) -> str:
+    """Hex mask of cpulist padded to CPU count of host, built by codec."""
+    return int_to_hex_mask(cpulist_to_int(cpulist), CPU_COUNT)
+
+
+def _measure(function, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function(*args)
+    return (time.perf_counter() - start) / REPEAT
+
+
+def main() -> None:
+    """Print time of single and batch conversions."""
+    cpulist = "0-255,512-767"
+    hex_mask = cpulist_to_hex_mask(cpulist)
+    assert _per_cpu_hex_mask(cpulist) == hex_mask and _per_cpu_cpulist(hex_mask) == cpulist
+    for name, codec, loop, argument in (
+        ("cpulist -> hex mask", cpulist_to_hex_mask, _per_cpu_hex_mask, cpulist),
+        ("hex mask -> cpulist", hex_mask_to_cpulist, _per_cpu_cpulist, hex_mask),
+    ):
+        codec_time, loop_time = _measure(codec, argument), _measure(loop, argument)
+        print(
+            f"{name}: {codec_time * 1e6:.1f} us, per-CPU loop {loop_time * 1e6:.1f} us ({loop_time / codec_time:.0f}x)"
+        )
+
+    # one CPU per queue, every CPU of host used by 4 queues
+    masks = [1 << (queue % CPU_COUNT) for queue in range(QUEUES)]
+    start = time.perf_counter()
+    hex_masks = ints_to_hex_masks(masks, CPU_COUNT)
+    hex_masks_to_cpulists(hex_masks)
+    batch_time = time.perf_counter() - start
+    print(f"{QUEUES} queues to hex masks and back to cpulists: {batch_time * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of reading CPU topology of host with 1024 logical CPUs and of lookups in it."""
+
+import tempfile
+import time
+
+from mfd_typing.cpu_topology import CPUTopology, create_fake_cpu_topology
+
+SOCKETS = 4
+CORES_PER_SOCKET = 128
+THREADS_PER_CORE = 2
+NODES_PER_SOCKET = 2
+
+
+def main() -> None:
+    """Print time of loading topology, per-CPU lookups and CPU set operations."""
+    with tempfile.TemporaryDirectory() as root:
+        create_fake_cpu_topology(root, SOCKETS, CORES_PER_SOCKET, THREADS_PER_CORE, NODES_PER_SOCKET)
+        start = time.perf_counter()
+        topology = CPUTopology.from_sysfs(root)
+        load_time = time.perf_counter() - start
+    cpus = list(topology.online)
+
+    start = time.perf_counter()
+    for cpu in cpus:
+        topology.socket_of(cpu), topology.core_of(cpu), topology.node_of(cpu), topology.siblings(cpu)
+    lookup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for node in topology.nodes:
+        local = topology.node_cpus(node) & topology.primary_threads()
+        (topology.online - local).cpulist
+    set_time = time.perf_counter() - start
+
+    print(topology)
+    print(f"load from sysfs: {load_time * 1e3:.1f} ms ({len(topology.caches)} caches)")
+    print(f"4 lookups per CPU: {lookup_time / len(cpus) * 1e9:.0f} ns per CPU")
+    print(f"local primary threads + cpulist of remaining CPUs: {set_time / len(topology.nodes) * 1e6:.1f} us per node")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of per-instance field conversion overhead of dataclass helpers."""
+
+import timeit
+from dataclasses import dataclass, fields, InitVar
+from typing import Callable, Optional, Union
+
+from mfd_typing import PCIAddress, PCIDevice, VendorID, DeviceID, SubVendorID, SubDeviceID
+from mfd_typing.dataclass_utils import convert_fields_to_typehint_types, convert_value_field_to_typehint_type
+
+NUMBER = 20000
+
+
+@dataclass(frozen=True)
+class _PerFieldPCIDevice:
+    """PCIDevice-like dataclass converting fields the pre-plan way."""
+
+    vendor_id: Optional[Union[VendorID, int, str, bytes]] = None
+    device_id: Optional[Union[DeviceID, int, str, bytes]] = None
+    sub_vendor_id: Optional[Union[SubVendorID, int, str, bytes]] = None
+    sub_device_id: Optional[Union[SubDeviceID, int, str, bytes]] = None
+    data: InitVar[str] = None
+
+    def __post_init__(self, data: str) -> None:
+        for field in fields(self):
+            convert_value_field_to_typehint_type(self, field)
+
+
+@dataclass(frozen=True)
+class _PlannedPCIDevice(_PerFieldPCIDevice):
+    """PCIDevice-like dataclass converting fields with cached conversion plan."""
+
+    def __post_init__(self, data: str) -> None:
+        convert_fields_to_typehint_types(self)
+
+
+def _measure(statement: Callable[[], object]) -> float:
+    """Return best time of single call in microseconds."""
+    return min(timeit.repeat(statement, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main() -> None:
+    """Print per-instance overhead of field conversion before and after conversion plans."""
+    ids = (VendorID(0x8086), DeviceID(0x1572), SubVendorID(0x8086), SubDeviceID(0x0000))
+    results = {
+        "fields() + convert_value_field_to_typehint_type, typed": _measure(lambda: _PerFieldPCIDevice(*ids)),
+        "convert_fields_to_typehint_types, typed": _measure(lambda: _PlannedPCIDevice(*ids)),
+        "fields() + convert_value_field_to_typehint_type, ints": _measure(
+            lambda: _PerFieldPCIDevice(0x8086, 0x1572, 0x8086, 0x0000)
+        ),
+        "convert_fields_to_typehint_types, ints": _measure(lambda: _PlannedPCIDevice(0x8086, 0x1572, 0x8086, 0x0000)),
+        "PCIAddress(0, 0x18, 0, 1)": _measure(lambda: PCIAddress(0, 0x18, 0, 1)),
+        "PCIDevice(0x8086, 0x1572)": _measure(lambda: PCIDevice(0x8086, 0x1572)),
+    }
+    for name, value in results.items():
+        print(f"{name:<55} {value:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
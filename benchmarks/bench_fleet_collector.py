@@ -0,0 +1,37 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of collecting from fleet of hosts with simulated remote command latency."""
+
+import asyncio
+import json
+import time
+
+from benchmarks.generators import generate_ip_links
+from mfd_typing.fleet_collector import FakeTransport, FleetCollector
+
+HOST_COUNT = 64
+COMMAND_DELAY = 0.05  # seconds
+
+
+def main() -> None:
+    """Print wall-clock time and latency statistics for different concurrency limits."""
+    outputs = {
+        "*": {
+            "uname -snrm": "Linux host 6.8.0-45-generic x86_64",
+            "ip -json -details link show": json.dumps(generate_ip_links(64)),
+        }
+    }
+    for concurrency in (1, 16, 64):
+        collector = FleetCollector(FakeTransport(outputs, delays={"*": COMMAND_DELAY}), concurrency=concurrency)
+        start = time.perf_counter()
+        results = asyncio.run(collector.collect_all(f"host-{index}" for index in range(HOST_COUNT)))
+        elapsed = time.perf_counter() - start
+        stats = collector.latency_stats()
+        print(
+            f"{len(results)} hosts, concurrency {concurrency:>2}: {elapsed:6.2f} s, "
+            f"latency median {stats.median * 1e3:.1f} ms, p95 {stats.p95 * 1e3:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
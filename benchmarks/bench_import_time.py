@@ -0,0 +1,42 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of import time of mfd_typing, measured with `python -X importtime` in fresh interpreters."""
+
+import re
+import statistics
+import subprocess
+import sys
+
+REPEATS = 7
+SCENARIOS = {
+    "import mfd_typing": "import mfd_typing",
+    "PCIAddress, OSName": "from mfd_typing import PCIAddress, OSName",
+    "PCIDevice": "from mfd_typing import PCIDevice",
+    "all exported names": "import mfd_typing; [getattr(mfd_typing, name) for name in mfd_typing.__all__]",
+}
+_importtime_regex = re.compile(r"^import time:\s+\d+\s+\|\s+(?P<cumulative>\d+)\s+\| (?P<module>\S+)$", re.M)
+
+
+def measure(code: str) -> int:
+    """
+    Measure import time of code in fresh interpreter.
+
+    :param code: Code importing mfd_typing.
+    :return: Sum of cumulative import times (us) of top-level imports of mfd_typing and its dependencies.
+    """
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True).stderr
+    modules = ("mfd_typing", "netaddr", "generate_mac")
+    return sum(
+        int(match["cumulative"]) for match in _importtime_regex.finditer(output) if match["module"].startswith(modules)
+    )
+
+
+def main() -> None:
+    """Print median import time of scenarios."""
+    for name, code in SCENARIOS.items():
+        median = statistics.median(measure(code) for _ in range(REPEATS))
+        print(f"{name:<20}: {median / 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
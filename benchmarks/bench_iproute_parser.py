@@ -0,0 +1,55 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of loading `ip -json -details link show` output of host with 10k+ links, streamed vs loaded at once."""
+
+import json
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generators import generate_ip_links
+from mfd_typing.iproute_parser import iter_ip_links, link_to_interface_info
+
+LINK_COUNT = 20000
+REPEAT = 5
+
+
+def _measure(function) -> tuple[float, float]:
+    """
+    Run function, return best elapsed time in ms and peak of allocated memory in MiB.
+
+    Memory is measured in separate run, as tracing allocations slows down both variants several times.
+    """
+    elapsed = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        elapsed = min(elapsed, (time.perf_counter() - start) * 1e3)
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Print time and peak memory of counting interfaces from output file."""
+    with tempfile.NamedTemporaryFile("w+", suffix=".json") as file:
+        json.dump(generate_ip_links(LINK_COUNT), file)
+        file.flush()
+
+        def streamed() -> None:
+            file.seek(0)
+            sum(1 for _ in iter_ip_links(file))
+
+        def loaded() -> None:
+            file.seek(0)
+            sum(1 for _ in (link_to_interface_info(link) for link in json.load(file)))
+
+        for name, function in (("streamed", streamed), ("json.load", loaded)):
+            elapsed, peak = _measure(function)
+            print(f"{LINK_COUNT} links, {name:<9}: {elapsed:8.1f} ms, peak {peak:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Memory budget of interface inventory: profile of object graph and tracemalloc measurement."""
+
+from benchmarks.generators import generate_inventory
+from mfd_typing.memory_profiler import measure_allocations, profile
+
+INTERFACE_COUNT = 20000
+
+
+def main() -> None:
+    """Print per-interface cost and profile report of generated inventory."""
+    inventory, allocated, statistics = measure_allocations(lambda: generate_inventory(INTERFACE_COUNT))
+    report = profile(inventory)
+    print(f"{INTERFACE_COUNT} LinuxInterfaceInfo records")
+    print(f"tracemalloc: {allocated / INTERFACE_COUNT:8.1f} B per interface")
+    print(f"object graph: {report.total_bytes / INTERFACE_COUNT:7.1f} B per interface")
+    print(f"1M interfaces: ~{report.total_bytes / INTERFACE_COUNT * 1e6 / 2**20:.0f} MiB\n")
+    print(report.format(top=15))
+    print("\nbiggest allocation sites:")
+    for stat in statistics[:5]:
+        print(f"  {stat}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of NUMA locality map of host with thousands of PCI functions against reading sysfs per lookup."""
+
+import os
+import tempfile
+import time
+
+from mfd_typing import PCIAddress
+from mfd_typing.cpu_topology import CPUSet
+from mfd_typing.numa_locality import SYS_BUS_PCI_DEVICES, NUMALocalityMap, create_fake_pci_locality
+
+DEVICE_COUNT = 4096
+LOOKUPS_PER_DEVICE = 4
+MISSING_LOOKUPS = 1000
+
+
+def _read_locality(root: str, pci_address: PCIAddress) -> tuple[int, CPUSet]:
+    """Read locality of single device, as done before locality map."""
+    device_path = os.path.join(root, SYS_BUS_PCI_DEVICES, pci_address.lspci)
+    with open(os.path.join(device_path, "numa_node")) as file:
+        node = int(file.read())
+    with open(os.path.join(device_path, "local_cpulist")) as file:
+        return node, CPUSet.from_cpulist(file.read())
+
+
+def main() -> None:
+    """Print time of loading map and of repeated lookups, with map and with reads from sysfs."""
+    addresses = [PCIAddress(0, 0x18 + index // 256, index // 8 % 32, index % 8) for index in range(DEVICE_COUNT)]
+    node_cpus = [CPUSet.from_cpulist("0-63,128-191"), CPUSet.from_cpulist("64-127,192-255")]
+    with tempfile.TemporaryDirectory() as root:
+        for index, address in enumerate(addresses):
+            create_fake_pci_locality(root, address, index % 2, node_cpus[index % 2])
+        start = time.perf_counter()
+        locality_map = NUMALocalityMap(root)
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(LOOKUPS_PER_DEVICE):
+            for address in addresses:
+                locality_map.locality(address)
+        map_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(LOOKUPS_PER_DEVICE):
+            for address in addresses:
+                _read_locality(root, address)
+        sysfs_time = time.perf_counter() - start
+
+        missing = PCIAddress(1, 0, 0, 0)
+        start = time.perf_counter()
+        for _ in range(MISSING_LOOKUPS):
+            try:
+                locality_map.locality(missing)
+            except KeyError:
+                pass
+        missing_time = time.perf_counter() - start
+
+    lookups = DEVICE_COUNT * LOOKUPS_PER_DEVICE
+    print(f"{DEVICE_COUNT} PCI devices, {lookups} lookups")
+    print(f"load map: {load_time * 1e3:.1f} ms")
+    print(f"lookup in map: {map_time / lookups * 1e9:.0f} ns, read from sysfs: {sysfs_time / lookups * 1e9:.0f} ns")
+    print(f"{MISSING_LOOKUPS} lookups of missing device: {missing_time * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of parallel ingestion of archived `ip -json` outputs with growing number of workers."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.generators import generate_ip_links
+from mfd_typing.parallel_ingest import ingest
+
+HOST_COUNT = 2000
+LINKS_PER_HOST = 64
+
+
+def main() -> None:
+    """
+    Print throughput and speedup of ingestion for 1 worker up to CPU count workers.
+
+    Pickled results are unpickled by parent process, which limits speedup; packed results are decoded lazily.
+    """
+    links = generate_ip_links(LINKS_PER_HOST)
+    line = json.dumps(links) + "\n"
+    cpu_count = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, "ip_links.jsonl")
+        path.write_text(line * HOST_COUNT)
+        size = path.stat().st_size
+        print(f"{HOST_COUNT * LINKS_PER_HOST} links, {size / 2**20:.1f} MiB, {cpu_count} CPUs")
+        print(f"{'results':>8} {'workers':>8} {'chunks':>8} {'MiB/s':>10} {'records/s':>12} {'speedup':>8}")
+        for packed in (False, True):
+            base = None
+            workers = 1
+            while workers <= cpu_count:
+                stats = ingest(path, "ip_json_lines", workers=workers, packed=packed).stats
+                base = base or stats.seconds
+                print(
+                    f"{'packed' if packed else 'pickled':>8} {workers:>8} {stats.chunks:>8} "
+                    f"{stats.bytes_per_second / 2**20:>10.1f} {stats.records_per_second:>12.0f} "
+                    f"{base / stats.seconds:>8.2f}"
+                )
+                workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of filtering and generating PCI addresses with PCIAddressRange against field comparisons and loops."""
+
+import random
+import statistics
+import time
+from typing import Callable
+
+from mfd_typing import PCIAddress
+from mfd_typing.pci_address_range import PCIAddressRange
+
+ADDRESSES = 100000
+REPEAT = 5
+
+
+def _best_time(function: Callable[[], list]) -> tuple[float, list]:
+    """Run function REPEAT times, return the best time and result."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def _round_times(*functions: Callable[[], list]) -> tuple[list[list[float]], list[list]]:
+    """Run functions interleaved REPEAT times, so they're compared under the same load, return times of rounds."""
+    times = [[] for _ in functions]
+    results = [None] * len(functions)
+    for _ in range(REPEAT):
+        for index, function in enumerate(functions):
+            start = time.perf_counter()
+            results[index] = function()
+            times[index].append(time.perf_counter() - start)
+    return times, results
+
+
+def main() -> None:
+    """Print time of filtering addresses by range of slots and of iterating addresses of bus."""
+    generator = random.Random(0)
+    addresses = [
+        PCIAddress(generator.randrange(2), generator.randrange(256), generator.randrange(32), generator.randrange(8))
+        for _ in range(ADDRESSES)
+    ]
+    address_range = PCIAddressRange.parse("0001:*:00-04.*")
+
+    def in_slots(address: PCIAddress) -> bool:
+        return address.domain == 1 and 0 <= address.slot <= 4
+
+    times, (inlined, compared, contained, filtered) = _round_times(
+        lambda: [address for address in addresses if address.domain == 1 and 0 <= address.slot <= 4],
+        lambda: [address for address in addresses if in_slots(address)],
+        lambda: [address for address in addresses if address in address_range],
+        lambda: address_range.filter(addresses),
+    )
+    inline_time, compare_time, range_time, filter_time = (min(function_times) for function_times in times)
+    assert contained == filtered == compared == inlined
+    # reusable check is compared, as `in` calls special method per address like in_slots call; median of ratios
+    # of the same rounds is robust to load changing between rounds
+    filter_ratio = statistics.median(filtered / compared for filtered, compared in zip(times[3], times[1]))
+    assert filter_ratio <= 1, f"filtering by range is slower than by field comparison: {filter_ratio:.2f}x"
+
+    boxes_range = PCIAddressRange.parse(
+        ",".join(f"{domain:04x}:{bus:02x}:00-04.*" for domain in (0, 1) for bus in range(16))
+    )
+    boxes_range_time, boxes_contained = _best_time(lambda: [address for address in addresses if address in boxes_range])
+    boxes_filter_time, boxes_filtered = _best_time(lambda: boxes_range.filter(addresses))
+    assert (
+        boxes_contained
+        == boxes_filtered
+        == [address for address in addresses if address.bus < 16 and address.slot <= 4]
+    )
+
+    bus_range = PCIAddressRange.parse("0000:3b:*.*")
+    iterate_time, bus_addresses = _best_time(lambda: list(bus_range))
+    construct_time, constructed = _best_time(
+        lambda: [PCIAddress(0, 0x3B, slot, func) for slot in range(32) for func in range(8)]
+    )
+    assert constructed == bus_addresses
+
+    print(f"filter by comparing fields inline: {inline_time / ADDRESSES * 1e6:.2f} us per address")
+    print(f"filter by comparing fields in function: {compare_time / ADDRESSES * 1e6:.2f} us per address")
+    print(f"filter by `in` range: {range_time / ADDRESSES * 1e6:.2f} us per address")
+    print(
+        f"filter by range.filter(): {filter_time / ADDRESSES * 1e6:.2f} us per address ({filter_ratio:.2f}x function)"
+    )
+    print(
+        f"range of 32 boxes, `in`: {boxes_range_time / ADDRESSES * 1e6:.2f} us, "
+        f"filter(): {boxes_filter_time / ADDRESSES * 1e6:.2f} us per address"
+    )
+    print(f"iterate {len(bus_addresses)} addresses of bus: {iterate_time * 1e6:.0f} us")
+    print(f"construct them in nested loops: {construct_time * 1e6:.0f} us ({construct_time / iterate_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
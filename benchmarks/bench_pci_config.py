@@ -0,0 +1,53 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of decoding PCIDevice of many devices from config space against building it from text IDs."""
+
+import struct
+import time
+
+from mfd_typing import PCIDevice
+from mfd_typing.pci_config import PCIConfigSpace, decode_headers
+
+DEVICES = 10000
+DEVICE_IDS = (0x1592, 0x1593, 0x159B, 0x1889)
+
+
+def _config(index: int) -> bytes:
+    """Config space of endpoint with PCI Express capability and SR-IOV extended capability."""
+    config = bytearray(4096)
+    struct.pack_into("<HHHHI", config, 0, 0x8086, DEVICE_IDS[index % len(DEVICE_IDS)], 0x0406, 0x10, 0x020000 << 8 | 2)
+    struct.pack_into("<HH", config, 0x2C, 0x8086, index % 4)
+    config[0x34] = 0x40
+    config[0x40], config[0x41] = 0x10, 0
+    struct.pack_into("<I", config, 0x100, 0x0010 | 1 << 16)
+    return bytes(config)
+
+
+def main() -> None:
+    """Print time of bulk header decoding, text construction and capability lookup per device."""
+    configs = [_config(index) for index in range(DEVICES)]
+    texts = [
+        f"{config[1]:02x}{config[0]:02x}:{config[3]:02x}{config[2]:02x}:8086:{config[0x2E]:04x}" for config in configs
+    ]
+
+    start = time.perf_counter()
+    headers = decode_headers(configs)
+    decode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    devices = [PCIDevice(data=text) for text in texts]
+    text_time = time.perf_counter() - start
+    assert [header.pci_device for header in headers] == devices
+
+    start = time.perf_counter()
+    for config in configs:
+        PCIConfigSpace(config).find_extended_capability(0x0010)
+    capability_time = time.perf_counter() - start
+
+    print(f"decode_headers: {decode_time / DEVICES * 1e6:.2f} us per device")
+    print(f"PCIDevice from text: {text_time / DEVICES * 1e6:.2f} us per device ({text_time / decode_time:.0f}x)")
+    print(f"find SR-IOV extended capability: {capability_time / DEVICES * 1e6:.2f} us per device")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of parsing captured Win32_NetworkAdapter outputs of host with hundreds of adapters."""
+
+import json
+import time
+from pathlib import Path
+
+from mfd_typing.powershell_parser import parse_format_list, parse_csv, parse_json
+
+DATA_PATH = Path(__file__).parent / "data"
+REPEAT = 200  # captured outputs contain 3 adapters each
+
+
+def _replicate_format_list(output: str) -> str:
+    return "\n".join([output.strip() + "\n"] * REPEAT)
+
+
+def _replicate_csv(output: str) -> str:
+    type_line, header, *rows = output.strip().splitlines()
+    return "\n".join([type_line, header] + rows * REPEAT)
+
+
+def _replicate_json(output: str) -> str:
+    return json.dumps(json.loads(output) * REPEAT, indent=4)
+
+
+def main() -> None:
+    """Print time of parsing each output format."""
+    outputs = {
+        "Format-List": (
+            _replicate_format_list((DATA_PATH / "win32_networkadapter_format_list.txt").read_text()),
+            parse_format_list,
+        ),
+        "ConvertTo-Csv": (_replicate_csv((DATA_PATH / "win32_networkadapter.csv").read_text()), parse_csv),
+        "ConvertTo-Json": (_replicate_json((DATA_PATH / "win32_networkadapter.json").read_text()), parse_json),
+    }
+    for name, (output, parse) in outputs.items():
+        start = time.perf_counter()
+        interfaces = list(parse(output))
+        elapsed = (time.perf_counter() - start) * 1e3
+        print(f"{name:<16} {len(interfaces):>6} adapters {elapsed:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of passing inventory to process pool workers by pickling against shared memory."""
+
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+from benchmarks.generators import generate_inventory
+from mfd_typing.shared_inventory import SharedInventory
+
+INTERFACE_COUNT = 100000
+WORKER_COUNT = 4
+
+
+def _measure(statement: Callable[[], object]) -> tuple[float, object]:
+    """Return time of single call in milliseconds and its result."""
+    start = time.perf_counter()
+    result = statement()
+    return (time.perf_counter() - start) * 1e3, result
+
+
+def _count_vfs(inventory: list | SharedInventory, worker: int) -> int:
+    """Count VFs in slice of inventory handled by worker."""
+    part = len(inventory) // WORKER_COUNT
+    return sum(interface.vsi_info.is_vf for interface in inventory[worker * part : (worker + 1) * part])
+
+
+def main() -> None:
+    """Print pickle size and time of inventory sent to workers by pickle and through shared memory."""
+    inventory = generate_inventory(INTERFACE_COUNT)
+
+    dumps_time, data = _measure(lambda: pickle.dumps(inventory))
+    loads_time, _ = _measure(lambda: pickle.loads(data))
+    create_time, shared = _measure(lambda: SharedInventory.create(inventory))
+    attach_time, attached = _measure(lambda: SharedInventory.attach(shared.name))
+    attached.close()
+    block_size = shared.block_size
+    with ProcessPoolExecutor(WORKER_COUNT) as pool:
+        list(pool.map(int, range(WORKER_COUNT)))  # start workers outside of measurement
+        pickled_time, _ = _measure(lambda: list(pool.map(_count_vfs, [inventory] * WORKER_COUNT, range(WORKER_COUNT))))
+        shared_time, _ = _measure(lambda: list(pool.map(_count_vfs, [shared] * WORKER_COUNT, range(WORKER_COUNT))))
+    shared.close()
+    shared.unlink()
+
+    print(f"{INTERFACE_COUNT} LinuxInterfaceInfo records, {WORKER_COUNT} workers")
+    print(f"pickle: {len(data)} B, dumps {dumps_time:.1f} ms, loads {loads_time:.1f} ms")
+    print(f"shared memory: {block_size} B, create {create_time:.1f} ms, attach {attach_time:.3f} ms")
+    print(f"workers reading their slice: pickled inventory {pickled_time:.1f} ms, shared memory {shared_time:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of memory footprint per instance of info dataclasses and their slotted variants."""
+
+import tracemalloc
+from dataclasses import MISSING, fields
+from typing import Callable
+
+from mfd_typing.driver_info import DriverInfo, SlottedDriverInfo
+from mfd_typing.network_interface import (
+    ClusterInfo,
+    InterfaceInfo,
+    LinuxInterfaceInfo,
+    SlottedClusterInfo,
+    SlottedInterfaceInfo,
+    SlottedLinuxInterfaceInfo,
+    SlottedVlanInterfaceInfo,
+    SlottedVsiInfo,
+    SlottedWindowsInterfaceInfo,
+    VlanInterfaceInfo,
+    VsiInfo,
+    WindowsInterfaceInfo,
+)
+from mfd_typing.os_values import SlottedSystemInfo, SystemInfo
+
+INSTANCE_COUNT = 10000
+CLASSES = [
+    (InterfaceInfo, SlottedInterfaceInfo),
+    (LinuxInterfaceInfo, SlottedLinuxInterfaceInfo),
+    (WindowsInterfaceInfo, SlottedWindowsInterfaceInfo),
+    (VsiInfo, SlottedVsiInfo),
+    (VlanInterfaceInfo, SlottedVlanInterfaceInfo),
+    (ClusterInfo, SlottedClusterInfo),
+    (SystemInfo, SlottedSystemInfo),
+    (DriverInfo, SlottedDriverInfo),
+]
+
+
+def _bytes_per_instance(factory: Callable[[], object]) -> float:
+    """Measure memory allocated per instance with tracemalloc."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [factory() for _ in range(INSTANCE_COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del instances
+    return allocated / INSTANCE_COUNT
+
+
+def main() -> None:
+    """Print bytes per instance of each info dataclass and of its slotted variant."""
+    print(f"{'class':<24} {'__dict__ [B]':>14} {'__slots__ [B]':>14}")
+    for cls, slotted in CLASSES:
+        required = [0 for f in fields(cls) if f.default is MISSING]
+        dict_size = _bytes_per_instance(lambda: cls(*required))
+        slots_size = _bytes_per_instance(lambda: slotted(*required))
+        print(f"{cls.__name__:<24} {dict_size:>14.1f} {slots_size:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of calculating addresses of VFs against reading `virtfn*` links of PF in sysfs."""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from mfd_typing import PCIAddress
+from mfd_typing.sriov import VFAddressMap, vf_addresses
+
+PFS = 8
+VFS_PER_PF = 256
+FIRST_VF_OFFSET = 0x100
+VF_STRIDE = 1
+
+
+def _create_virtfn_links(root: Path, pf_address: PCIAddress, vfs: list[PCIAddress]) -> Path:
+    pf_path = root / pf_address.lspci
+    pf_path.mkdir()
+    for index, vf_address in enumerate(vfs):
+        os.symlink(f"../{vf_address.lspci}", pf_path / f"virtfn{index}")
+    return pf_path
+
+
+def _read_virtfn_links(pf_path: Path) -> list[PCIAddress]:
+    links = sorted((entry for entry in os.listdir(pf_path) if entry.startswith("virtfn")), key=lambda e: int(e[6:]))
+    return [PCIAddress(data=os.path.basename(os.readlink(pf_path / link))) for link in links]
+
+
+def main() -> None:
+    """Print time of getting VF addresses per PF and of reverse lookups."""
+    pfs = [PCIAddress(0, 0x18 + pf * 2, 0, 0) for pf in range(PFS)]
+    with tempfile.TemporaryDirectory() as root:
+        pf_paths = [
+            _create_virtfn_links(Path(root), pf, vf_addresses(pf, FIRST_VF_OFFSET, VF_STRIDE, VFS_PER_PF)) for pf in pfs
+        ]
+        start = time.perf_counter()
+        linked = [_read_virtfn_links(pf_path) for pf_path in pf_paths]
+        links_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calculated = [vf_addresses(pf, FIRST_VF_OFFSET, VF_STRIDE, VFS_PER_PF) for pf in pfs]
+    calculate_time = time.perf_counter() - start
+    assert calculated == linked
+
+    start = time.perf_counter()
+    for pf in pfs:
+        vf_addresses(pf, FIRST_VF_OFFSET, VF_STRIDE, VFS_PER_PF, packed=True)
+    packed_time = time.perf_counter() - start
+
+    vf_map = VFAddressMap()
+    for pf in pfs:
+        vf_map.add(pf, FIRST_VF_OFFSET, VF_STRIDE, VFS_PER_PF)
+    vfs = [vf for pf_vfs in calculated for vf in pf_vfs]
+    start = time.perf_counter()
+    for vf in vfs:
+        vf_map.pf_of(vf)
+    lookup_time = time.perf_counter() - start
+
+    print(f"{PFS} PFs with {VFS_PER_PF} VFs (local sysfs, remote shell adds round trip per read)")
+    print(f"read virtfn links: {links_time / PFS * 1e3:.2f} ms per PF")
+    print(f"calculate PCIAddress list: {calculate_time / PFS * 1e3:.3f} ms per PF ({links_time / calculate_time:.0f}x)")
+    print(f"calculate packed array: {packed_time / PFS * 1e3:.3f} ms per PF")
+    print(f"reverse lookup of PF: {lookup_time / len(vfs) * 1e6:.2f} us per VF")
+
+
+if __name__ == "__main__":
+    main()
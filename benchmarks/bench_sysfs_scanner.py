@@ -0,0 +1,52 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of scanning fake sysfs tree of host with thousands of VFs."""
+
+import tempfile
+import time
+
+from mfd_typing import PCIAddress, PCIDevice
+from mfd_typing.sysfs_scanner import create_fake_sysfs_interface, scan_interfaces
+
+PF_COUNT = 8
+VFS_PER_PF = 256
+
+
+def _create_tree(root: str) -> int:
+    """Create fake sysfs with PFs and their VFs, return number of interfaces."""
+    count = 0
+    for pf_index in range(PF_COUNT):
+        pf_address = PCIAddress(0, 0x18 + pf_index, 0, 0)
+        create_fake_sysfs_interface(
+            root,
+            f"eth{pf_index}",
+            mac_address=f"6c:fe:54:40:{pf_index:02x}:00",
+            pci_address=pf_address,
+            pci_device=PCIDevice(0x8086, 0x1592, 0x8086, 0x0002),
+        )
+        for vf_index in range(VFS_PER_PF):
+            create_fake_sysfs_interface(
+                root,
+                f"eth{pf_index}v{vf_index}",
+                mac_address=f"6c:fe:54:{pf_index:02x}:{vf_index >> 8:02x}:{vf_index & 0xFF:02x}",
+                pci_address=PCIAddress(0, 0x80 + pf_index, vf_index // 8, vf_index % 8),
+                pci_device=PCIDevice(0x8086, 0x1889, 0x8086, 0x0000),
+                physfn=pf_address,
+            )
+        count += VFS_PER_PF + 1
+    return count
+
+
+def main() -> None:
+    """Print time of scanning fake sysfs with different number of threads."""
+    with tempfile.TemporaryDirectory() as root:
+        count = _create_tree(root)
+        for max_workers in (1, 4, 16):
+            start = time.perf_counter()
+            interfaces = scan_interfaces(root, max_workers=max_workers)
+            elapsed = (time.perf_counter() - start) * 1e3
+            print(f"{len(interfaces)}/{count} interfaces, {max_workers:>2} threads: {elapsed:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of binary wire format against JSON Lines for interface inventories."""
+
+import io
+import time
+from typing import Callable
+
+from benchmarks.generators import generate_inventory
+from mfd_typing.network_interface import LinuxInterfaceInfo
+from mfd_typing.serialization import dump_jsonl, iter_jsonl
+from mfd_typing.wire_format import encode_records, decode_records
+
+INTERFACE_COUNT = 10000
+REPEAT = 5
+
+
+def _measure(statement: Callable[[], object]) -> tuple[float, object]:
+    """Run statement REPEAT times, return the best time in milliseconds and result."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = statement()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3, result
+
+
+def _dump_json(inventory: list) -> str:
+    stream = io.StringIO()
+    dump_jsonl(inventory, stream, compact=True)
+    return stream.getvalue()
+
+
+def main() -> None:
+    """Print size, encode and decode time of inventory in JSON Lines and wire format."""
+    inventory = generate_inventory(INTERFACE_COUNT)
+
+    json_encode_time, json_data = _measure(lambda: _dump_json(inventory))
+    json_decode_time, _ = _measure(lambda: list(iter_jsonl(io.StringIO(json_data), LinuxInterfaceInfo, compact=True)))
+    wire_encode_time, wire_data = _measure(lambda: encode_records(inventory))
+    wire_decode_time, _ = _measure(lambda: list(decode_records(wire_data)))
+    wire_open_time, table = _measure(lambda: decode_records(wire_data))
+    wire_single_time, _ = _measure(lambda: table[INTERFACE_COUNT // 2])
+
+    print(f"{INTERFACE_COUNT} LinuxInterfaceInfo records, best of {REPEAT} runs")
+    print(f"{'format':<24} {'size [B]':>10} {'encode [ms]':>12} {'decode [ms]':>12}")
+    for name, size, encode_time, decode_time in (
+        ("JSON Lines (compact)", len(json_data.encode()), json_encode_time, json_decode_time),
+        ("wire format", len(wire_data), wire_encode_time, wire_decode_time),
+    ):
+        print(f"{name:<24} {size:>10} {encode_time:>12.1f} {decode_time:>12.1f}")
+    print(f"wire format open: {wire_open_time:.3f} ms, single record access: {wire_single_time:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Synthetic fleet-sized data generators for benchmarks, deterministic for given count."""
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.network_interface import InterfaceType, LinuxInterfaceInfo, VsiInfo
+
+
+def generate_pci_address_strings(count: int) -> list[str]:
+    """Generate PCI Addresses in `domain:bus:slot.func` form, spread over domains and buses."""
+    return [
+        f"{index >> 16 & 0xFFFF:04x}:{index >> 8 & 0xFF:02x}:{index >> 3 & 0x1F:02x}.{index & 0x7:x}"
+        for index in range(count)
+    ]
+
+
+def generate_pci_device_strings(count: int) -> list[str]:
+    """Generate PCI device IDs in `vendor:device:sub_vendor:sub_device` form."""
+    return [f"8086:{0x1500 + index % 0x400:04x}:8086:{index % 0x10:04x}" for index in range(count)]
+
+
+def generate_mac_strings(count: int) -> list[str]:
+    """Generate MAC Addresses in unix expanded form."""
+    return [":".join(f"{byte:02x}" for byte in (0x001B77000000 + index).to_bytes(6, "big")) for index in range(count)]
+
+
+def generate_inventory(count: int) -> list[LinuxInterfaceInfo]:
+    """Generate VF-heavy inventory of given size."""
+    return [
+        LinuxInterfaceInfo(
+            pci_address=PCIAddress(0, 0x18 + index // 2048, index // 8 % 256, index % 8),
+            pci_device=PCIDevice(0x8086, 0x1889, 0x8086, 0x0000),
+            name=f"eth{index}",
+            interface_type=InterfaceType.VF,
+            mac_address=MACAddress(0x001B77000000 + index),
+            installed=True,
+            namespace=f"ns{index % 16}",
+            vsi_info=VsiInfo(
+                fn_id=index, host_id=4, is_vf=True, vsi_id=index, vport_id=index, is_created=True, is_enabled=True
+            ),
+        )
+        for index in range(count)
+    ]
+
+
+def generate_ip_links(count: int) -> list[dict]:
+    """Generate VLAN links on top of PCI PFs."""
+    links = []
+    for index in range(count):
+        link = {
+            "ifindex": index + 1,
+            "ifname": f"eth{index}",
+            "flags": ["BROADCAST", "MULTICAST", "UP", "LOWER_UP"],
+            "mtu": 1500,
+            "qdisc": "mq",
+            "operstate": "UP",
+            "link_type": "ether",
+            "address": f"6c:fe:54:{index >> 16 & 0xFF:02x}:{index >> 8 & 0xFF:02x}:{index & 0xFF:02x}",
+            "broadcast": "ff:ff:ff:ff:ff:ff",
+            "num_tx_queues": 64,
+            "num_rx_queues": 64,
+        }
+        if index % 2:
+            link["link"] = f"eth{index - 1}"
+            link["linkinfo"] = {"info_kind": "vlan", "info_data": {"protocol": "802.1Q", "id": index % 4094 + 1}}
+        else:
+            link["parentbus"] = "pci"
+            link["parentdev"] = f"0000:{index >> 8 & 0xFF:02x}:{index >> 3 & 0x1F:02x}.{index & 0x7}"
+        links.append(link)
+    return links
@@ -0,0 +1,303 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Benchmark suite of mfd_typing hot paths with JSON results and regression gating.
+
+Run suite and store results:
+    python -m benchmarks.suite run --output results.json
+Compare results with stored baseline, exit code is 1 when any benchmark is slower than threshold:
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.15
+"""
+
+import argparse
+import json
+import pickle
+import platform
+import statistics
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from ipaddress import IPv6Address
+from typing import Callable
+
+from benchmarks.generators import (
+    generate_inventory,
+    generate_mac_strings,
+    generate_pci_address_strings,
+    generate_pci_device_strings,
+)
+from mfd_typing import DeviceID, MACAddress, PCIAddress, PCIDevice, VendorID
+from mfd_typing import utils
+from mfd_typing.dataclass_utils import convert_fields_to_typehint_types, get_conversion_plan
+from mfd_typing.mac_address import parse_mac
+
+DEFAULT_SIZE = 10000
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.1
+
+# name: factory building benchmarked function for data size, factory prepares data outside of measurement
+benchmarks: dict[str, Callable[[int], Callable[[], object]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """Register benchmark factory under name."""
+
+    def register(factory: Callable[[int], Callable[[], object]]) -> Callable[[int], Callable[[], object]]:
+        benchmarks[name] = factory
+        return factory
+
+    return register
+
+
+def _each(function: Callable[[object], object], items: list) -> Callable[[], object]:
+    return lambda: [function(item) for item in items]
+
+
+@benchmark("pci_address.parse_string")
+def _pci_address_parse(size: int) -> Callable[[], object]:
+    return _each(lambda data: PCIAddress(data=data), generate_pci_address_strings(size))
+
+
+@benchmark("pci_address.from_ints")
+def _pci_address_ints(size: int) -> Callable[[], object]:
+    return _each(
+        lambda values: PCIAddress(*values),
+        [(0, index >> 8 & 0xFF, index >> 3 & 0x1F, index & 7) for index in range(size)],
+    )
+
+
+@benchmark("pci_address.format")
+def _pci_address_format(size: int) -> Callable[[], object]:
+    addresses = [PCIAddress(data=data) for data in generate_pci_address_strings(size)]
+    return _each(
+        lambda address: (address.lspci, address.lspci_short, address.sbdf, address.pciconf, str(address)), addresses
+    )
+
+
+@benchmark("pci_address.sort")
+def _pci_address_sort(size: int) -> Callable[[], object]:
+    addresses = [PCIAddress(data=data) for data in reversed(generate_pci_address_strings(size))]
+    return lambda: sorted(addresses)
+
+
+@benchmark("pci_device.parse_string")
+def _pci_device_parse(size: int) -> Callable[[], object]:
+    return _each(lambda data: PCIDevice(data=data), generate_pci_device_strings(size))
+
+
+@benchmark("pci_device.from_ints")
+def _pci_device_ints(size: int) -> Callable[[], object]:
+    return _each(
+        lambda device_id: PCIDevice(0x8086, device_id, 0x8086, 0), [0x1500 + index % 0x400 for index in range(size)]
+    )
+
+
+@benchmark("vendor_device_id.construct")
+def _vendor_device_id(size: int) -> Callable[[], object]:
+    values = [f"{index % 0x10000:04x}" for index in range(size)]
+    return _each(lambda value: (VendorID(value), DeviceID(value)), values)
+
+
+@benchmark("mac_address.parse_string")
+def _mac_address_parse(size: int) -> Callable[[], object]:
+    return _each(MACAddress, generate_mac_strings(size))
+
+
+@benchmark("mac_address.from_int")
+def _mac_address_int(size: int) -> Callable[[], object]:
+    return _each(MACAddress, [0x001B77000000 + index for index in range(size)])
+
+
+@benchmark("mac_address.format")
+def _mac_address_format(size: int) -> Callable[[], object]:
+    addresses = [MACAddress(mac) for mac in generate_mac_strings(size)]
+    return _each(lambda address: (str(address), parse_mac(address)), addresses)
+
+
+@benchmark("utils.format_mac_string_to_canonical")
+def _format_mac(size: int) -> Callable[[], object]:
+    return _each(
+        utils.format_mac_string_to_canonical, [mac.replace(":", "-").upper() for mac in generate_mac_strings(size)]
+    )
+
+
+@benchmark("utils.convert_mac_string_to_hex")
+def _mac_to_hex(size: int) -> Callable[[], object]:
+    return _each(utils.convert_mac_string_to_hex, generate_mac_strings(size))
+
+
+@benchmark("utils.decimal_to_hex_bin")
+def _decimal_to(size: int) -> Callable[[], object]:
+    return _each(lambda value: (utils.decimal_to_hex(value), utils.decimal_to_bin(value)), list(range(size)))
+
+
+@benchmark("utils.convert_port_dc_to_port_hex")
+def _port_to_hex(size: int) -> Callable[[], object]:
+    return _each(utils.convert_port_dc_to_port_hex, [index % 65536 for index in range(size)])
+
+
+@benchmark("utils.convert_ip_dc_to_hex_value")
+def _ip_to_hex(size: int) -> Callable[[], object]:
+    return _each(utils.convert_ip_dc_to_hex_value, [IPv6Address(0x20010DB8 << 96 | index) for index in range(size)])
+
+
+@benchmark("utils.compare_non_conforming_versions")
+def _compare_versions(size: int) -> Callable[[], object]:
+    versions = [(f"1.{index % 100}.{index}", f"1.{index % 100}.{index + 1}") for index in range(size)]
+    return _each(lambda pair: utils.compare_non_conforming_versions(*pair), versions)
+
+
+@benchmark("utils.strtobool")
+def _strtobool(size: int) -> Callable[[], object]:
+    values = ["yes", "No", "TRUE", "off", "1", "0"]
+    return _each(utils.strtobool, [values[index % len(values)] for index in range(size)])
+
+
+@benchmark("utils.prepare_sed_string")
+def _prepare_sed_string(size: int) -> Callable[[], object]:
+    lines = [f'"option_{index}": "value.{index}/[x]*"' for index in range(size)]
+    return _each(lambda line: utils.prepare_sed_string(line, r"$.*/[\]^"), lines)
+
+
+@benchmark("dataclass_utils.convert_fields_to_typehint_types")
+def _convert_fields(size: int) -> Callable[[], object]:
+    devices = [PCIDevice(0x8086, 0x1500 + index % 0x400) for index in range(size)]
+    return _each(convert_fields_to_typehint_types, devices)
+
+
+@benchmark("dataclass_utils.get_conversion_plan")
+def _conversion_plan(size: int) -> Callable[[], object]:
+    return _each(get_conversion_plan, [PCIDevice, PCIAddress] * (size // 2))
+
+
+@benchmark("network_interface.construct")
+def _interface_info(size: int) -> Callable[[], object]:
+    return lambda: generate_inventory(size)
+
+
+@benchmark("network_interface.compare")
+def _interface_info_compare(size: int) -> Callable[[], object]:
+    first, second = generate_inventory(size), generate_inventory(size)
+    return lambda: sum(a == b for a, b in zip(first, second))
+
+
+@benchmark("network_interface.pickle")
+def _interface_info_pickle(size: int) -> Callable[[], object]:
+    inventory = generate_inventory(size)
+    return lambda: pickle.loads(pickle.dumps(inventory))
+
+
+def _calibrate(repeat: int) -> float:
+    """Time of fixed pure-Python workload, used to compensate speed differences of machines and runs."""
+    return min(timeit.repeat(lambda: sorted(str(value) for value in range(20000)), number=1, repeat=repeat))
+
+
+def run(size: int = DEFAULT_SIZE, repeat: int = DEFAULT_REPEAT, name_filter: str = "") -> dict:
+    """
+    Run benchmarks.
+
+    :param size: Number of items processed by single run of benchmark.
+    :param repeat: Number of runs of every benchmark.
+    :param name_filter: Run only benchmarks which names contain it.
+    :return: Results with metadata, in JSON-serializable form.
+    """
+    calibration = _calibrate(repeat)
+    results = {}
+    for name, factory in benchmarks.items():
+        if name_filter not in name:
+            continue
+        function = factory(size)
+        function()  # warm up caches, e.g. lru_cache of conversion plans
+        times = timeit.repeat(function, number=1, repeat=repeat)
+        results[name] = {
+            "min_s": min(times),
+            "median_s": statistics.median(times),
+            "per_item_ns": min(times) / size * 1e9,  # minimum is the least affected by noise
+        }
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "size": size,
+            "repeat": repeat,
+            "calibration_s": calibration,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD, normalize: bool = True
+) -> list[tuple[str, float, float, float]]:
+    """
+    Compare results with baseline, using best time per item.
+
+    :param baseline: Stored results.
+    :param current: New results.
+    :param threshold: Allowed relative slowdown, e.g. 0.1 for 10%.
+    :param normalize: Whether times should be scaled by ratio of calibration times, so results from machines
+                      (or runs) of different speed can be compared.
+    :return: Regressions as (name, baseline ns per item, current ns per item, relative change).
+    """
+    scale = 1.0
+    if normalize and "calibration_s" in baseline["meta"] and "calibration_s" in current["meta"]:
+        scale = baseline["meta"]["calibration_s"] / current["meta"]["calibration_s"]
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        change = result["per_item_ns"] * scale / base["per_item_ns"] - 1
+        if change > threshold:
+            regressions.append((name, base["per_item_ns"], result["per_item_ns"], change))
+    return regressions
+
+
+def _print_results(results: dict) -> None:
+    for name, result in results["results"].items():
+        print(f"{name:<52} {result['per_item_ns']:>12.1f} ns/item")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run `run` or `compare` command, return exit code."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="number of items per run")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="number of runs")
+    run_parser.add_argument("--filter", default="", help="run benchmarks which names contain it")
+    run_parser.add_argument("--output", help="JSON file to store results in")
+    compare_parser = commands.add_parser("compare", help="compare results with baseline")
+    compare_parser.add_argument("baseline", help="JSON file with baseline results")
+    compare_parser.add_argument("current", help="JSON file with current results")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown")
+    compare_parser.add_argument(
+        "--no-normalize", action="store_true", help="don't scale times by calibration of machine speed"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        start = time.perf_counter()
+        results = run(args.size, args.repeat, args.filter)
+        _print_results(results)
+        print(f"{len(results['results'])} benchmarks in {time.perf_counter() - start:.1f} s")
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(results, file, indent=2)
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.threshold, normalize=not args.no_normalize)
+    for name, base, new, change in regressions:
+        print(f"REGRESSION {name:<52} {base:>10.1f} -> {new:>10.1f} ns/item ({change:+.1%})")
+    print(f"{len(regressions)} regressions over {args.threshold:.0%} threshold")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,47 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-"""Module for structures, types in MFD."""
+"""
+Module for structures, types in MFD.
 
-from .os_values import OSName, OSType, OSBitness
-from .mac_address import MACAddress
-from .pci_address import PCIAddress
-from .vendor_device_id import VendorID, SubVendorID, DeviceID, SubDeviceID
-from .pci_device import PCIDevice
+Exported names are imported lazily on first access (PEP 562), so e.g. `from mfd_typing import PCIAddress`
+doesn't load `netaddr` and `generate_mac` needed only by MACAddress.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .os_values import OSName, OSType, OSBitness
+    from .mac_address import MACAddress
+    from .pci_address import PCIAddress
+    from .vendor_device_id import VendorID, SubVendorID, DeviceID, SubDeviceID
+    from .pci_device import PCIDevice
+
+# exported name: submodule defining it
+_lazy_attributes = {
+    "OSName": ".os_values",
+    "OSType": ".os_values",
+    "OSBitness": ".os_values",
+    "MACAddress": ".mac_address",
+    "PCIAddress": ".pci_address",
+    "VendorID": ".vendor_device_id",
+    "SubVendorID": ".vendor_device_id",
+    "DeviceID": ".vendor_device_id",
+    "SubDeviceID": ".vendor_device_id",
+    "PCIDevice": ".pci_device",
+}
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # next accesses don't call __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_attributes))
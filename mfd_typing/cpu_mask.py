@@ -0,0 +1,216 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for converting sets of CPUs between cpulist, kernel hex mask, integer and CPU numbers.
+
+Integer bitmask (bit N set for CPU N) is the pivot form, conversions are big-int bit operations done per range
+or per 32-bit group, not per CPU:
+
+* cpulist as in `/sys/devices/system/cpu/online`: `0-15,64-79`,
+* hex mask as in `/proc/irq/<irq>/smp_affinity` or `xps_cpus`: comma-separated 32-bit groups, `0000ffff,0000ffff`.
+
+Batch conversions convert every distinct value once, as most queues of a host share few distinct affinities.
+
+>>> hex_mask_to_cpulist(cpulist_to_hex_mask("0-15,64-79", cpu_count=96))
+'0-15,64-79'
+"""
+
+import re
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_GROUP_BITS = 32
+_GROUP_DIGITS = _GROUP_BITS // 4
+
+# mask as printed by kernel, every group but the first has all 8 digits, so digits can be parsed as a single number
+_full_groups_hex_mask = re.compile(r"[0-9a-fA-F]{1,8}(?:,[0-9a-fA-F]{8})*")
+
+
+def cpulist_to_int(cpulist: str) -> int:
+    """
+    Convert cpulist to bitmask.
+
+    :param cpulist: Comma-separated CPUs and ranges of CPUs (`0-3,8`), empty for no CPUs.
+    :return: Bitmask.
+    :raises ValueError: When cpulist is not correct.
+    """
+    mask = 0
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        first, separator, last = part.partition("-")
+        first = int(first)
+        last = int(last) if separator else first
+        if not 0 <= first <= last:
+            raise ValueError(f"Incorrect range in cpulist: {part}")
+        mask |= ((1 << (last - first + 1)) - 1) << first
+    return mask
+
+
+def int_to_cpulist(mask: int) -> str:
+    """
+    Convert bitmask to cpulist with minimal number of ranges.
+
+    :param mask: Bitmask.
+    :return: cpulist, e.g. `0-3,8`, empty for no CPUs.
+    """
+    parts = []
+    while mask:
+        first = (mask & -mask).bit_length() - 1
+        shifted = mask >> first
+        length = (~shifted & (shifted + 1)).bit_length() - 1  # length of run of ones, from lowest zero bit above it
+        parts.append(str(first) if length == 1 else f"{first}-{first + length - 1}")
+        mask = shifted >> length << (first + length)
+    return ",".join(parts)
+
+
+def hex_mask_to_int(hex_mask: str) -> int:
+    """
+    Convert kernel hex mask to bitmask.
+
+    Every comma-separated group is 32 bits wide, also when written with less digits (as accepted by kernel).
+
+    :param hex_mask: Hex mask, e.g. `ff,0000ffff`, with optional `0x` prefix.
+    :return: Bitmask.
+    :raises ValueError: When hex mask is not correct.
+    """
+    hex_mask = hex_mask.strip()
+    if hex_mask[:2].lower() == "0x":
+        hex_mask = hex_mask[2:]
+    if _full_groups_hex_mask.fullmatch(hex_mask):
+        return int(hex_mask.replace(",", ""), 16)
+    mask = 0
+    for group in hex_mask.split(","):
+        if len(group) > _GROUP_DIGITS:
+            raise ValueError(f"Group of hex mask longer than 32 bits: {group}")
+        mask = mask << _GROUP_BITS | int(group, 16)
+    return mask
+
+
+def int_to_hex_mask(mask: int, cpu_count: int | None = None) -> str:
+    """
+    Convert bitmask to kernel hex mask, comma-separated 32-bit groups.
+
+    :param mask: Bitmask.
+    :param cpu_count: Number of CPUs of host (`nr_cpu_ids`); mask is padded to its width like masks printed by kernel.
+                      Without it only groups needed for highest CPU are written.
+    :return: Hex mask, e.g. `000000ff,ffffffff`.
+    :raises ValueError: When mask contains CPUs above cpu_count.
+    """
+    bits = max(mask.bit_length(), 1)
+    if cpu_count is not None:
+        if bits > cpu_count and mask:
+            raise ValueError(f"Mask {mask:#x} contains CPUs above CPU count {cpu_count}")
+        bits = cpu_count
+    digits = (bits + 3) // 4
+    text = f"{mask:0{digits}x}"
+    first = len(text) % _GROUP_DIGITS or _GROUP_DIGITS
+    return ",".join([text[:first]] + [text[i : i + _GROUP_DIGITS] for i in range(first, len(text), _GROUP_DIGITS)])
+
+
+def cpus_to_int(cpus: Iterable[int]) -> int:
+    """
+    Convert CPU numbers to bitmask.
+
+    :param cpus: CPU numbers.
+    :return: Bitmask.
+    :raises ValueError: When CPU number is negative.
+    """
+    mask = 0
+    for cpu in cpus:
+        if cpu < 0:
+            raise ValueError(f"CPU number must not be negative, got {cpu}")
+        mask |= 1 << cpu
+    return mask
+
+
+def int_to_cpus(mask: int) -> list[int]:
+    """
+    Convert bitmask to sorted CPU numbers.
+
+    :param mask: Bitmask.
+    :return: CPU numbers.
+    """
+    bits = bin(mask)[:1:-1]  # binary digits from the lowest bit, scanned by C code instead of per-bit big-int shifts
+    return [cpu for cpu, bit in enumerate(bits) if bit == "1"]
+
+
+def cpulist_to_hex_mask(cpulist: str, cpu_count: int | None = None) -> str:
+    """Convert cpulist to kernel hex mask, see int_to_hex_mask."""
+    return int_to_hex_mask(cpulist_to_int(cpulist), cpu_count)
+
+
+def hex_mask_to_cpulist(hex_mask: str) -> str:
+    """Convert kernel hex mask to cpulist."""
+    return int_to_cpulist(hex_mask_to_int(hex_mask))
+
+
+def _convert_many(values: Iterable[T], convert: Callable[[T], R]) -> list[R]:
+    """Convert values keeping order, every distinct value is converted once."""
+    converted: dict[T, R] = {}
+    result = []
+    for value in values:
+        try:
+            result.append(converted[value])
+        except KeyError:
+            result.append(converted.setdefault(value, convert(value)))
+    return result
+
+
+def cpulists_to_hex_masks(cpulists: Iterable[str], cpu_count: int | None = None) -> list[str]:
+    """
+    Convert cpulists of many queues to kernel hex masks.
+
+    :param cpulists: cpulist of every queue.
+    :param cpu_count: Number of CPUs of host, see int_to_hex_mask.
+    :return: Hex masks in order of cpulists.
+    """
+    return _convert_many(cpulists, lambda cpulist: cpulist_to_hex_mask(cpulist, cpu_count))
+
+
+def hex_masks_to_cpulists(hex_masks: Iterable[str]) -> list[str]:
+    """
+    Convert kernel hex masks of many queues, e.g. read `smp_affinity` files, to cpulists.
+
+    :param hex_masks: Hex mask of every queue.
+    :return: cpulists in order of hex masks.
+    """
+    return _convert_many(hex_masks, hex_mask_to_cpulist)
+
+
+def ints_to_hex_masks(masks: Iterable[int], cpu_count: int | None = None) -> list[str]:
+    """
+    Convert bitmasks of many queues to kernel hex masks.
+
+    :param masks: Bitmask of every queue.
+    :param cpu_count: Number of CPUs of host, see int_to_hex_mask.
+    :return: Hex masks in order of bitmasks.
+    """
+    return _convert_many(masks, lambda mask: int_to_hex_mask(mask, cpu_count))
+
+
+def hex_masks_to_ints(hex_masks: Iterable[str]) -> list[int]:
+    """
+    Convert kernel hex masks of many queues to bitmasks.
+
+    :param hex_masks: Hex mask of every queue.
+    :return: Bitmasks in order of hex masks.
+    """
+    return _convert_many(hex_masks, hex_mask_to_int)
+
+
+def spread_cpus(cpus: int, queue_count: int) -> list[int]:
+    """
+    Assign CPUs to queues round-robin, e.g. one CPU per queue for `smp_affinity` of queue IRQs.
+
+    :param cpus: Bitmask of CPUs to use.
+    :param queue_count: Number of queues.
+    :return: Bitmask with single CPU for every queue.
+    :raises ValueError: When no CPUs are passed.
+    """
+    cpu_numbers = int_to_cpus(cpus)
+    if not cpu_numbers:
+        raise ValueError("No CPUs to spread queues on")
+    return [1 << cpu_numbers[queue % len(cpu_numbers)] for queue in range(queue_count)]
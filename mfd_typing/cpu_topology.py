@@ -0,0 +1,433 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for CPU topology: sockets, cores, SMT siblings, NUMA nodes and caches of logical CPUs.
+
+Topology is read from sysfs (`/sys/devices/system/cpu`, `/sys/devices/system/node`), or from `/proc/cpuinfo` when
+sysfs topology is not available. Root of file system is configurable, so topology of remote host copied locally,
+or fake tree created by create_fake_cpu_topology, can be read as well.
+
+Sets of CPUs are CPUSet bitsets (Python ints), per-CPU lookups are indexes into integer arrays.
+"""
+
+import os
+import re
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .cpu_mask import cpulist_to_int, cpus_to_int, hex_mask_to_int, int_to_cpulist, int_to_cpus, int_to_hex_mask
+from .sysfs_utils import read_sysfs, write_sysfs
+
+SYS_CPU = "sys/devices/system/cpu"
+SYS_NODE = "sys/devices/system/node"
+PROC_CPUINFO = "proc/cpuinfo"
+
+_node_directory = re.compile(r"node(\d+)")
+_cache_directory = re.compile(r"index(\d+)")
+_cache_size = re.compile(r"(\d+)([KMG]?)")
+_size_units = {"": 1, "K": 2**10, "M": 2**20, "G": 2**30}
+
+
+class CPUSet:
+    """
+    Immutable set of logical CPUs, stored as bitmask (bit N set for CPU N).
+
+    >>> CPUSet.from_cpulist("0-3,8") | CPUSet.from_cpus([4])
+    CPUSet('0-4,8')
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask: int = 0) -> None:
+        """
+        Initialize set.
+
+        :param mask: Bitmask of CPUs.
+        :raises ValueError: When mask is negative.
+        """
+        if mask < 0:
+            raise ValueError(f"CPU mask must not be negative, got {mask}")
+        object.__setattr__(self, "mask", mask)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def from_cpus(cls, cpus: Iterable[int]) -> "CPUSet":
+        """Create set from CPU numbers."""
+        return cls(cpus_to_int(cpus))
+
+    @classmethod
+    def from_cpulist(cls, cpulist: str) -> "CPUSet":
+        """
+        Create set from cpulist as used by sysfs, e.g. `0-3,8-11`.
+
+        :param cpulist: Comma-separated CPUs and ranges of CPUs, empty for no CPUs.
+        :return: Set of CPUs.
+        :raises ValueError: When cpulist is not correct.
+        """
+        return cls(cpulist_to_int(cpulist))
+
+    @classmethod
+    def from_hex_mask(cls, hex_mask: str) -> "CPUSet":
+        """
+        Create set from kernel hex mask as in `smp_affinity` or `xps_cpus`, e.g. `ff,0000ffff`.
+
+        :param hex_mask: Comma-separated 32-bit groups of hex digits.
+        :return: Set of CPUs.
+        :raises ValueError: When hex mask is not correct.
+        """
+        return cls(hex_mask_to_int(hex_mask))
+
+    @property
+    def cpulist(self) -> str:
+        """Set in cpulist form with minimal number of ranges, e.g. `0-3,8-11`."""
+        return int_to_cpulist(self.mask)
+
+    def hex_mask(self, cpu_count: int | None = None) -> str:
+        """
+        Get set in kernel hex mask form, e.g. `000000ff,ffffffff`.
+
+        :param cpu_count: Number of CPUs of host, mask is padded to its width like masks printed by kernel.
+        :return: Hex mask.
+        """
+        return int_to_hex_mask(self.mask, cpu_count)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(int_to_cpus(self.mask))
+
+    def __len__(self) -> int:
+        return bin(self.mask).count("1")
+
+    def __contains__(self, cpu: int) -> bool:
+        return cpu >= 0 and self.mask >> cpu & 1 == 1
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __or__(self, other: "CPUSet") -> "CPUSet":
+        return CPUSet(self.mask | other.mask)
+
+    def __and__(self, other: "CPUSet") -> "CPUSet":
+        return CPUSet(self.mask & other.mask)
+
+    def __sub__(self, other: "CPUSet") -> "CPUSet":
+        return CPUSet(self.mask & ~other.mask)
+
+    def __xor__(self, other: "CPUSet") -> "CPUSet":
+        return CPUSet(self.mask ^ other.mask)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CPUSet):
+            return NotImplemented
+        return self.mask == other.mask
+
+    def __hash__(self) -> int:
+        return hash(self.mask)
+
+    def __str__(self) -> str:
+        return self.cpulist
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.cpulist}')"
+
+
+@dataclass(frozen=True)
+class CPUCache:
+    """Cache shared by set of CPUs."""
+
+    level: int
+    type: str  # Data, Instruction or Unified
+    size: int | None  # bytes
+    cpus: CPUSet
+
+
+class CPUTopology:
+    """
+    Topology of online logical CPUs.
+
+    Sockets are numbered by physical package ID, NUMA nodes by node number and cores by dense index
+    (in order of their first CPU), as core IDs reported by kernel are unique only within package.
+    """
+
+    def __init__(
+        self,
+        core_cpus: Iterable[CPUSet],
+        socket_cpus: dict[int, CPUSet],
+        node_cpus: dict[int, CPUSet] | None = None,
+        caches: Iterable[CPUCache] = (),
+    ) -> None:
+        """
+        Build lookup arrays.
+
+        :param core_cpus: SMT siblings of every core.
+        :param socket_cpus: Socket (physical package ID): its CPUs.
+        :param node_cpus: NUMA node: its CPUs, all CPUs belong to node 0 if not passed.
+        :param caches: Caches of CPUs.
+        """
+        self.cores = tuple(sorted(core_cpus, key=lambda cpus: (cpus.mask & -cpus.mask)))
+        self.online = CPUSet()
+        for cpus in self.cores:
+            self.online |= cpus
+        self.sockets = dict(sorted(socket_cpus.items()))
+        self.nodes = dict(sorted((node_cpus or {0: self.online}).items()))
+        self.caches = tuple(caches)
+        size = self.online.mask.bit_length()
+        self._socket_of = array("i", [-1]) * size
+        self._core_of = array("i", [-1]) * size
+        self._node_of = array("i", [-1]) * size
+        for mapping, groups in (
+            (self._core_of, enumerate(self.cores)),
+            (self._socket_of, self.sockets.items()),
+            (self._node_of, self.nodes.items()),
+        ):
+            for group, cpus in groups:
+                for cpu in cpus:
+                    if cpu < size:
+                        mapping[cpu] = group
+
+    @classmethod
+    def from_sysfs(cls, root: str | Path = "/") -> "CPUTopology":
+        """
+        Read topology from sysfs.
+
+        Topology files are read once per core and once per package, not for every CPU.
+
+        :param root: Root of file system.
+        :return: Topology.
+        :raises FileNotFoundError: When sysfs CPU topology is not available.
+        """
+        cpu_path = os.path.join(root, SYS_CPU)
+        online = CPUSet.from_cpulist(read_sysfs(os.path.join(cpu_path, "online")))
+        core_cpus = []
+        socket_cpus: dict[int, CPUSet] = {}
+        unassigned_cores, unassigned_sockets = online, online
+        for cpu in online:
+            topology_path = os.path.join(cpu_path, f"cpu{cpu}", "topology")
+            if cpu in unassigned_cores:
+                siblings = CPUSet.from_cpulist(read_sysfs(os.path.join(topology_path, "thread_siblings_list"))) & online
+                core_cpus.append(siblings)
+                unassigned_cores -= siblings
+            if cpu in unassigned_sockets:
+                package = int(read_sysfs(os.path.join(topology_path, "physical_package_id")))
+                package_cpus = (
+                    CPUSet.from_cpulist(read_sysfs(os.path.join(topology_path, "core_siblings_list"))) & online
+                )
+                socket_cpus[package] = socket_cpus.get(package, CPUSet()) | package_cpus
+                unassigned_sockets -= package_cpus
+        return cls(
+            core_cpus, socket_cpus, _read_nodes(os.path.join(root, SYS_NODE), online), _read_caches(cpu_path, online)
+        )
+
+    @classmethod
+    def from_cpuinfo(cls, cpuinfo: str) -> "CPUTopology":
+        """
+        Build topology from `/proc/cpuinfo` content, without NUMA nodes and caches.
+
+        :param cpuinfo: Content of cpuinfo.
+        :return: Topology, CPUs without `physical id` / `core id` (e.g. in VMs) are single-thread cores of socket 0.
+        """
+        cores: dict[tuple[int, int], int] = {}
+        sockets: dict[int, int] = {}
+        for block in re.split(r"\n\s*\n", cpuinfo.strip()):
+            fields = {}
+            for line in block.splitlines():
+                name, _, value = line.partition(":")
+                fields[name.strip()] = value.strip()
+            if "processor" not in fields:
+                continue
+            cpu = int(fields["processor"])
+            socket = int(fields.get("physical id", 0))
+            core = (socket, int(fields["core id"])) if "core id" in fields else (socket, -1 - cpu)
+            cores[core] = cores.get(core, 0) | 1 << cpu
+            sockets[socket] = sockets.get(socket, 0) | 1 << cpu
+        return cls(
+            [CPUSet(mask) for mask in cores.values()], {socket: CPUSet(mask) for socket, mask in sockets.items()}
+        )
+
+    @classmethod
+    def load(cls, root: str | Path = "/") -> "CPUTopology":
+        """
+        Read topology from sysfs, or from `/proc/cpuinfo` when sysfs topology is not available.
+
+        :param root: Root of file system.
+        :return: Topology.
+        """
+        if os.path.exists(os.path.join(root, SYS_CPU, "cpu0", "topology")):
+            return cls.from_sysfs(root)
+        return cls.from_cpuinfo(read_sysfs(os.path.join(root, PROC_CPUINFO)))
+
+    def _lookup(self, mapping: array, cpu: int) -> int:
+        group = mapping[cpu] if 0 <= cpu < len(mapping) else -1
+        if group < 0:
+            raise KeyError(f"CPU {cpu} is not online")
+        return group
+
+    def socket_of(self, cpu: int) -> int:
+        """Get socket (physical package ID) of CPU."""
+        return self._lookup(self._socket_of, cpu)
+
+    def core_of(self, cpu: int) -> int:
+        """Get core index of CPU, index into cores."""
+        return self._lookup(self._core_of, cpu)
+
+    def node_of(self, cpu: int) -> int:
+        """Get NUMA node of CPU."""
+        return self._lookup(self._node_of, cpu)
+
+    def siblings(self, cpu: int) -> CPUSet:
+        """Get SMT siblings of CPU, including CPU itself."""
+        return self.cores[self.core_of(cpu)]
+
+    def socket_cpus(self, socket: int) -> CPUSet:
+        """Get CPUs of socket."""
+        return self.sockets[socket]
+
+    def node_cpus(self, node: int) -> CPUSet:
+        """Get CPUs of NUMA node."""
+        return self.nodes[node]
+
+    def primary_threads(self, cpus: CPUSet | None = None) -> CPUSet:
+        """
+        Get first SMT thread of every core, e.g. CPUs for IRQs of queues which should not share cores.
+
+        :param cpus: Limit result to these CPUs, all online CPUs if not passed.
+        :return: Lowest CPU of every core.
+        """
+        mask = 0
+        for core in self.cores:
+            mask |= core.mask & -core.mask
+        return CPUSet(mask) if cpus is None else CPUSet(mask) & cpus
+
+    def cache_of(self, cpu: int, level: int, cache_type: str = "Unified") -> CPUCache | None:
+        """
+        Get cache of CPU.
+
+        :param cpu: CPU number.
+        :param level: Cache level, e.g. 3 for LLC of most x86 CPUs.
+        :param cache_type: Data, Instruction or Unified.
+        :return: Cache or None if CPU has no such cache.
+        """
+        for cache in self.caches:
+            if cache.level == level and cache.type == cache_type and cpu in cache.cpus:
+                return cache
+        return None
+
+    @property
+    def cpu_count(self) -> int:
+        """Number of online logical CPUs."""
+        return len(self.online)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(sockets={len(self.sockets)}, nodes={len(self.nodes)}, "
+            f"cores={len(self.cores)}, cpus={self.cpu_count})"
+        )
+
+
+def _read_nodes(node_path: str, online: CPUSet) -> dict[int, CPUSet] | None:
+    """Read CPUs of NUMA nodes, None when kernel doesn't expose NUMA nodes."""
+    try:
+        names = os.listdir(node_path)
+    except FileNotFoundError:
+        return None
+    nodes = {}
+    for name in names:
+        match = _node_directory.fullmatch(name)
+        if match:
+            nodes[int(match.group(1))] = (
+                CPUSet.from_cpulist(read_sysfs(os.path.join(node_path, name, "cpulist"))) & online
+            )
+    return nodes or None
+
+
+def _parse_cache_size(size: str) -> int | None:
+    match = _cache_size.fullmatch(size.strip())
+    return int(match.group(1)) * _size_units[match.group(2)] if match else None
+
+
+def _read_caches(cpu_path: str, online: CPUSet) -> list[CPUCache]:
+    """Read caches, every cache is read once - by its first CPU, layout of cache indexes is same for all CPUs."""
+    first_cpu = next(iter(online), None)
+    try:
+        indexes = os.listdir(os.path.join(cpu_path, f"cpu{first_cpu}", "cache"))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    caches = []
+    for index in sorted(name for name in indexes if _cache_directory.fullmatch(name)):
+        unassigned = online
+        for cpu in online:
+            if cpu not in unassigned:
+                continue
+            cache_path = os.path.join(cpu_path, f"cpu{cpu}", "cache", index)
+            cpus = CPUSet.from_cpulist(read_sysfs(os.path.join(cache_path, "shared_cpu_list"))) & online
+            size_path = os.path.join(cache_path, "size")
+            caches.append(
+                CPUCache(
+                    level=int(read_sysfs(os.path.join(cache_path, "level"))),
+                    type=read_sysfs(os.path.join(cache_path, "type")),
+                    size=_parse_cache_size(read_sysfs(size_path)) if os.path.exists(size_path) else None,
+                    cpus=cpus | CPUSet(1 << cpu),
+                )
+            )
+            unassigned -= caches[-1].cpus
+    return caches
+
+
+def create_fake_cpu_topology(
+    root: str | Path,
+    sockets: int = 1,
+    cores_per_socket: int = 4,
+    threads_per_core: int = 2,
+    nodes_per_socket: int = 1,
+) -> None:
+    """
+    Create fake sysfs CPU topology in layout read by CPUTopology.from_sysfs, e.g. for tests and benchmarks.
+
+    CPUs are numbered like by Linux on x86: first threads of all cores of all sockets, then second threads and so on.
+    Every core has L1 data, L1 instruction and L2 caches, every socket has L3 cache.
+
+    :param root: Root of fake file system.
+    :param sockets: Number of sockets.
+    :param cores_per_socket: Number of cores of every socket.
+    :param threads_per_core: Number of SMT threads of every core.
+    :param nodes_per_socket: Number of NUMA nodes of every socket (sub-NUMA clustering), cores are split evenly.
+    """
+    cpu_path, node_path = Path(root, SYS_CPU), Path(root, SYS_NODE)
+    core_count = sockets * cores_per_socket
+    cpu_count = core_count * threads_per_core
+
+    def core_cpus(core: int) -> CPUSet:
+        return CPUSet.from_cpus(thread * core_count + core for thread in range(threads_per_core))
+
+    def socket_cpus(socket: int) -> CPUSet:
+        return CPUSet.from_cpus(
+            cpu for core in range(socket * cores_per_socket, (socket + 1) * cores_per_socket) for cpu in core_cpus(core)
+        )
+
+    write_sysfs(cpu_path / "online", f"0-{cpu_count - 1}")
+    write_sysfs(cpu_path / "possible", f"0-{cpu_count - 1}")
+    cores_per_node = cores_per_socket // nodes_per_socket
+    for node in range(sockets * nodes_per_socket):
+        cpus = CPUSet.from_cpus(
+            cpu for core in range(node * cores_per_node, (node + 1) * cores_per_node) for cpu in core_cpus(core)
+        )
+        write_sysfs(node_path / f"node{node}" / "cpulist", cpus.cpulist)
+    for cpu in range(cpu_count):
+        core = cpu % core_count
+        socket = core // cores_per_socket
+        topology_path = cpu_path / f"cpu{cpu}" / "topology"
+        write_sysfs(topology_path / "physical_package_id", str(socket))
+        write_sysfs(topology_path / "core_id", str(core % cores_per_socket))
+        write_sysfs(topology_path / "thread_siblings_list", core_cpus(core).cpulist)
+        write_sysfs(topology_path / "core_siblings_list", socket_cpus(socket).cpulist)
+        caches = [(1, "Data", "48K", core_cpus(core)), (1, "Instruction", "32K", core_cpus(core))]
+        caches += [(2, "Unified", "2048K", core_cpus(core)), (3, "Unified", "105M", socket_cpus(socket))]
+        for index, (level, cache_type, size, cpus) in enumerate(caches):
+            cache_path = cpu_path / f"cpu{cpu}" / "cache" / f"index{index}"
+            write_sysfs(cache_path / "level", str(level))
+            write_sysfs(cache_path / "type", cache_type)
+            write_sysfs(cache_path / "size", size)
+            write_sysfs(cache_path / "shared_cpu_list", cpus.cpulist)
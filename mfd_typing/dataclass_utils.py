@@ -2,11 +2,16 @@
 # SPDX-License-Identifier: MIT
 """Module for dataclass typing helpers."""
 
+import sys
+from dataclasses import field as dataclass_field, fields, is_dataclass, make_dataclass
+from functools import lru_cache
 from typing import ForwardRef, Union, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from dataclasses import Field
 
+ConversionPlan = tuple[tuple[str, type], ...]
+
 
 def get_field_type(field: "Field") -> Union[type, str]:
     """
@@ -48,3 +53,165 @@ def convert_value_field_to_typehint_type(obj: Any, field: "Field") -> None:
             obj.__dict__[field.name] = field_type(value)
     except TypeError:
         pass
+
+
+def _resolve_forward_ref(type_hint: Union[ForwardRef, str], owner: type) -> Any:
+    """
+    Evaluate type hint declared as str in namespace of module in which owner class is defined.
+
+    :param type_hint: ForwardRef or str type hint
+    :param owner: dataclass which declares the field
+    :return: Evaluated type hint or None if it cannot be resolved
+    """
+    expression = type_hint.__forward_arg__ if isinstance(type_hint, ForwardRef) else type_hint
+    module = sys.modules.get(owner.__module__)
+    global_namespace = dict(vars(module)) if module is not None else {}
+    try:
+        return eval(expression, global_namespace, {owner.__name__: owner})  # noqa: S307
+    except Exception:
+        return None
+
+
+def resolve_field_type(field: "Field", owner: type) -> type | None:
+    """
+    Get type hint of given field with ForwardRefs resolved.
+
+    Works as get_field_type, but type hints declared as str are evaluated in module of owner class.
+
+    :param field: Field to get type from.
+    :param owner: Dataclass which declares the field.
+    :return: Type of field or None if there is no type which value could be converted to.
+    """
+    type_hint = field.type
+    if isinstance(type_hint, (str, ForwardRef)):
+        type_hint = _resolve_forward_ref(type_hint, owner)
+    if isinstance(type_hint, type):
+        return type_hint
+
+    for type_arg in getattr(type_hint, "__args__", ()):
+        if isinstance(type_arg, (str, ForwardRef)):
+            type_arg = _resolve_forward_ref(type_arg, owner)
+        if type_arg is type(None):
+            continue
+        return type_arg if isinstance(type_arg, type) else None
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_conversion_plan(cls: type) -> ConversionPlan:
+    """
+    Build conversion plan of dataclass, computed once per class.
+
+    :param cls: Dataclass to build plan for.
+    :return: Ordered pairs of field name and type which value of that field should be converted to.
+    """
+    plan = []
+    for field in fields(cls):
+        field_type = resolve_field_type(field, cls)
+        if field_type is not None:
+            plan.append((field.name, field_type))
+    return tuple(plan)
+
+
+def convert_fields_to_typehint_types(obj: Any) -> None:
+    """
+    Convert values of all dataclass fields to types expected in typehints using cached conversion plan.
+
+    Can be called from __post_init__ instead of iterating convert_value_field_to_typehint_type over fields(self).
+
+    :param obj: self objects of dataclass
+    """
+    for name, field_type in get_conversion_plan(type(obj)):
+        value = getattr(obj, name)
+        if value is None or isinstance(value, field_type):
+            continue
+        try:
+            # force reset arguments on frozen dataclass
+            obj.__dict__[name] = field_type(value)
+        except TypeError:
+            pass
+
+
+# dataclass: its slotted variant, and slotted variant: dataclass it was made from
+_slotted_variants: dict[type, type] = {}
+_dict_based_variants: dict[type, type] = {}
+
+
+def slotted_variant(cls: type, base: type | None = None) -> type:
+    """
+    Create `__slots__`-based variant of dataclass, with the same fields, defaults and field order.
+
+    Objects of variant don't have per-instance `__dict__`, so only fields can be set. Variant isn't subclass of cls,
+    as slotted subclass of class with `__dict__` would still have `__dict__`; to keep inheritance chain, pass slotted
+    variant of base class of cls as base.
+
+    :param cls: Dataclass to create variant of.
+    :param base: Slotted variant of base class of cls, its fields are inherited instead of copied.
+    :return: Slotted dataclass named `Slotted<cls name>`.
+    """
+    inherited = {field.name for field in fields(base)} if base is not None else set()
+    variant_fields = []
+    for field in fields(cls):
+        if field.name in inherited:
+            continue
+        variant_field = dataclass_field(
+            default=field.default,
+            default_factory=field.default_factory,
+            init=field.init,
+            repr=field.repr,
+            hash=field.hash,
+            compare=field.compare,
+            metadata=field.metadata,
+        )
+        variant_fields.append((field.name, field.type, variant_field))
+    name = f"Slotted{cls.__name__}"
+    variant = make_dataclass(
+        name,
+        variant_fields,
+        bases=(base,) if base is not None else (),
+        slots=True,
+        frozen=cls.__dataclass_params__.frozen,
+    )
+    variant.__module__ = cls.__module__
+    variant.__qualname__ = name
+    variant.__doc__ = f"Slotted variant of {cls.__name__}, without per-instance __dict__."
+    _slotted_variants[cls] = variant
+    _dict_based_variants[variant] = cls
+    return variant
+
+
+def _convert_variant(obj: Any, variants: dict[type, type]) -> Any:
+    """Build object of variant class with field values of obj, nested dataclasses with variants converted too."""
+    variant = variants.get(type(obj))
+    if variant is None:
+        raise TypeError(f"{type(obj).__name__} has no registered variant")
+    kwargs = {}
+    for field in fields(obj):
+        value = getattr(obj, field.name)
+        if is_dataclass(value) and type(value) in variants:
+            value = _convert_variant(value, variants)
+        kwargs[field.name] = value
+    return variant(**kwargs)
+
+
+def to_slotted(obj: Any) -> Any:
+    """
+    Convert dataclass object to its slotted variant created by slotted_variant.
+
+    :param obj: Dataclass object, e.g. LinuxInterfaceInfo.
+    :return: Object of slotted variant, e.g. SlottedLinuxInterfaceInfo.
+    :raises TypeError: When class of object has no slotted variant.
+    """
+    return _convert_variant(obj, _slotted_variants)
+
+
+def to_dict_based(obj: Any) -> Any:
+    """
+    Convert object of slotted variant back to dataclass it was made from.
+
+    :param obj: Object of slotted variant, e.g. SlottedLinuxInterfaceInfo.
+    :return: Dataclass object, e.g. LinuxInterfaceInfo.
+    :raises TypeError: When class of object is not slotted variant.
+    """
+    return _convert_variant(obj, _dict_based_variants)
@@ -4,6 +4,8 @@
 
 from dataclasses import dataclass
 
+from .dataclass_utils import slotted_variant
+
 
 @dataclass
 class DriverInfo:
@@ -11,3 +13,7 @@ class DriverInfo:
 
     driver_name: str
     driver_version: str
+
+
+# variant without per-instance __dict__, see dataclass_utils.slotted_variant
+SlottedDriverInfo = slotted_variant(DriverInfo)
@@ -0,0 +1,306 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for collecting SystemInfo and interface inventories from many hosts concurrently with asyncio.
+
+Commands are executed by pluggable CommandTransport, e.g. LocalTransport or FakeTransport in tests.
+Number of hosts in flight is limited per fleet, every host has its own timeout and results are parsed
+as soon as commands of host finish, while other hosts are still in flight.
+
+>>> collector = FleetCollector(transport, concurrency=32, timeout=60)
+>>> async for result in collector.collect(hosts):
+...     print(result.host, result.data.get("system_info"), result.error)
+>>> collector.latency_stats()
+"""
+
+import asyncio
+import math
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Mapping, NamedTuple, Protocol
+
+from .iproute_parser import iter_ip_links
+from .os_values import SystemInfo
+
+
+class CommandTransport(Protocol):
+    """Transport executing commands on hosts."""
+
+    async def run(self, host: str, command: str) -> str:
+        """
+        Execute command on host.
+
+        :param host: Host to execute command on.
+        :param command: Command to execute.
+        :return: Output of command.
+        :raises CommandError: When command fails.
+        """
+
+
+class Collection(NamedTuple):
+    """Command executed on every host and parser of its output."""
+
+    command: str
+    parser: Callable[[str], Any]
+
+
+def parse_uname(output: str) -> SystemInfo:
+    """
+    Parse `uname -snrm` output.
+
+    :param output: Output, e.g. `Linux host-1 6.8.0-45-generic x86_64`.
+    :return: System info with host name, OS name, kernel version and architecture.
+    """
+    os_name, host_name, kernel_version, architecture_info = output.split()[:4]
+    return SystemInfo(
+        host_name=host_name, os_name=os_name, kernel_version=kernel_version, architecture_info=architecture_info
+    )
+
+
+default_collections: dict[str, Collection] = {
+    "system_info": Collection("uname -snrm", parse_uname),
+    "interfaces": Collection("ip -json -details link show", lambda output: list(iter_ip_links(output))),
+}
+
+
+@dataclass
+class HostResult:
+    """Result of collection from single host."""
+
+    host: str
+    data: dict[str, Any] = field(default_factory=dict)  # name of collection: parsed output
+    error: Exception | None = None
+    latency: float = 0.0  # seconds, from start of host collection until result or error
+    command_latencies: dict[str, float] = field(default_factory=dict)  # name of collection: seconds
+
+    @property
+    def ok(self) -> bool:
+        """Whether all collections succeeded."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Statistics of latencies in seconds."""
+
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    median: float
+    p95: float
+
+    @classmethod
+    def from_latencies(cls, latencies: Iterable[float]) -> "LatencyStats":
+        """
+        Calculate statistics.
+
+        :param latencies: Latencies in seconds.
+        :return: Statistics, all zeros for no latencies.
+        """
+        values = sorted(latencies)
+        if not values:
+            return cls(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        p95 = values[min(len(values) - 1, math.ceil(0.95 * len(values)) - 1)]
+        return cls(len(values), values[0], values[-1], statistics.fmean(values), statistics.median(values), p95)
+
+
+class FleetCollector:
+    """Collector of data from fleet of hosts with bounded concurrency, per-host timeouts and backpressure."""
+
+    def __init__(
+        self,
+        transport: CommandTransport,
+        collections: Mapping[str, Collection] | None = None,
+        concurrency: int = 16,
+        timeout: float | None = 60.0,
+        max_pending_results: int | None = None,
+    ) -> None:
+        """
+        Initialize collector.
+
+        :param transport: Transport executing commands.
+        :param collections: Name of collection: command and parser, default_collections if not passed.
+        :param concurrency: Maximum number of hosts in flight.
+        :param timeout: Timeout of collection from single host in seconds, None for no timeout.
+        :param max_pending_results: Maximum number of results not consumed yet, collection from next hosts
+                                    is paused when reached. Equal to concurrency if not passed.
+        :raises ValueError: When concurrency is lower than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+        self.transport = transport
+        self.collections = dict(default_collections if collections is None else collections)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_pending_results = concurrency if max_pending_results is None else max_pending_results
+        self.latencies: dict[str, float] = {}  # host: latency of last collection
+
+    async def _collect_commands(self, result: HostResult) -> None:
+        for name, (command, parser) in self.collections.items():
+            start = time.perf_counter()
+            output = await self.transport.run(result.host, command)
+            result.command_latencies[name] = time.perf_counter() - start
+            result.data[name] = parser(output)
+
+    async def collect_host(self, host: str) -> HostResult:
+        """
+        Collect data from single host, errors and timeout are stored in result.
+
+        :param host: Host to collect data from.
+        :return: Result with data parsed by collections done before error.
+        """
+        result = HostResult(host)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._collect_commands(result), self.timeout)
+        except asyncio.TimeoutError:
+            result.error = TimeoutError(f"Collection from {host} timed out after {self.timeout} s")
+        except Exception as e:
+            result.error = e
+        result.latency = time.perf_counter() - start
+        self.latencies[host] = result.latency
+        return result
+
+    async def collect(self, hosts: Iterable[str] | AsyncIterable[str]) -> AsyncIterator[HostResult]:
+        """
+        Collect data from hosts, results are yielded in order of completion.
+
+        Hosts are taken from iterable lazily, so it may be a generator of large fleet.
+        When consumer doesn't keep up, at most max_pending_results results wait and no new hosts are started.
+
+        :param hosts: Hosts to collect data from.
+        :return: Async iterator over results.
+        """
+        host_iterator = aiter(hosts) if isinstance(hosts, AsyncIterable) else _to_async_iterator(hosts)
+        iterator_lock = asyncio.Lock()  # async generators can't be advanced by many workers at once
+        results: asyncio.Queue[HostResult | None] = asyncio.Queue(maxsize=max(self.max_pending_results, 1))
+        closing = False
+
+        async def worker() -> None:
+            while True:
+                async with iterator_lock:
+                    host = await anext(host_iterator, None)
+                if host is None:
+                    return
+                await results.put(await self.collect_host(host))
+
+        async def run_workers() -> None:
+            try:
+                await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+            finally:
+                if not closing:
+                    await results.put(None)
+
+        runner = asyncio.ensure_future(run_workers())
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            await runner  # propagate errors of host iterator
+        finally:
+            closing = True
+            if not runner.done():
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+
+    async def collect_all(self, hosts: Iterable[str] | AsyncIterable[str]) -> dict[str, HostResult]:
+        """
+        Collect data from all hosts.
+
+        :param hosts: Hosts to collect data from.
+        :return: Host: result.
+        """
+        return {result.host: result async for result in self.collect(hosts)}
+
+    def latency_stats(self) -> LatencyStats:
+        """Get statistics of latencies of all hosts collected so far."""
+        return LatencyStats.from_latencies(self.latencies.values())
+
+
+async def _to_async_iterator(items: Iterable[str]) -> AsyncIterator[str]:
+    for item in items:
+        yield item
+
+
+class LocalTransport:
+    """Transport executing commands in local shell, host is passed in MFD_HOST environment variable."""
+
+    async def run(self, host: str, command: str) -> str:
+        """
+        Execute command in local shell.
+
+        :param host: Host, available to command as $MFD_HOST.
+        :param command: Command to execute.
+        :return: Standard output of command.
+        :raises CommandError: When command exits with non-zero code.
+        """
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, "MFD_HOST": host},
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+        if process.returncode:
+            raise CommandError(command, process.returncode, stderr.decode(errors="replace"))
+        return stdout.decode()
+
+
+class FakeTransport:
+    """Transport returning predefined outputs, for tests and benchmarks."""
+
+    def __init__(self, outputs: Mapping[str, Mapping[str, str]], delays: Mapping[str, float] | None = None) -> None:
+        """
+        Initialize transport.
+
+        :param outputs: Host: command: output, host "*" is used for hosts not listed.
+        :param delays: Host: delay of every command in seconds, host "*" is used for hosts not listed.
+        """
+        self.outputs = outputs
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run(self, host: str, command: str) -> str:
+        """
+        Return predefined output after delay.
+
+        :param host: Host.
+        :param command: Command.
+        :return: Predefined output.
+        :raises CommandError: When there is no output for host and command.
+        """
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(host, self.delays.get("*", 0)))
+        finally:
+            self.in_flight -= 1
+        outputs = self.outputs.get(host, self.outputs.get("*", {}))
+        if command not in outputs:
+            raise CommandError(command, 127, f"{command}: command not found on {host}")
+        return outputs[command]
+
+
+class CommandError(Exception):
+    """Exception raised for command which failed on host."""
+
+    def __init__(self, command: str, return_code: int, stderr: str = "") -> None:
+        """
+        Initialize error.
+
+        :param command: Failed command.
+        :param return_code: Exit code of command.
+        :param stderr: Error output of command.
+        """
+        super().__init__(f"Command '{command}' failed with code {return_code}: {stderr.strip()}")
+        self.command = command
+        self.return_code = return_code
+        self.stderr = stderr
@@ -0,0 +1,232 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for opt-in instrumentation of constructors, parsers and converters.
+
+Nothing is instrumented until enable() is called: it swaps `__init__` of instrumented classes, instrumented methods
+(e.g. alternative constructors like `PCIAddress.from_packed`) and module attributes of instrumented functions for
+wrappers counting calls and failures and measuring time. disable() restores originals, so there is no cost when
+instrumentation is disabled.
+Functions imported with `from module import function` before enable() keep referencing original function.
+
+>>> with instrumented():
+...     run_sweep()
+...     print(export_text())
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from importlib import import_module
+from inspect import getattr_static
+from typing import Any, Callable, Iterable, Iterator
+
+# upper bounds of duration histogram buckets in seconds, last bucket is +Inf
+DURATION_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 1e-1, 5e-1, 1.0)
+
+# module, attribute (class, "Class.method" or function) instrumented by default
+default_targets: tuple[tuple[str, str], ...] = (
+    ("mfd_typing.pci_address", "PCIAddress"),
+    ("mfd_typing.pci_address", "PCIAddress.from_packed"),
+    ("mfd_typing.pci_address", "_unpickle_pci_address"),
+    ("mfd_typing.pci_device", "PCIDevice"),
+    ("mfd_typing.pci_device", "PCIDevice.from_ids"),
+    ("mfd_typing.pci_device", "_unpickle_pci_device"),
+    ("mfd_typing.mac_address", "MACAddress"),
+    ("mfd_typing.mac_address", "MACAddress.from_int"),
+    ("mfd_typing.mac_address", "_unpickle_mac_address"),
+    ("mfd_typing.serialization", "from_dict"),
+    ("mfd_typing.wire_format", "RecordTable"),
+    ("mfd_typing.wire_format", "RecordTable.__getitem__"),
+    ("mfd_typing.utils", "decimal_to_hex"),
+    ("mfd_typing.utils", "decimal_to_bin"),
+    ("mfd_typing.utils", "compare_non_conforming_versions"),
+    ("mfd_typing.utils", "convert_port_dc_to_port_hex"),
+    ("mfd_typing.utils", "convert_ip_dc_to_ip_hex"),
+    ("mfd_typing.utils", "convert_ip_dc_to_hex_value"),
+    ("mfd_typing.utils", "convert_mac_string_to_hex"),
+    ("mfd_typing.utils", "format_mac_string_to_canonical"),
+    ("mfd_typing.utils", "convert_ip_to_brackets_colon_format"),
+    ("mfd_typing.utils", "get_windows_version_from_kernel"),
+    ("mfd_typing.utils", "strtobool"),
+    ("mfd_typing.powershell_parser", "parse_windows_interfaces"),
+    ("mfd_typing.iproute_parser", "link_to_interface_info"),
+)
+
+
+@dataclass(frozen=True)
+class MetricSnapshot:
+    """Metrics of single instrumented target."""
+
+    calls: int
+    failures: int
+    total_time: float  # seconds
+    buckets: tuple[int, ...]  # number of calls per duration bucket (not cumulative), last is +Inf
+
+
+class _Metric:
+    __slots__ = ("calls", "failures", "total_time", "buckets")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)
+
+
+_lock = threading.Lock()
+_metrics: dict[str, _Metric] = {}
+_originals: dict[tuple[str, str], tuple[Any, str, Any]] = {}  # target: (owner, attribute name, original)
+
+
+def _record(name: str, duration: float, failed: bool) -> None:
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = _Metric()
+        metric.calls += 1
+        metric.failures += failed
+        metric.total_time += duration
+        metric.buckets[bisect.bisect_left(DURATION_BUCKETS, duration)] += 1
+
+
+def _instrument(function: Callable, name: str) -> Callable:
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception:
+            _record(name, time.perf_counter() - start, True)
+            raise
+        _record(name, time.perf_counter() - start, False)
+        return result
+
+    return wrapper
+
+
+def _instrument_method(method: Any, name: str) -> Any:
+    """Wrap function of method, keeping it classmethod or staticmethod."""
+    if isinstance(method, (classmethod, staticmethod)):
+        return type(method)(_instrument(method.__func__, name))
+    return _instrument(method, name)
+
+
+def enable(targets: Iterable[tuple[str, str]] = default_targets) -> None:
+    """
+    Enable instrumentation of targets, already instrumented targets are skipped.
+
+    Class is instrumented by wrapping its `__init__` and method (passed as "Class.method") by wrapping it in class,
+    so existing references to class are instrumented too. Alternative constructors which don't call `__init__`
+    (e.g. `PCIAddress.from_packed`) have to be instrumented as methods, they are counted separately from class.
+
+    :param targets: Module name and name of class, method of class or function in it.
+    """
+    with _lock:
+        for module_name, attribute in targets:
+            if (module_name, attribute) in _originals:
+                continue
+            module = import_module(module_name)
+            class_name, _, method_name = attribute.rpartition(".")
+            if class_name:
+                owner = getattr(module, class_name)
+                original = owner.__dict__.get(method_name)  # None when method is inherited
+                setattr(owner, method_name, _instrument_method(getattr_static(owner, method_name), attribute))
+                _originals[(module_name, attribute)] = owner, method_name, original
+                continue
+            target = getattr(module, attribute)
+            if isinstance(target, type):
+                owner, name, original = target, "__init__", target.__dict__.get("__init__")
+                setattr(target, "__init__", _instrument(target.__init__, attribute))
+            else:
+                owner, name, original = module, attribute, target
+                setattr(module, attribute, _instrument(target, f"{module_name.rpartition('.')[2]}.{attribute}"))
+            _originals[(module_name, attribute)] = owner, name, original
+
+
+def disable() -> None:
+    """Restore original classes and functions, collected metrics are kept."""
+    with _lock:
+        for owner, name, original in _originals.values():
+            if original is None:  # __init__ or method was inherited
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        _originals.clear()
+
+
+def is_enabled() -> bool:
+    """Check whether any target is instrumented."""
+    return bool(_originals)
+
+
+@contextmanager
+def instrumented(targets: Iterable[tuple[str, str]] = default_targets) -> Iterator[None]:
+    """
+    Enable instrumentation within context.
+
+    :param targets: Module name and name of class, method of class or function in it.
+    """
+    enable(targets)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot() -> dict[str, MetricSnapshot]:
+    """
+    Get consistent copy of collected metrics.
+
+    :return: Name of target: metrics.
+    """
+    with _lock:
+        return {
+            name: MetricSnapshot(metric.calls, metric.failures, metric.total_time, tuple(metric.buckets))
+            for name, metric in _metrics.items()
+        }
+
+
+def reset() -> dict[str, MetricSnapshot]:
+    """
+    Clear collected metrics.
+
+    :return: Metrics collected before reset.
+    """
+    with _lock:
+        metrics = {
+            name: MetricSnapshot(metric.calls, metric.failures, metric.total_time, tuple(metric.buckets))
+            for name, metric in _metrics.items()
+        }
+        _metrics.clear()
+    return metrics
+
+
+def export_text(metrics: dict[str, MetricSnapshot] | None = None, prefix: str = "mfd_typing") -> str:
+    """
+    Export metrics in Prometheus plain-text exposition format.
+
+    :param metrics: Metrics to export, current snapshot if not passed.
+    :param prefix: Prefix of metric names.
+    :return: Text with calls and failures counters and duration histogram of every target.
+    """
+    metrics = snapshot() if metrics is None else metrics
+    lines = [f"# TYPE {prefix}_calls_total counter"]
+    lines += [f'{prefix}_calls_total{{target="{name}"}} {metric.calls}' for name, metric in sorted(metrics.items())]
+    lines.append(f"# TYPE {prefix}_failures_total counter")
+    lines += [
+        f'{prefix}_failures_total{{target="{name}"}} {metric.failures}' for name, metric in sorted(metrics.items())
+    ]
+    lines.append(f"# TYPE {prefix}_duration_seconds histogram")
+    for name, metric in sorted(metrics.items()):
+        cumulative = 0
+        for bound, count in zip(DURATION_BUCKETS + (float("inf"),), metric.buckets):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{prefix}_duration_seconds_bucket{{target="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'{prefix}_duration_seconds_sum{{target="{name}"}} {metric.total_time!r}')
+        lines.append(f'{prefix}_duration_seconds_count{{target="{name}"}} {metric.calls}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,182 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for indexed collection of network interface info."""
+
+from collections.abc import Collection
+from typing import Any, Iterable, Iterator
+
+from .mac_address import MACAddress
+from .network_interface import InterfaceInfo
+from .pci_address import PCIAddress
+
+# attributes of InterfaceInfo (and subclasses) with secondary index maintained by InterfaceCollection
+INDEXED_ATTRIBUTES = ("name", "mac_address", "pci_address", "guid", "pnp_device_id", "namespace", "interface_type")
+
+# attribute: conversion of str query values to indexed type
+_query_normalizers = {
+    "mac_address": MACAddress,
+    "pci_address": lambda value: PCIAddress(data=value),
+}
+
+
+class InterfaceCollection(Collection):
+    """
+    Collection of InterfaceInfo objects with secondary indexes for O(1) lookups.
+
+    Every attribute from INDEXED_ATTRIBUTES is indexed, attributes missing in given InterfaceInfo subclass
+    (e.g. `guid` in LinuxInterfaceInfo) are indexed as None.
+    Interfaces are stored by identity, since InterfaceInfo objects are mutable and unhashable.
+    Changes of interfaces have to be made by `update` or followed by `refresh` to keep indexes up to date.
+
+    >>> interfaces = InterfaceCollection(interfaces_list)
+    >>> interfaces.get(name="eth0")
+    >>> interfaces.find(interface_type=InterfaceType.VF, namespace="ns1")
+    """
+
+    def __init__(self, interfaces: Iterable[InterfaceInfo] = ()) -> None:
+        """
+        Initialize collection.
+
+        :param interfaces: Initial interfaces.
+        """
+        self._interfaces: dict[int, InterfaceInfo] = {}
+        # id of interface: values of indexed attributes at the time of indexing
+        self._indexed_keys: dict[int, tuple] = {}
+        # attribute: value: id of interface: interface
+        self._indexes: dict[str, dict[Any, dict[int, InterfaceInfo]]] = {attr: {} for attr in INDEXED_ATTRIBUTES}
+        for interface in interfaces:
+            self.add(interface)
+
+    def __len__(self) -> int:
+        return len(self._interfaces)
+
+    def __iter__(self) -> Iterator[InterfaceInfo]:
+        return iter(list(self._interfaces.values()))
+
+    def __contains__(self, interface: object) -> bool:
+        return id(interface) in self._interfaces
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._interfaces.values())!r})"
+
+    def _index(self, interface: InterfaceInfo) -> None:
+        keys = tuple(getattr(interface, attr, None) for attr in INDEXED_ATTRIBUTES)
+        self._indexed_keys[id(interface)] = keys
+        for attr, key in zip(INDEXED_ATTRIBUTES, keys):
+            self._indexes[attr].setdefault(key, {})[id(interface)] = interface
+
+    def _unindex(self, interface: InterfaceInfo) -> None:
+        keys = self._indexed_keys.pop(id(interface))
+        for attr, key in zip(INDEXED_ATTRIBUTES, keys):
+            bucket = self._indexes[attr][key]
+            del bucket[id(interface)]
+            if not bucket:
+                del self._indexes[attr][key]
+
+    def add(self, interface: InterfaceInfo) -> None:
+        """
+        Add interface to collection, adding already present interface has no effect.
+
+        :param interface: Interface to add.
+        """
+        if id(interface) in self._interfaces:
+            return
+        self._interfaces[id(interface)] = interface
+        self._index(interface)
+
+    def remove(self, interface: InterfaceInfo) -> None:
+        """
+        Remove interface from collection.
+
+        :param interface: Interface to remove.
+        :raises KeyError: When interface is not in collection.
+        """
+        if id(interface) not in self._interfaces:
+            raise KeyError(interface)
+        self._unindex(interface)
+        del self._interfaces[id(interface)]
+
+    def discard(self, interface: InterfaceInfo) -> None:
+        """
+        Remove interface from collection if it is present.
+
+        :param interface: Interface to remove.
+        """
+        if id(interface) in self._interfaces:
+            self.remove(interface)
+
+    def refresh(self, interface: InterfaceInfo) -> None:
+        """
+        Update indexes of interface after it was changed outside of collection.
+
+        :param interface: Changed interface.
+        :raises KeyError: When interface is not in collection.
+        """
+        if id(interface) not in self._interfaces:
+            raise KeyError(interface)
+        self._unindex(interface)
+        self._index(interface)
+
+    def update(self, interface: InterfaceInfo, **changes: Any) -> None:
+        """
+        Change attributes of interface and update indexes.
+
+        :param interface: Interface to change.
+        :param changes: Attributes with new values.
+        :raises KeyError: When interface is not in collection.
+        """
+        if id(interface) not in self._interfaces:
+            raise KeyError(interface)
+        for attr, value in changes.items():
+            setattr(interface, attr, value)
+        self.refresh(interface)
+
+    def find(self, **criteria: Any) -> list[InterfaceInfo]:
+        """
+        Find interfaces with all attributes equal to given values.
+
+        Indexed attributes are resolved by index, starting from the most selective one,
+        other attributes are compared on interfaces remaining after index lookups.
+        Values of `mac_address` and `pci_address` can be passed as str.
+
+        :param criteria: Attributes with expected values, e.g. interface_type=InterfaceType.VF, namespace="ns1".
+        :return: Matching interfaces.
+        """
+        if not criteria:
+            return list(self._interfaces.values())
+
+        buckets = []
+        filters = []
+        for attr, value in criteria.items():
+            if attr in _query_normalizers and isinstance(value, str):
+                value = _query_normalizers[attr](value)
+            if attr in self._indexes:
+                bucket = self._indexes[attr].get(value)
+                if not bucket:
+                    return []
+                buckets.append(bucket)
+            else:
+                filters.append((attr, value))
+
+        if buckets:
+            smallest, *others = sorted(buckets, key=len)
+            matches = [interface for key, interface in smallest.items() if all(key in bucket for bucket in others)]
+        else:
+            matches = list(self._interfaces.values())
+
+        if filters:
+            matches = [i for i in matches if all(getattr(i, attr, None) == value for attr, value in filters)]
+        return matches
+
+    def get(self, **criteria: Any) -> InterfaceInfo | None:
+        """
+        Get single interface with all attributes equal to given values.
+
+        :param criteria: Attributes with expected values, e.g. name="eth0".
+        :return: Matching interface or None if not found.
+        :raises ValueError: When more than one interface matches.
+        """
+        matches = self.find(**criteria)
+        if len(matches) > 1:
+            raise ValueError(f"Found {len(matches)} interfaces matching {criteria}, expected one")
+        return matches[0] if matches else None
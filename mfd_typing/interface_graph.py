@@ -0,0 +1,227 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for graph of relationships between network interfaces.
+
+Edge goes from parent to child interface, which is built on top of it:
+VLAN is child of its parent (taken from VlanInterfaceInfo.parent), bond is child of its slaves and VF is child of PF.
+Links which are not stored in InterfaceInfo (bond membership, VF-to-PF) are passed as (child, parent) pairs.
+
+>>> graph = InterfaceGraph(interfaces, links=[("bond0", "eth0"), ("bond0", "eth1")])
+>>> graph.affected_by("eth0")  # bond0 and all VLANs on it
+>>> graph.underlying_ports("bond0.10")  # eth0, eth1
+"""
+
+from collections import deque
+from typing import Iterable, Iterator
+
+from .network_interface import InterfaceInfo
+
+InterfaceKey = tuple[str | None, str]  # namespace, name
+
+
+def interface_key(interface: InterfaceInfo) -> InterfaceKey:
+    """
+    Get key of interface in graph.
+
+    :param interface: Interface.
+    :return: Namespace (None for default one and Windows) and name.
+    """
+    return getattr(interface, "namespace", None), interface.name
+
+
+class InterfaceGraph:
+    """
+    Graph of interfaces with adjacency indexes in both directions.
+
+    Edges are stored independently of interfaces, so interface which disappears and appears again is linked back
+    to its parents and children. Queries traverse only interfaces present in graph, in O(size of result).
+    """
+
+    def __init__(
+        self,
+        interfaces: Iterable[InterfaceInfo] = (),
+        links: Iterable[tuple[InterfaceKey | str, InterfaceKey | str]] = (),
+    ) -> None:
+        """
+        Build graph.
+
+        :param interfaces: Interfaces.
+        :param links: Pairs of (child, parent) keys, or names in default namespace, e.g. (bond, slave), (VF, PF).
+        """
+        self._interfaces: dict[InterfaceKey, InterfaceInfo] = {}
+        self._parents: dict[InterfaceKey, set[InterfaceKey]] = {}
+        self._children: dict[InterfaceKey, set[InterfaceKey]] = {}
+        self._namespaces: dict[str | None, set[InterfaceKey]] = {}
+        self._vlan_parents: dict[InterfaceKey, InterfaceKey] = {}  # edges derived from VlanInterfaceInfo
+        self._explicit_links: set[tuple[InterfaceKey, InterfaceKey]] = set()  # (child, parent) passed to link
+        for child, parent in links:
+            self.link(child, parent)
+        for interface in interfaces:
+            self.add(interface)
+
+    @staticmethod
+    def _key(interface: InterfaceInfo | InterfaceKey | str) -> InterfaceKey:
+        if isinstance(interface, InterfaceInfo):
+            return interface_key(interface)
+        if isinstance(interface, str):
+            return None, interface
+        return interface
+
+    def __len__(self) -> int:
+        return len(self._interfaces)
+
+    def __iter__(self) -> Iterator[InterfaceInfo]:
+        return iter(self._interfaces.values())
+
+    def __contains__(self, interface: InterfaceInfo | InterfaceKey | str) -> bool:
+        return self._key(interface) in self._interfaces
+
+    def __getitem__(self, interface: InterfaceKey | str) -> InterfaceInfo:
+        return self._interfaces[self._key(interface)]
+
+    def add(self, interface: InterfaceInfo) -> None:
+        """
+        Add or replace interface, VLAN is linked to parent from its VlanInterfaceInfo.
+
+        :param interface: Interface.
+        """
+        key = interface_key(interface)
+        if key in self._interfaces:
+            self.remove(key)
+        self._interfaces[key] = interface
+        self._namespaces.setdefault(key[0], set()).add(key)
+        if interface.vlan_info is not None and interface.vlan_info.parent is not None:
+            parent = (key[0], interface.vlan_info.parent)
+            self._vlan_parents[key] = parent
+            self._add_edge(key, parent)
+
+    def remove(self, interface: InterfaceInfo | InterfaceKey | str) -> InterfaceInfo:
+        """
+        Remove interface, links passed explicitly are kept, link to VLAN parent is removed unless passed explicitly too.
+
+        :param interface: Interface or its key.
+        :return: Removed interface.
+        :raises KeyError: When interface is not in graph.
+        """
+        key = self._key(interface)
+        removed = self._interfaces.pop(key)
+        namespace = self._namespaces[key[0]]
+        namespace.discard(key)
+        if not namespace:
+            del self._namespaces[key[0]]
+        vlan_parent = self._vlan_parents.pop(key, None)
+        if vlan_parent is not None and (key, vlan_parent) not in self._explicit_links:
+            self._remove_edge(key, vlan_parent)
+        return removed
+
+    def link(self, child: InterfaceKey | str, parent: InterfaceKey | str) -> None:
+        """
+        Add edge, interfaces don't need to be present in graph yet.
+
+        :param child: Interface built on top of parent, e.g. bond or VF.
+        :param parent: Underlying interface, e.g. bond slave or PF.
+        """
+        child, parent = self._key(child), self._key(parent)
+        self._explicit_links.add((child, parent))
+        self._add_edge(child, parent)
+
+    def unlink(self, child: InterfaceKey | str, parent: InterfaceKey | str) -> None:
+        """
+        Remove edge passed to link if exists, edge of present VLAN to its parent is kept.
+
+        :param child: Interface built on top of parent.
+        :param parent: Underlying interface.
+        """
+        child, parent = self._key(child), self._key(parent)
+        self._explicit_links.discard((child, parent))
+        if self._vlan_parents.get(child) != parent:
+            self._remove_edge(child, parent)
+
+    def _add_edge(self, child: InterfaceKey, parent: InterfaceKey) -> None:
+        self._parents.setdefault(child, set()).add(parent)
+        self._children.setdefault(parent, set()).add(child)
+
+    def _remove_edge(self, child: InterfaceKey, parent: InterfaceKey) -> None:
+        for index, key, value in ((self._parents, child, parent), (self._children, parent, child)):
+            values = index.get(key)
+            if values is not None:
+                values.discard(value)
+                if not values:
+                    del index[key]
+
+    def _adjacent(self, index: dict[InterfaceKey, set[InterfaceKey]], key: InterfaceKey) -> Iterator[InterfaceKey]:
+        return (adjacent for adjacent in index.get(key, ()) if adjacent in self._interfaces)
+
+    def parents(self, interface: InterfaceInfo | InterfaceKey | str) -> list[InterfaceInfo]:
+        """Get interfaces directly under interface."""
+        return [self._interfaces[key] for key in self._adjacent(self._parents, self._key(interface))]
+
+    def children(self, interface: InterfaceInfo | InterfaceKey | str) -> list[InterfaceInfo]:
+        """Get interfaces built directly on top of interface."""
+        return [self._interfaces[key] for key in self._adjacent(self._children, self._key(interface))]
+
+    def _walk(self, index: dict[InterfaceKey, set[InterfaceKey]], start: InterfaceKey) -> Iterator[InterfaceKey]:
+        """Breadth-first walk from start (excluded) over present interfaces, every interface is visited once."""
+        visited = {start}
+        queue = deque((start,))
+        while queue:
+            for adjacent in self._adjacent(index, queue.popleft()):
+                if adjacent not in visited:
+                    visited.add(adjacent)
+                    queue.append(adjacent)
+                    yield adjacent
+
+    def ancestors(self, interface: InterfaceInfo | InterfaceKey | str) -> list[InterfaceInfo]:
+        """
+        Get all interfaces under interface, e.g. bond and its slaves for VLAN on bond.
+
+        :param interface: Interface or its key.
+        :return: Ancestors, nearest first.
+        """
+        return [self._interfaces[key] for key in self._walk(self._parents, self._key(interface))]
+
+    def descendants(self, interface: InterfaceInfo | InterfaceKey | str) -> list[InterfaceInfo]:
+        """
+        Get all interfaces built on top of interface.
+
+        :param interface: Interface or its key.
+        :return: Descendants, nearest first.
+        """
+        return [self._interfaces[key] for key in self._walk(self._children, self._key(interface))]
+
+    def underlying_ports(self, interface: InterfaceInfo | InterfaceKey | str) -> list[InterfaceInfo]:
+        """
+        Get lowest interfaces under interface, e.g. PFs under VLAN on bond of VFs.
+
+        :param interface: Interface or its key.
+        :return: Ancestors without parents, interface itself if it has no parents.
+        """
+        key = self._key(interface)
+        if not any(self._adjacent(self._parents, key)):
+            return [self._interfaces[key]]
+        return [
+            self._interfaces[ancestor]
+            for ancestor in self._walk(self._parents, key)
+            if not any(self._adjacent(self._parents, ancestor))
+        ]
+
+    def affected_by(self, interface: InterfaceInfo | InterfaceKey | str) -> list[InterfaceInfo]:
+        """
+        Get interfaces affected when interface goes down.
+
+        Bond with slaves is affected, even if it can survive loss of single slave.
+
+        :param interface: Interface or its key.
+        :return: Descendants of interface.
+        """
+        return self.descendants(interface)
+
+    def namespace(self, namespace: str | None) -> list[InterfaceInfo]:
+        """
+        Get interfaces in namespace.
+
+        :param namespace: Namespace, None for default one.
+        :return: Interfaces.
+        """
+        return [self._interfaces[key] for key in self._namespaces.get(namespace, ())]
@@ -0,0 +1,325 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for snapshots of interface inventories and diffs between them."""
+
+import json
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Callable, Hashable, Iterable, Iterator, NamedTuple
+from uuid import UUID
+
+from .dataclass_utils import resolve_field_type
+from .mac_address import MACAddress
+from .network_interface import InterfaceInfo, InterfaceType, SlottedInterfaceInfo
+from .pci_address import PCIAddress
+from .serialization import Decoder, Encoder, from_dict, get_value_codec, to_dict
+
+# interface types which share PCI Address with other interfaces, so it's not enough to identify them
+_SHARED_PCI_ADDRESS_TYPES = frozenset({InterfaceType.VPORT, InterfaceType.BTS, InterfaceType.VLAN})
+
+# value types allowed in identity keys of encoded diffs, tagged with their names
+_KEY_VALUE_TYPES = {value_type.__name__: value_type for value_type in (PCIAddress, MACAddress, UUID)}
+
+
+def default_identity_key(interface: InterfaceInfo) -> Hashable:
+    """
+    Get identity of interface, stable between polls as long as it is the same device.
+
+    Identity doesn't contain name nor MAC Address, so renames and MAC changes are reported as changes of record.
+
+    :param interface: Interface to identify.
+    :return: GUID (Windows), PCI Address (with VSI ID for VPORT) or namespace and name for virtual interfaces.
+    """
+    guid = getattr(interface, "guid", None)
+    if guid is not None:
+        return "guid", guid
+    if interface.pci_address is not None:
+        vsi_info = getattr(interface, "vsi_info", None)
+        if interface.interface_type is InterfaceType.VPORT and vsi_info is not None:
+            return "vsi", interface.pci_address, vsi_info.vsi_id
+        if interface.interface_type not in _SHARED_PCI_ADDRESS_TYPES:
+            return "pci", interface.pci_address
+    return "name", getattr(interface, "namespace", None), interface.name
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert nested dataclasses to tuples, so values can be hashed and don't change with record.
+
+    PCIDevice is converted too, since its equality ignores sub IDs missing in one of compared objects.
+    """
+    if is_dataclass(value) and not isinstance(value, PCIAddress):
+        return type(value), tuple(_freeze(getattr(value, name)) for name in _field_names(type(value)))
+    return value
+
+
+def _fingerprint(interface: InterfaceInfo) -> int:
+    """
+    Get content hash of record, stable between processes and runs (unlike built-in hash of str).
+
+    It's BLAKE2b of canonical encoding: class name and compact dict of serialization module, dumped by json module
+    (not orjson, which would make encoding depend on installed packages).
+    """
+    encoded = json.dumps([type(interface).__qualname__, to_dict(interface, compact=True)], separators=(",", ":"))
+    return int.from_bytes(blake2b(encoded.encode(), digest_size=8).digest(), "little")
+
+
+class _Entry(NamedTuple):
+    record: InterfaceInfo
+    values: tuple
+    content_hash: int
+
+
+@dataclass(frozen=True)
+class RecordChange:
+    """
+    Change of record with the same identity key, only changed fields are carried, not whole records.
+
+    When class of record changed (e.g. InterfaceInfo to LinuxInterfaceInfo), all fields of new record are carried.
+    """
+
+    key: Hashable
+    fields: dict[str, tuple[Any, Any]]  # field name: (old value, new value)
+    record_class: type  # class of new record
+
+    @property
+    def changes(self) -> dict[str, Any]:
+        """New values of changed fields."""
+        return {name: new for name, (_, new) in self.fields.items()}
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """Difference between two snapshots of interface inventory."""
+
+    added: dict[Hashable, InterfaceInfo] = field(default_factory=dict)
+    removed: dict[Hashable, InterfaceInfo] = field(default_factory=dict)
+    changed: dict[Hashable, RecordChange] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self, compact: bool = False) -> dict:
+        """
+        Encode diff to dict of JSON primitives with codecs of serialization module, so it can be stored or sent.
+
+        :param compact: Whether to encode value types as packed ints instead of canonical strings.
+        :return: Encoded diff, records and changes are tagged with their class names.
+        :raises TypeError: When identity key contains value which can't be encoded.
+        """
+        return {
+            "added": [_encode_record(identity, record, compact) for identity, record in self.added.items()],
+            "removed": [_encode_record(identity, record, compact) for identity, record in self.removed.items()],
+            "changed": [_encode_change(change, compact) for change in self.changed.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, diff_dict: dict, compact: bool = False) -> "SnapshotDiff":
+        """
+        Decode diff from dict of JSON primitives.
+
+        :param diff_dict: Diff encoded by to_dict.
+        :param compact: Whether value types are encoded as packed ints instead of canonical strings.
+        :return: Diff, which can be applied to snapshot.
+        :raises ValueError: When record class or field is unknown.
+        """
+        record_classes = _record_classes()
+        diff = cls()
+        for encoded in diff_dict["added"]:
+            diff.added[_decode_key(encoded["key"], compact)] = _decode_record(encoded, record_classes, compact)
+        for encoded in diff_dict["removed"]:
+            diff.removed[_decode_key(encoded["key"], compact)] = _decode_record(encoded, record_classes, compact)
+        for encoded in diff_dict["changed"]:
+            change = _decode_change(encoded, record_classes, compact)
+            diff.changed[change.key] = change
+        return diff
+
+
+class InterfaceSnapshot:
+    """
+    Immutable snapshot of interface inventory.
+
+    Every record is fingerprinted by identity key and content hash of its field values,
+    so snapshots can be compared in O(n). Records shouldn't be modified after taking snapshot.
+    """
+
+    def __init__(
+        self, interfaces: Iterable[InterfaceInfo], key: Callable[[InterfaceInfo], Hashable] = default_identity_key
+    ) -> None:
+        """
+        Take snapshot.
+
+        :param interfaces: Interfaces to take snapshot of.
+        :param key: Function returning identity of interface, unique within snapshot.
+        :raises ValueError: When identity key is not unique.
+        """
+        self.key = key
+        self._entries: dict[Hashable, _Entry] = {}
+        for interface in interfaces:
+            self._add(interface)
+
+    def _add(self, interface: InterfaceInfo) -> None:
+        identity = self.key(interface)
+        if identity in self._entries:
+            raise ValueError(f"Identity key {identity} is not unique in snapshot")
+        values = (type(interface),) + tuple(_freeze(getattr(interface, name)) for name in _field_names(type(interface)))
+        self._entries[identity] = _Entry(interface, values, _fingerprint(interface))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[InterfaceInfo]:
+        return (entry.record for entry in self._entries.values())
+
+    def __contains__(self, identity: Hashable) -> bool:
+        return identity in self._entries
+
+    def __getitem__(self, identity: Hashable) -> InterfaceInfo:
+        return self._entries[identity].record
+
+    def keys(self) -> Iterator[Hashable]:
+        """Get identity keys of records."""
+        return iter(self._entries)
+
+    def content_hash(self, identity: Hashable) -> int:
+        """
+        Get content hash of record, the same in every process for equal records, so it can be stored or sent.
+
+        :param identity: Identity key of record.
+        :return: 64-bit BLAKE2b hash of field values of record.
+        """
+        return self._entries[identity].content_hash
+
+    def diff(self, newer: "InterfaceSnapshot") -> SnapshotDiff:
+        """
+        Compare snapshot with newer one.
+
+        :param newer: Snapshot taken later.
+        :return: Added, removed and changed (with per-field deltas) records.
+        """
+        diff = SnapshotDiff()
+        for identity, new_entry in newer._entries.items():
+            old_entry = self._entries.get(identity)
+            if old_entry is None:
+                diff.added[identity] = new_entry.record
+            elif old_entry.content_hash != new_entry.content_hash or old_entry.values != new_entry.values:
+                diff.changed[identity] = RecordChange(
+                    identity, _field_deltas(old_entry, new_entry), type(new_entry.record)
+                )
+        for identity, old_entry in self._entries.items():
+            if identity not in newer._entries:
+                diff.removed[identity] = old_entry.record
+        return diff
+
+    def apply(self, diff: SnapshotDiff) -> "InterfaceSnapshot":
+        """
+        Build snapshot with diff applied, so chain of diffs can be applied to base snapshot.
+
+        Changed records are rebuilt from old records and new values of changed fields only,
+        or created from all new values when class of record changed.
+
+        :param diff: Diff between this snapshot and newer one.
+        :return: New snapshot.
+        :raises KeyError: When diff doesn't match this snapshot.
+        """
+        records = {identity: entry.record for identity, entry in self._entries.items()}
+        for identity in diff.removed:
+            del records[identity]
+        for identity, change in diff.changed.items():
+            if type(records[identity]) is change.record_class:
+                records[identity] = replace(records[identity], **change.changes)
+            else:
+                records[identity] = change.record_class(**change.changes)
+        records.update(diff.added)
+        return InterfaceSnapshot(records.values(), key=self.key)
+
+
+def _field_deltas(old_entry: _Entry, new_entry: _Entry) -> dict[str, tuple[Any, Any]]:
+    """Get (old value, new value) of fields which differ between records."""
+    new_names = _field_names(type(new_entry.record))
+    if type(old_entry.record) is type(new_entry.record):
+        return {
+            name: (getattr(old_entry.record, name), getattr(new_entry.record, name))
+            for name, old_value, new_value in zip(new_names, old_entry.values[1:], new_entry.values[1:])
+            if old_value is not new_value and old_value != new_value
+        }
+    return {name: (getattr(old_entry.record, name, None), getattr(new_entry.record, name)) for name in new_names}
+
+
+def _record_classes() -> dict[str, type]:
+    """Get InterfaceInfo, its slotted variant and their subclasses by names, which tag encoded records."""
+    record_classes = {}
+    pending = [InterfaceInfo, SlottedInterfaceInfo]
+    while pending:
+        record_class = pending.pop()
+        record_classes[record_class.__name__] = record_class
+        pending.extend(record_class.__subclasses__())
+    return record_classes
+
+
+def _get_record_class(name: str, record_classes: dict[str, type]) -> type:
+    try:
+        return record_classes[name]
+    except KeyError:
+        raise ValueError(f"Unknown record class: {name}") from None
+
+
+@lru_cache(maxsize=None)
+def _field_codecs(cls: type, compact: bool) -> dict[str, tuple[Encoder, Decoder] | None]:
+    return {f.name: get_value_codec(resolve_field_type(f, cls), compact) for f in fields(cls)}
+
+
+def _encode_key(key: Hashable, compact: bool) -> Any:
+    """Encode identity key, tuples are encoded as lists and value types as {"type": name, "value": encoded}."""
+    if isinstance(key, tuple):
+        return [_encode_key(item, compact) for item in key]
+    if key is None or isinstance(key, (str, int, float)):
+        return key
+    for name, value_type in _KEY_VALUE_TYPES.items():
+        if isinstance(key, value_type):
+            return {"type": name, "value": get_value_codec(value_type, compact)[0](key)}
+    raise TypeError(f"Cannot encode identity key value of type {type(key).__name__}")
+
+
+def _decode_key(encoded: Any, compact: bool) -> Hashable:
+    if isinstance(encoded, list):
+        return tuple(_decode_key(item, compact) for item in encoded)
+    if isinstance(encoded, dict):
+        return get_value_codec(_KEY_VALUE_TYPES[encoded["type"]], compact)[1](encoded["value"])
+    return encoded
+
+
+def _encode_record(identity: Hashable, record: InterfaceInfo, compact: bool) -> dict:
+    return {"key": _encode_key(identity, compact), "class": type(record).__name__, "record": to_dict(record, compact)}
+
+
+def _decode_record(encoded: dict, record_classes: dict[str, type], compact: bool) -> InterfaceInfo:
+    return from_dict(encoded["record"], _get_record_class(encoded["class"], record_classes), compact)
+
+
+def _encode_change(change: RecordChange, compact: bool) -> dict:
+    codecs = _field_codecs(change.record_class, compact)
+    encoded_fields = {}
+    for name, values in change.fields.items():
+        codec = codecs[name]
+        encoded_fields[name] = [value if codec is None or value is None else codec[0](value) for value in values]
+    return {"key": _encode_key(change.key, compact), "class": change.record_class.__name__, "fields": encoded_fields}
+
+
+def _decode_change(encoded: dict, record_classes: dict[str, type], compact: bool) -> RecordChange:
+    record_class = _get_record_class(encoded["class"], record_classes)
+    codecs = _field_codecs(record_class, compact)
+    decoded_fields = {}
+    for name, values in encoded["fields"].items():
+        if name not in codecs:
+            raise ValueError(f"Cannot decode change of {record_class.__name__}: unknown field {name!r}")
+        codec = codecs[name]
+        old, new = (value if codec is None or value is None else codec[1](value) for value in values)
+        decoded_fields[name] = (old, new)
+    return RecordChange(_decode_key(encoded["key"], compact), decoded_fields, record_class)
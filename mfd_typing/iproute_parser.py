@@ -0,0 +1,175 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for loading `ip -json -details link show` / `ip -json addr show` output into LinuxInterfaceInfo.
+
+Output is decoded link by link with iter_json_array, so whole JSON document is never held in memory.
+"""
+
+import io
+import json
+import re
+from typing import IO, Any, Iterator, Mapping
+
+from .mac_address import MACAddress
+from .network_interface import InterfaceType, LinuxInterfaceInfo, VlanInterfaceInfo
+from .pci_address import PCIAddress
+
+_json_decoder = json.JSONDecoder()
+_skip_whitespace = re.compile(r"[ \t\n\r]*").match
+_skip_separator = re.compile(r"[ \t\n\r]*,[ \t\n\r]*").match
+# longest tail of buffer which may be prefix of a token instead of an error, e.g. "fals" or "\\u12"
+_max_partial_token = 5
+
+# linkinfo info_kind of virtual devices, which are not classified by other rules
+_virtual_kinds = frozenset({"bridge", "macvlan", "macvtap", "veth", "dummy", "vxlan", "ipvlan", "tun", "team"})
+
+
+def iter_json_array(stream: IO[str], chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Decode top-level JSON array from text stream element by element.
+
+    Only currently decoded element and one chunk are held in memory. Element split between chunks is decoded again
+    after reading as many characters as already buffered, so elements of any size are decoded in linear time.
+
+    :param stream: Text stream with JSON array.
+    :param chunk_size: Number of characters read at once.
+    :return: Iterator over elements of array.
+    :raises ValueError: When stream doesn't contain valid JSON array, e.g. has missing or extra commas
+                        or data after array.
+    """
+    buffer = ""
+    position = 0
+
+    def read_more(size: int = chunk_size) -> bool:
+        nonlocal buffer, position
+        chunk = stream.read(size)
+        if not chunk:
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def next_char() -> str:
+        """Skip whitespace, return next character or empty string at end of stream."""
+        nonlocal position
+        while True:
+            position = _skip_whitespace(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if not read_more():
+                return ""
+
+    def decode_element() -> Any:
+        nonlocal position
+        while True:
+            try:
+                element, end = _json_decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                # only error at the end of buffer may be caused by element continuing in next chunk
+                truncated = e.msg.startswith("Unterminated string") or len(buffer) - e.pos <= _max_partial_token
+                if truncated and read_more(max(chunk_size, len(buffer) - position)):
+                    continue
+                raise
+            if len(buffer) - end <= _max_partial_token and type(element) in (int, float):
+                # number at the end of buffer may continue in next chunk, e.g. "1." or "1e"
+                if read_more(max(chunk_size, len(buffer) - position)):
+                    continue
+            position = end
+            return element
+
+    char = next_char()
+    if char != "[":
+        raise ValueError(f"Expected JSON array, got {char or 'end of data'!r}")
+    position += 1
+    char = next_char()
+    if char == "]":
+        position += 1
+    else:
+        while True:
+            if char in ("]", ","):
+                raise ValueError(f"Expected array element, got {char!r}")
+            yield decode_element()
+            # fast path: separator and start of next element are already buffered
+            separator = _skip_separator(buffer, position)
+            if separator is not None and separator.end() < len(buffer):
+                position = separator.end()
+                char = buffer[position]
+                continue
+            char = next_char()
+            if char == "]":
+                position += 1
+                break
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' after array element, got {char or 'end of data'!r}")
+            position += 1
+            char = next_char()
+    char = next_char()
+    if char:
+        raise ValueError(f"Extra data after JSON array: {char!r}")
+
+
+def link_to_interface_info(link: dict, namespace: str | None = None) -> LinuxInterfaceInfo:
+    """
+    Map single link object of `ip -json -details` output to LinuxInterfaceInfo.
+
+    :param link: Decoded link object.
+    :param namespace: Network namespace in which command was executed.
+    :return: Interface info.
+    """
+    linkinfo = link.get("linkinfo", {})
+    kind = linkinfo.get("info_kind")
+    pci_address = PCIAddress(data=link["parentdev"]) if link.get("parentbus") == "pci" else None
+
+    if kind == "vlan":
+        interface_type = InterfaceType.VLAN
+    elif kind == "bond":
+        interface_type = InterfaceType.BOND
+    elif linkinfo.get("info_slave_kind") == "bond":
+        interface_type = InterfaceType.BOND_SLAVE
+    elif kind in _virtual_kinds or link.get("link_type") == "loopback":
+        interface_type = InterfaceType.VIRTUAL_DEVICE
+    elif pci_address is not None:
+        interface_type = InterfaceType.PF
+    else:
+        interface_type = InterfaceType.GENERIC
+
+    vlan_info = None
+    if kind == "vlan":
+        vlan_info = VlanInterfaceInfo(vlan_id=linkinfo.get("info_data", {}).get("id"), parent=link.get("link"))
+
+    mac_address = None
+    if link.get("link_type") == "ether" and link.get("address"):
+        mac_address = MACAddress(link["address"])
+
+    return LinuxInterfaceInfo(
+        pci_address=pci_address,
+        name=link.get("ifname"),
+        interface_type=interface_type,
+        mac_address=mac_address,
+        vlan_info=vlan_info,
+        namespace=namespace,
+    )
+
+
+def iter_ip_links(output: str | IO[str], namespace: str | None = None) -> Iterator[LinuxInterfaceInfo]:
+    """
+    Load interfaces from `ip -json -details link show` or `ip -json addr show` output in one pass.
+
+    :param output: Output or text stream with it, e.g. stdout of process.
+    :param namespace: Network namespace in which command was executed.
+    :return: Iterator over interfaces.
+    """
+    stream = io.StringIO(output) if isinstance(output, str) else output
+    for link in iter_json_array(stream):
+        yield link_to_interface_info(link, namespace)
+
+
+def load_ip_links(outputs: Mapping[str | None, str | IO[str]]) -> list[LinuxInterfaceInfo]:
+    """
+    Load interfaces from outputs of `ip -json -details link show` executed in many namespaces.
+
+    :param outputs: Namespace (None for default one): output or text stream with it.
+    :return: Interfaces from all namespaces.
+    """
+    return [interface for namespace, output in outputs.items() for interface in iter_ip_links(output, namespace)]
@@ -40,6 +40,35 @@ class MACAddress(EUI):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self}')"
 
+    @classmethod
+    def from_int(cls, value: int, dialect: Type[mac_eui48] = mac_unix_expanded) -> "MACAddress":
+        """
+        Create MACAddress from int without parsing done by constructor, only range of value is checked.
+
+        :param value: MAC address as 48-bit int.
+        :param dialect: Style which will be used to convert the object to string, default leading zeroes
+        :return: MAC address.
+        :raises ValueError: When value is out of 48-bit range.
+        """
+        if not 0 <= value < 1 << 48:
+            raise ValueError(f"{value} is not a correct MAC 48b format")
+        mac_address = cls.__new__(cls)
+        mac_address.__setstate__((value, 48, dialect))
+        return mac_address
+
+    def __reduce__(self) -> tuple:
+        # pickled as int, dialect only when it's not the default one
+        if type(self) is MACAddress and self._dialect is mac_unix_expanded:
+            return _unpickle_mac_address, (self._value,)
+        return _unpickle_mac_address, (self._value, self._dialect, type(self))
+
+
+def _unpickle_mac_address(
+    value: int, dialect: Type[mac_eui48] = mac_unix_expanded, cls: Type[MACAddress] = MACAddress
+) -> MACAddress:
+    """Rebuild pickled MACAddress, value was validated when pickled object was created."""
+    return cls.from_int(value, dialect)
+
 
 def get_random_mac() -> MACAddress:
     """
@@ -0,0 +1,215 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for profiling memory footprint of mfd_typing object graphs.
+
+profile() walks objects reachable from roots (dataclass fields, `__slots__`, `__dict__` and items of containers)
+and counts every object once, so objects shared between records are not counted twice.
+Classes, modules, functions and enum members (e.g. netaddr dialect and strategy module of MACAddress) are shared
+by all instances and are not counted.
+measure_allocations() reports allocations done by building objects, measured with tracemalloc.
+
+>>> report = profile(interfaces)
+>>> print(report.format())
+"""
+
+import sys
+import tracemalloc
+import types
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Hashable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# objects which are not owned by records
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, Enum)
+# immutable values which are cached by interpreter or too small to intern
+_NOT_INTERNED_TYPES = (bool, int, float, type(None))
+
+
+@dataclass
+class TypeStats:
+    """Memory of objects of single type."""
+
+    count: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class DuplicateStats:
+    """Equal objects of single type, which could be replaced by one interned object."""
+
+    count: int = 0  # number of redundant copies
+    bytes: int = 0  # retained bytes of redundant copies, nested duplicates are included in their parents too
+
+
+@dataclass
+class MemoryReport:
+    """Result of profile()."""
+
+    total_bytes: int = 0
+    object_count: int = 0
+    shared_count: int = 0  # objects referenced more than once
+    by_type: dict[str, TypeStats] = field(default_factory=dict)
+    by_field: dict[str, int] = field(default_factory=dict)  # "Class.field": retained bytes
+    duplicates: dict[str, DuplicateStats] = field(default_factory=dict)
+
+    def format(self, top: int = 20) -> str:
+        """
+        Format report as text table.
+
+        :param top: Number of biggest entries listed in every section.
+        :return: Report.
+        """
+        lines = [f"{self.object_count} objects, {self.total_bytes} B, {self.shared_count} shared", "", "per type:"]
+        by_type = sorted(self.by_type.items(), key=lambda item: item[1].bytes, reverse=True)[:top]
+        lines += [f"  {name:<40} {stats.count:>10} {stats.bytes:>14} B" for name, stats in by_type]
+        lines += ["", "per field (retained):"]
+        by_field = sorted(self.by_field.items(), key=lambda item: item[1], reverse=True)[:top]
+        lines += [f"  {name:<40} {size:>25} B" for name, size in by_field]
+        lines += ["", "duplicates (removable by interning):"]
+        duplicates = sorted(self.duplicates.items(), key=lambda item: item[1].bytes, reverse=True)[:top]
+        lines += [f"  {name:<40} {stats.count:>10} {stats.bytes:>14} B" for name, stats in duplicates]
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _attribute_names(cls: type) -> tuple[str, ...]:
+    """Get names of dataclass fields and slots of class."""
+    names = [f.name for f in fields(cls)] if is_dataclass(cls) else []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def _size(obj: Any) -> int:
+    """
+    Get size of object itself, with its instance dictionary.
+
+    Since Python 3.11 attributes may be stored inline until `__dict__` is accessed, so size is an upper bound.
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(type(obj), "__dictoffset__") and type(obj).__dictoffset__ and not isinstance(obj, type):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _references(obj: Any) -> Iterator[tuple[str | None, Any]]:
+    """Get (attribute name or None for container items, referenced object) pairs."""
+    if isinstance(obj, (str, bytes, *_NOT_INTERNED_TYPES)):
+        return
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield None, key
+            yield None, value
+        return
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            yield None, item
+        return
+    for name in _attribute_names(type(obj)):
+        try:
+            yield name, object.__getattribute__(obj, name)
+        except AttributeError:  # unset slot
+            continue
+    instance_dict = getattr(obj, "__dict__", None) if hasattr(type(obj), "__dictoffset__") else None
+    if isinstance(instance_dict, dict):
+        for name, value in instance_dict.items():
+            yield name, value
+
+
+def _value_key(obj: Any) -> Hashable | None:
+    """Get key of equal objects, None for objects which are not candidates for interning."""
+    if isinstance(obj, _NOT_INTERNED_TYPES + _SHARED_TYPES + (list, dict, set)):
+        return None
+    if is_dataclass(obj):
+        values = []
+        for name in _attribute_names(type(obj)):
+            value = getattr(obj, name, None)
+            key = value if isinstance(value, _NOT_INTERNED_TYPES + (Enum,)) else _value_key(value)
+            if key is None and value is not None:
+                return None
+            values.append(key)
+        return type(obj), tuple(values)
+    try:
+        return type(obj), obj, hash(obj)
+    except TypeError:
+        return None
+
+
+def profile(roots: Iterable[Any]) -> MemoryReport:
+    """
+    Profile memory of object graphs.
+
+    :param roots: Objects to profile, e.g. list of interfaces. Iterable itself is not counted.
+    :return: Report with retained bytes per type and field and duplicates of equal objects.
+    """
+    report = MemoryReport()
+    seen: set[int] = set()
+    shared: set[int] = set()
+    first_copies: set[Hashable] = set()  # value keys of already seen objects
+    keep_alive = []  # ids are unique only as long as objects are alive
+
+    def visit(obj: Any) -> int:
+        """Count object and not yet seen objects reachable from it, return their bytes."""
+        identity = id(obj)
+        if identity in seen:
+            shared.add(identity)
+            return 0
+        seen.add(identity)
+        keep_alive.append(obj)
+        size = _size(obj)
+        type_name = type(obj).__qualname__
+        stats = report.by_type.setdefault(type_name, TypeStats())
+        stats.count += 1
+        stats.bytes += size
+        retained = size
+        for name, child in _references(obj):
+            if isinstance(child, _SHARED_TYPES):
+                continue
+            child_retained = visit(child)
+            retained += child_retained
+            if name is not None and child_retained:
+                field_name = f"{type_name}.{name}"
+                report.by_field[field_name] = report.by_field.get(field_name, 0) + child_retained
+        key = _value_key(obj)
+        if key is not None:
+            if key in first_copies:
+                duplicate = report.duplicates.setdefault(type_name, DuplicateStats())
+                duplicate.count += 1
+                duplicate.bytes += retained
+            else:
+                first_copies.add(key)
+        return retained
+
+    for root in roots:
+        report.total_bytes += visit(root)
+    report.object_count = len(seen)
+    report.shared_count = len(shared)
+    return report
+
+
+def measure_allocations(factory: Callable[[], T], top: int = 10) -> tuple[T, int, list[tracemalloc.Statistic]]:
+    """
+    Measure memory allocated by building objects, with tracemalloc.
+
+    :param factory: Function building objects, e.g. parsing inventory.
+    :param top: Number of biggest allocation sites returned.
+    :return: Result of factory, allocated bytes still alive after the call and biggest allocation sites.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = factory()
+    after = tracemalloc.take_snapshot()
+    if not was_tracing:
+        tracemalloc.stop()
+    statistics = [stat for stat in after.compare_to(before, "lineno") if stat.size_diff > 0]
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, allocated, statistics[:top]
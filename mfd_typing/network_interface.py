@@ -6,7 +6,10 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from uuid import UUID
 
-from mfd_typing import PCIAddress, PCIDevice, MACAddress
+from .dataclass_utils import slotted_variant
+from .mac_address import MACAddress
+from .pci_address import PCIAddress
+from .pci_device import PCIDevice
 
 
 class InterfaceType(Enum):
@@ -109,6 +112,15 @@ class WindowsInterfaceInfo(InterfaceInfo):
     cluster_info: ClusterInfo | None = None
 
 
+# variants without per-instance __dict__, for keeping many objects in memory, convert with dataclass_utils.to_slotted
+SlottedVlanInterfaceInfo = slotted_variant(VlanInterfaceInfo)
+SlottedVsiInfo = slotted_variant(VsiInfo)
+SlottedClusterInfo = slotted_variant(ClusterInfo)
+SlottedInterfaceInfo = slotted_variant(InterfaceInfo)
+SlottedLinuxInterfaceInfo = slotted_variant(LinuxInterfaceInfo, base=SlottedInterfaceInfo)
+SlottedWindowsInterfaceInfo = slotted_variant(WindowsInterfaceInfo, base=SlottedInterfaceInfo)
+
+
 # WindowsInterfaceInfo field matched with PowerShell name of property
 win_interface_properties = {
     "description": "Description",
@@ -0,0 +1,218 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for NUMA locality of PCI devices: local NUMA node and local CPUs, keyed by PCIAddress.
+
+Locality of all devices listed in `/sys/bus/pci/devices` is read once, lookups are dictionary lookups.
+Maps are cached per root by get_locality_map(). After hot-plug, refresh() reads only added devices and drops removed
+ones; lookup of address which is not in map refreshes map once before failing, so newly plugged devices are found.
+Address still missing after that is remembered as missing until next explicit refresh(), so repeated lookups
+of absent devices don't list sysfs again.
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from .cpu_topology import CPUSet, CPUTopology
+from .network_interface import InterfaceInfo
+from .pci_address import PCIAddress, pci_address_full_hex_regex
+from .sysfs_utils import read_sysfs, write_sysfs
+
+SYS_BUS_PCI_DEVICES = "sys/bus/pci/devices"
+SYS_DEVICES = "sys/devices"
+
+_pci_address_regex = re.compile(pci_address_full_hex_regex)
+
+
+class DeviceLocality(NamedTuple):
+    """NUMA locality of PCI device."""
+
+    numa_node: int | None  # None when platform doesn't report node of device
+    local_cpus: CPUSet
+
+
+class NUMALocalityMap:
+    """Locality of PCI devices of host, read from sysfs."""
+
+    def __init__(self, root: str | Path = "/", topology: CPUTopology | None = None) -> None:
+        """
+        Read locality of all PCI devices.
+
+        :param root: Root of file system.
+        :param topology: CPU topology, used for CPUs of node when device has no `local_cpulist`.
+        """
+        self.root = root
+        self.topology = topology
+        self._devices_path = os.path.join(root, SYS_BUS_PCI_DEVICES)
+        # keyed by packed address, as hashing and comparing PCIAddress is much slower than int
+        self._localities: dict[int, DeviceLocality] = {}
+        self._addresses: dict[int, PCIAddress] = {}
+        self._entries: dict[str, int] = {}  # directory entry: its packed address
+        self._missing: set[int] = set()  # packed addresses not found by refresh on lookup
+        self._cpusets: dict[str, CPUSet] = {}  # cpulist: shared CPUSet, devices of one node have the same cpulist
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def _read_locality(self, entry: str) -> DeviceLocality:
+        device_path = os.path.join(self._devices_path, entry)
+        node = int(read_sysfs(os.path.join(device_path, "numa_node"), missing_ok=True) or -1)
+        numa_node = node if node >= 0 else None
+        cpulist = read_sysfs(os.path.join(device_path, "local_cpulist"), missing_ok=True)
+        if cpulist is not None:
+            local_cpus = self._cpusets.get(cpulist)
+            if local_cpus is None:
+                local_cpus = self._cpusets[cpulist] = CPUSet.from_cpulist(cpulist)
+        elif numa_node is not None and self.topology is not None and numa_node in self.topology.nodes:
+            local_cpus = self.topology.node_cpus(numa_node)
+        else:
+            local_cpus = CPUSet()
+        return DeviceLocality(numa_node, local_cpus)
+
+    def refresh(self) -> tuple[list[PCIAddress], list[PCIAddress]]:
+        """
+        Synchronize map with devices present in sysfs, only added devices are read.
+
+        Addresses remembered as missing by lookups are forgotten, so they're looked up in sysfs again.
+
+        :return: Added and removed devices.
+        """
+        added, removed = self._synchronize()
+        with self._lock:
+            self._missing.clear()
+        return added, removed
+
+    def _synchronize(self) -> tuple[list[PCIAddress], list[PCIAddress]]:
+        try:
+            entries = set(os.listdir(self._devices_path))
+        except FileNotFoundError:
+            entries = set()
+        with self._lock:
+            removed = []
+            for entry in self._entries.keys() - entries:
+                key = self._entries.pop(entry)
+                del self._localities[key]
+                removed.append(self._addresses.pop(key))
+            added = []
+            for entry in sorted(entries - self._entries.keys()):
+                match = _pci_address_regex.match(entry)
+                if not match:
+                    continue
+                pci_address = PCIAddress(*(int(match.group(name), 16) for name in ("domain", "bus", "slot", "func")))
+                key = pci_address.packed
+                self._localities[key] = self._read_locality(entry)
+                self._addresses[key] = pci_address
+                self._entries[entry] = key
+                added.append(pci_address)
+        return added, removed
+
+    def locality(self, pci_address: PCIAddress) -> DeviceLocality:
+        """
+        Get locality of PCI device.
+
+        :param pci_address: Address of device.
+        :return: Locality.
+        :raises KeyError: When device isn't present, also after refresh.
+        """
+        key = pci_address.packed
+        locality = self._localities.get(key)
+        if locality is None:
+            if key not in self._missing:
+                self._synchronize()  # device may have been hot-plugged since map was read
+                locality = self._localities.get(key)
+            if locality is None:
+                with self._lock:
+                    self._missing.add(key)
+                raise KeyError(f"PCI device {pci_address} is not present")
+        return locality
+
+    def numa_node(self, pci_address: PCIAddress) -> int | None:
+        """Get local NUMA node of PCI device, None when not reported by platform."""
+        return self.locality(pci_address).numa_node
+
+    def local_cpus(self, pci_address: PCIAddress) -> CPUSet:
+        """Get CPUs local to PCI device."""
+        return self.locality(pci_address).local_cpus
+
+    def interface_locality(self, interface: InterfaceInfo) -> DeviceLocality:
+        """
+        Get locality of interface, by PCI address of its device.
+
+        :param interface: Interface info.
+        :return: Locality.
+        :raises ValueError: When interface has no PCI address, e.g. virtual interface.
+        """
+        if interface.pci_address is None:
+            raise ValueError(f"Interface {interface.name} has no PCI address")
+        return self.locality(interface.pci_address)
+
+    def devices_on_node(self, numa_node: int) -> list[PCIAddress]:
+        """Get sorted addresses of PCI devices local to NUMA node."""
+        return sorted(
+            self._addresses[key] for key, locality in self._localities.items() if locality.numa_node == numa_node
+        )
+
+    def __len__(self) -> int:
+        return len(self._localities)
+
+    def __contains__(self, pci_address: PCIAddress) -> bool:
+        return pci_address.packed in self._localities
+
+
+_maps: dict[str, NUMALocalityMap] = {}
+_maps_lock = threading.Lock()
+
+
+def get_locality_map(root: str | Path = "/", topology: CPUTopology | None = None) -> NUMALocalityMap:
+    """
+    Get cached locality map of root, map is read on first call.
+
+    :param root: Root of file system.
+    :param topology: CPU topology passed to map, cached map is read again when it was created with other topology.
+    :return: Locality map.
+    """
+    key = os.path.abspath(root)
+    with _maps_lock:
+        locality_map = _maps.get(key)
+        if locality_map is None or (topology is not None and locality_map.topology is not topology):
+            locality_map = _maps[key] = NUMALocalityMap(root, topology)
+    return locality_map
+
+
+def invalidate_locality_cache(root: str | Path | None = None) -> None:
+    """
+    Drop cached locality maps, e.g. on hot-plug event when whole map should be read again.
+
+    :param root: Root of file system which map is dropped, all maps if not passed.
+    """
+    with _maps_lock:
+        if root is None:
+            _maps.clear()
+        else:
+            _maps.pop(os.path.abspath(root), None)
+
+
+def create_fake_pci_locality(
+    root: str | Path, pci_address: PCIAddress, numa_node: int | None, local_cpus: CPUSet | None = None
+) -> None:
+    """
+    Create fake sysfs locality entries of PCI device, in layout read by NUMALocalityMap, e.g. for tests.
+
+    Device directory is the same as created by sysfs_scanner.create_fake_sysfs_interface.
+
+    :param root: Root of fake file system.
+    :param pci_address: Address of device.
+    :param numa_node: Local node of device, None for platform not reporting it (`-1` in sysfs).
+    :param local_cpus: Local CPUs, `local_cpulist` file isn't created if not passed.
+    """
+    root = Path(root)
+    device_path = root / SYS_DEVICES / f"pci{pci_address.domain:04x}:00" / pci_address.lspci
+    write_sysfs(device_path / "numa_node", str(-1 if numa_node is None else numa_node))
+    if local_cpus is not None:
+        write_sysfs(device_path / "local_cpulist", local_cpus.cpulist)
+    link = root / SYS_BUS_PCI_DEVICES / pci_address.lspci
+    if not link.is_symlink():
+        link.parent.mkdir(parents=True, exist_ok=True)
+        link.symlink_to(device_path)
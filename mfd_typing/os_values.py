@@ -5,6 +5,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from .dataclass_utils import slotted_variant
+
 
 class WindowsFlavour(Enum):
     """Available Windows System Flavours."""
@@ -64,5 +66,9 @@ class SystemInfo:
     architecture_info: str | None = None  # x86_64
 
 
+# variant without per-instance __dict__, see dataclass_utils.slotted_variant
+SlottedSystemInfo = slotted_variant(SystemInfo)
+
+
 # dict of OS names of switches and their regexes
 SWITCHES_OS_NAME_REGEXES = {OSName.MELLANOX: [r"Onyx", r"SX_PPC_M460EX", r"MLNX-OS"]}
@@ -0,0 +1,248 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for parallel ingestion of large archived command outputs.
+
+File is memory-mapped and split into chunks at record boundaries (separator of RecordFormat found after every
+chunk_size bytes), chunks are parsed in process pool and results are merged in order of chunks. Workers map
+the file themselves, only offsets of chunk are sent to them; parsed records are sent back pickled, where value types
+are packed ints, or encoded in wire format when `packed=True`.
+
+Formats of archives:
+
+* `lspci` - `lspci -Dn` output, record is (PCIAddress, PCIDevice) tuple,
+* `ip_json_lines` - outputs of `ip -json -details link show`, one JSON array per line,
+* `powershell_format_list` - `Get-CimInstance Win32_NetworkAdapter | Format-List` output,
+* `jsonl` - compact JSON Lines of LinuxInterfaceInfo written with serialization.dump_jsonl.
+
+>>> result = ingest("links.jsonl", "ip_json_lines", workers=8)
+>>> print(f"{result.stats.bytes_per_second / 2**20:.0f} MiB/s")
+"""
+
+import json
+import mmap
+import os
+import re
+import time
+from bisect import bisect_right
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from .iproute_parser import link_to_interface_info
+from .network_interface import LinuxInterfaceInfo, WindowsInterfaceInfo
+from .pci_address import PCIAddress
+from .pci_device import PCIDevice
+from .powershell_parser import parse_format_list
+from .serialization import iter_jsonl
+from .wire_format import RecordTable, decode_records, encode_records
+
+DEFAULT_CHUNK_SIZE = 64 * 2**20
+MIN_CHUNK_SIZE = 2**20
+
+_lspci_line = re.compile(
+    r"^(?P<domain>[0-9a-fA-F]{4,8}):(?P<bus>[0-9a-fA-F]{2}):(?P<slot>[0-9a-fA-F]{2})\.(?P<func>[0-7]) [0-9a-fA-F]{4}: "
+    r"(?P<vendor_id>[0-9a-fA-F]{4}):(?P<device_id>[0-9a-fA-F]{4})",
+    re.MULTILINE,
+)
+
+
+class RecordFormat(NamedTuple):
+    """Format of archive: separator of records and parser of chunk of whole records."""
+
+    separator: bytes  # regex, chunk ends after its first match found after chunk_size bytes
+    parse: Callable[[str], list]  # must be picklable, e.g. module-level function
+    record_class: type | None = None  # class of records, required for packed results
+
+
+def parse_lspci(output: str) -> list[tuple[PCIAddress, PCIDevice]]:
+    """
+    Parse `lspci -Dn` output, lines which are not device lines are skipped.
+
+    :param output: Output, e.g. `0000:18:00.0 0200: 8086:1592 (rev 02)` lines.
+    :return: PCI address and device of every line.
+    """
+    return [
+        (
+            PCIAddress(*(int(match.group(name), 16) for name in ("domain", "bus", "slot", "func"))),
+            PCIDevice(int(match.group("vendor_id"), 16), int(match.group("device_id"), 16)),
+        )
+        for match in _lspci_line.finditer(output)
+    ]
+
+
+def parse_ip_json_lines(output: str) -> list[LinuxInterfaceInfo]:
+    """
+    Parse `ip -json -details link show` outputs, one JSON array per line.
+
+    :param output: Lines with outputs.
+    :return: Interfaces from all outputs.
+    """
+    return [link_to_interface_info(link) for line in output.splitlines() if line.strip() for link in json.loads(line)]
+
+
+def parse_interfaces_jsonl(output: str) -> list[LinuxInterfaceInfo]:
+    """
+    Parse compact JSON Lines of LinuxInterfaceInfo.
+
+    :param output: Lines with objects.
+    :return: Interfaces.
+    """
+    return list(iter_jsonl(output.splitlines(), LinuxInterfaceInfo, compact=True))
+
+
+def _parse_format_list(output: str) -> list[WindowsInterfaceInfo]:
+    return list(parse_format_list(output))
+
+
+# name: format of archive
+record_formats: dict[str, RecordFormat] = {
+    "lspci": RecordFormat(rb"\n", parse_lspci),
+    "ip_json_lines": RecordFormat(rb"\n", parse_ip_json_lines, LinuxInterfaceInfo),
+    "powershell_format_list": RecordFormat(rb"\r?\n[ \t]*\r?\n", _parse_format_list, WindowsInterfaceInfo),
+    "jsonl": RecordFormat(rb"\n", parse_interfaces_jsonl, LinuxInterfaceInfo),
+}
+
+
+@dataclass(frozen=True)
+class IngestStats:
+    """Statistics of ingestion."""
+
+    bytes: int
+    records: int
+    chunks: int
+    workers: int
+    seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Throughput in bytes of archive per second."""
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        """Throughput in parsed records per second."""
+        return self.records / self.seconds if self.seconds else 0.0
+
+
+class ChunkedRecords(Sequence):
+    """Lazy read-only sequence over chunks encoded in wire format, records are decoded on access."""
+
+    def __init__(self, tables: list[RecordTable]) -> None:
+        """
+        Initialize sequence.
+
+        :param tables: Decoded chunks, in order.
+        """
+        self.tables = tables
+        self._starts = []
+        start = 0
+        for table in tables:
+            self._starts.append(start)
+            start += len(table)
+        self._count = start
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        chunk = bisect_right(self._starts, index) - 1
+        return self.tables[chunk][index - self._starts[chunk]]
+
+
+class IngestResult(NamedTuple):
+    """Records of archive in order and statistics of ingestion."""
+
+    records: list | ChunkedRecords
+    stats: IngestStats
+
+
+def split_chunks(path: str | Path, separator: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """
+    Split file into chunks of whole records.
+
+    :param path: Path to file.
+    :param separator: Regex of records separator.
+    :param chunk_size: Minimal size of chunk, chunk ends after first separator found after it.
+    :return: Start and end offsets of chunks, the last chunk ends at the end of file.
+    """
+    size = os.path.getsize(path)
+    if not size:
+        return []
+    pattern = re.compile(separator)
+    chunks = []
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = 0
+        while start < size:
+            match = pattern.search(mapped, start + chunk_size) if start + chunk_size < size else None
+            end = match.end() if match else size
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def _parse_chunk(path: str, start: int, end: int, record_format: RecordFormat, packed: bool) -> list | bytes:
+    """Parse chunk of file in worker, return records or records encoded in wire format."""
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        text = mapped[start:end].decode()
+    records = record_format.parse(text)
+    return encode_records(records, record_format.record_class) if packed else records
+
+
+def ingest(
+    path: str | Path,
+    record_format: str | RecordFormat,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    packed: bool = False,
+    executor: Executor | None = None,
+) -> IngestResult:
+    """
+    Parse archive in process pool, preserving order of records.
+
+    :param path: Path to archive.
+    :param record_format: Name of one of record_formats or custom format.
+    :param workers: Number of worker processes, CPU count by default; 1 parses in current process.
+    :param chunk_size: Minimal size of chunk, by default file is split into 4 chunks per worker (at least 1 MiB,
+                       at most 64 MiB each) for balanced load.
+    :param packed: Whether workers return records encoded in wire format, decoded lazily on access.
+    :param executor: Executor to use instead of new process pool, e.g. one shared by many ingestions.
+    :return: Records and throughput statistics.
+    :raises ValueError: When packed results are requested for format without wire format record class.
+    """
+    if isinstance(record_format, str):
+        record_format = record_formats[record_format]
+    if packed and record_format.record_class is None:
+        raise ValueError("Packed results require record format with record_class")
+    workers = workers or os.cpu_count() or 1
+    path = os.fspath(path)
+    start_time = time.perf_counter()
+    size = os.path.getsize(path)
+    if chunk_size is None:
+        chunk_size = min(max(size // (workers * 4), MIN_CHUNK_SIZE), DEFAULT_CHUNK_SIZE)
+    chunks = split_chunks(path, record_format.separator, chunk_size)
+    starts, ends = [start for start, _ in chunks], [end for _, end in chunks]
+    arguments = ([path] * len(chunks), starts, ends, [record_format] * len(chunks), [packed] * len(chunks))
+
+    if executor is not None:
+        results = list(executor.map(_parse_chunk, *arguments))
+    elif workers == 1 or len(chunks) <= 1:
+        results = list(map(_parse_chunk, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(_parse_chunk, *arguments))
+
+    if packed:
+        records = ChunkedRecords([decode_records(result) for result in results])
+    else:
+        records = [record for result in results for record in result]
+    stats = IngestStats(size, len(records), len(chunks), workers, time.perf_counter() - start_time)
+    return IngestResult(records, stats)
@@ -3,10 +3,10 @@
 """Module for PCI Address representation."""
 
 import re
-from dataclasses import dataclass, InitVar, fields
+from dataclasses import dataclass, InitVar
 from typing import Optional, Any
 
-from .dataclass_utils import convert_value_field_to_typehint_type
+from .dataclass_utils import convert_fields_to_typehint_types
 
 hex_reg = r"[0-9a-fA-F]"
 _pci_address_without_domain_hex_regex = rf"(?P<bus>{hex_reg}{{2}}):(?P<slot>{hex_reg}{{2}})\.(?P<func>\d+)"
@@ -54,8 +54,7 @@ class PCIAddress:
             raise PCIAddressMissingData(
                 f"There are missing data for provided value because None are not acceptable: {self.__dict__}"
             )
-        for field in fields(self):
-            convert_value_field_to_typehint_type(self, field)
+        convert_fields_to_typehint_types(self)
 
         self._check_domain(value=self.domain)
         self._check_bus(value=self.bus)
@@ -130,9 +129,56 @@ class PCIAddress:
         """nvmcheck-compatible (bus device function) representation."""
         return f"{self.bus:03}/{self.slot:02}/{self.func:02}"
 
+    @property
+    def packed(self) -> int:
+        """Address packed into single int `domain << 24 | bus << 16 | slot << 8 | func`, ordered as addresses."""
+        return self.domain << 24 | self.bus << 16 | self.slot << 8 | self.func
+
+    @staticmethod
+    def pack(domain: int, bus: int, slot: int, func: int) -> int:
+        """
+        Pack fields into single int without creating PCIAddress, the same as packed property.
+
+        :param domain: Domain.
+        :param bus: Bus.
+        :param slot: Slot.
+        :param func: Function.
+        :return: Packed address.
+        """
+        return domain << 24 | bus << 16 | slot << 8 | func
+
+    @classmethod
+    def from_packed(cls, packed: int) -> "PCIAddress":
+        """
+        Create PCIAddress from packed address, without parsing and validation of fields done by constructor.
+
+        Every field unpacked from int in range is in bounds, so only range of int is checked.
+
+        :param packed: Address packed as in packed property.
+        :return: PCIAddress.
+        :raises ValueError: When packed address is out of range.
+        """
+        if not 0 <= packed < 1 << 56:
+            raise ValueError(f"packed PCI address out of bounds: {packed}")
+        pci_address = object.__new__(cls)
+        pci_address.__dict__.update(
+            domain=packed >> 24, bus=packed >> 16 & 0xFF, slot=packed >> 8 & 0xFF, func=packed & 0xFF
+        )
+        return pci_address
+
     def __str__(self) -> str:
         return self.lspci
 
+    def __reduce__(self) -> tuple:
+        # pickled as single packed int, instead of class and field dict
+        packed = self.packed
+        return (_unpickle_pci_address, (packed,) if type(self) is PCIAddress else (packed, type(self)))
+
+
+def _unpickle_pci_address(packed: int, cls: type[PCIAddress] = PCIAddress) -> PCIAddress:
+    """Rebuild pickled PCIAddress, fields were validated when pickled object was created."""
+    return cls.from_packed(packed)
+
 
 class PCIAddressMissingData(Exception):
     """Exception raised for wrong input data providing."""
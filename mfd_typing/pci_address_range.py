@@ -0,0 +1,309 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for ranges of PCI addresses with wildcard and range fields, e.g. all functions of bus 0x3b.
+
+Range is union of disjoint boxes, box has inclusive bounds of domain, bus, slot and func. Containment in single box
+is checked by comparing fields against precomputed bounds; in many boxes by lookup in bitmap of bus, slot and func
+of domain interval, built on first check. Addresses are generated lazily in PCIAddress order.
+
+Notation (hex numbers, as in lspci), ranges separated by comma:
+
+* `0000:3b:*.*` - all slots and functions of bus 0x3b,
+* `0000:3b:00.0-7` - functions 0-7 of slot 0,
+* `0001:*:00-04.*` - slots 0-4 of all buses of domain 1,
+* `3b:00.0` - without domain, domain 0.
+
+>>> PCIAddress(data="0000:3b:00.1") in PCIAddressRange.parse("0000:3b:*.*")
+True
+"""
+
+import heapq
+import re
+from bisect import bisect_right
+from typing import Iterable, Iterator
+
+from .pci_address import PCIAddress
+
+_FIELDS = ("domain", "bus", "slot", "func")
+_LIMITS = ((0, 2**32 - 1), (0, 0xFF), (0, 0x1F), (0, 0x7))
+_WIDTHS = (4, 2, 2, 1)  # hex digits of field in notation
+
+_field = r"\*|[0-9a-fA-F]+(?:-[0-9a-fA-F]+)?"
+_range_regex = re.compile(rf"^(?:(?P<domain>{_field}):)?(?P<bus>{_field}):(?P<slot>{_field})\.(?P<func>{_field})$")
+
+_BITMAP_SIZE = 1 << 16  # bus, slot and func within limits, indexed as bus << 8 | slot << 3 | func
+_EMPTY_BITMAP = bytes(_BITMAP_SIZE)
+
+Bounds = tuple[int, int]
+Box = tuple[Bounds, Bounds, Bounds, Bounds]
+
+
+class PCIAddressRange:
+    """
+    Immutable range of PCI addresses.
+
+    Fields are matched by wildcard (None), single value or `range` with step 1, e.g.
+    `PCIAddressRange(domain=1, slot=range(0, 5))` is slots 0-4 of all buses of domain 1.
+    """
+
+    __slots__ = ("_boxes", "_bounds", "_domain_starts", "_bitmaps")
+
+    def __init__(
+        self,
+        domain: int | range | None = None,
+        bus: int | range | None = None,
+        slot: int | range | None = None,
+        func: int | range | None = None,
+    ) -> None:
+        """
+        Initialize range of single box.
+
+        :param domain: Domain, range of domains or None for any.
+        :param bus: Bus, range of buses or None for any.
+        :param slot: Slot, range of slots or None for any.
+        :param func: Function, range of functions or None for any.
+        :raises ValueError: When value is out of bounds of field or range is empty or has step other than 1.
+        """
+        values = (domain, bus, slot, func)
+        self._set_boxes((tuple(_bounds(*args) for args in zip(_FIELDS, values, _LIMITS)),))
+
+    def _set_boxes(self, boxes: tuple[Box, ...]) -> None:
+        object.__setattr__(self, "_boxes", boxes)
+        # flat bounds of single box, compared directly in __contains__; bitmaps of many boxes are built on first check
+        object.__setattr__(self, "_bounds", sum(boxes[0], ()) if len(boxes) == 1 else None)
+        object.__setattr__(self, "_domain_starts", None)
+        object.__setattr__(self, "_bitmaps", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def _from_boxes(cls, boxes: Iterable[Box]) -> "PCIAddressRange":
+        address_range = object.__new__(cls)
+        address_range._set_boxes(tuple(boxes))
+        return address_range
+
+    @classmethod
+    def parse(cls, text: str) -> "PCIAddressRange":
+        """
+        Create range from notation, e.g. `0000:3b:*.*` or `0000:3b:00.0-7,0000:5e:00.0`.
+
+        :param text: Comma-separated ranges.
+        :return: Range.
+        :raises ValueError: When notation is not correct.
+        """
+        result = cls._from_boxes(())
+        for part in text.split(","):
+            match = _range_regex.match(part.strip())
+            if not match:
+                raise ValueError(f"Incorrect format of PCI address range: {part}")
+            box = tuple(_parse_bounds(name, match.group(name), limits) for name, limits in zip(_FIELDS, _LIMITS))
+            result |= cls._from_boxes((box,))
+        return result
+
+    @classmethod
+    def from_address(cls, pci_address: PCIAddress) -> "PCIAddressRange":
+        """Create range of single address."""
+        return cls(pci_address.domain, pci_address.bus, pci_address.slot, pci_address.func)
+
+    def __contains__(self, pci_address: PCIAddress) -> bool:
+        bounds = self._bounds
+        if bounds is not None:
+            domain_low, domain_high, bus_low, bus_high, slot_low, slot_high, func_low, func_high = bounds
+            return (
+                domain_low <= pci_address.domain <= domain_high
+                and slot_low <= pci_address.slot <= slot_high
+                and bus_low <= pci_address.bus <= bus_high
+                and func_low <= pci_address.func <= func_high
+            )
+        slot, func = pci_address.slot, pci_address.func
+        if slot > 0x1F or func > 0x7:  # out of limits of range, allowed in PCIAddress
+            return False
+        bitmap = (self._bitmaps or self._build_bitmaps())[bisect_right(self._domain_starts, pci_address.domain) - 1]
+        return bitmap[pci_address.bus << 8 | slot << 3 | func] == 1
+
+    def filter(self, addresses: Iterable[PCIAddress]) -> list[PCIAddress]:
+        """
+        Get addresses contained in range, in their order.
+
+        Bounds are compared inline for every address, so it's faster than checking `in` range address by address.
+
+        :param addresses: Addresses to filter.
+        :return: Contained addresses.
+        """
+        bounds = self._bounds
+        if bounds is not None:
+            domain_low, domain_high, bus_low, bus_high, slot_low, slot_high, func_low, func_high = bounds
+            return [
+                address
+                for address in addresses
+                if domain_low <= address.domain <= domain_high
+                and slot_low <= address.slot <= slot_high
+                and bus_low <= address.bus <= bus_high
+                and func_low <= address.func <= func_high
+            ]
+        bitmaps, domain_starts = self._bitmaps or self._build_bitmaps(), self._domain_starts
+        return [
+            address
+            for address in addresses
+            if address.slot <= 0x1F
+            and address.func <= 0x7
+            and bitmaps[bisect_right(domain_starts, address.domain) - 1][
+                address.bus << 8 | address.slot << 3 | address.func
+            ]
+            == 1
+        ]
+
+    def _build_bitmaps(self) -> tuple[bytes, ...]:
+        """
+        Split domains into intervals covered by the same boxes and build bitmap of bus, slot and func of each.
+
+        :return: Bitmaps of intervals starting at `_domain_starts`.
+        """
+        domain_starts = {0} | {low for (low, _), *_ in self._boxes} | {high + 1 for (_, high), *_ in self._boxes}
+        domain_starts = sorted(start for start in domain_starts if start <= _LIMITS[0][1])
+        bitmaps = {(): _EMPTY_BITMAP}  # boxes covering interval: their bitmap, shared between intervals
+        interval_bitmaps = []
+        for start in domain_starts:
+            boxes = tuple(box for box in self._boxes if box[0][0] <= start <= box[0][1])
+            if boxes not in bitmaps:
+                bitmaps[boxes] = _bitmap(boxes)
+            interval_bitmaps.append(bitmaps[boxes])
+        object.__setattr__(self, "_domain_starts", tuple(domain_starts))
+        object.__setattr__(self, "_bitmaps", tuple(interval_bitmaps))
+        return self._bitmaps
+
+    def __iter__(self) -> Iterator[PCIAddress]:
+        # boxes are disjoint, so merging their sorted packed addresses gives sorted addresses without duplicates
+        packed_addresses = (
+            _iter_packed(self._boxes[0])
+            if len(self._boxes) == 1
+            else heapq.merge(*(_iter_packed(box) for box in self._boxes))
+        )
+        return map(PCIAddress.from_packed, packed_addresses)
+
+    def __len__(self) -> int:
+        return sum(_box_size(box) for box in self._boxes)
+
+    def __bool__(self) -> bool:
+        return bool(self._boxes)
+
+    def __and__(self, other: "PCIAddressRange") -> "PCIAddressRange":
+        if not isinstance(other, PCIAddressRange):
+            return NotImplemented
+        intersections = (_intersect(first, second) for first in self._boxes for second in other._boxes)
+        return PCIAddressRange._from_boxes(box for box in intersections if box is not None)
+
+    def __or__(self, other: "PCIAddressRange") -> "PCIAddressRange":
+        if not isinstance(other, PCIAddressRange):
+            return NotImplemented
+        boxes = list(self._boxes)
+        for box in other._boxes:
+            pieces = [box]
+            for existing in self._boxes:
+                pieces = [piece for box_piece in pieces for piece in _subtract(box_piece, existing)]
+            boxes.extend(pieces)
+        return PCIAddressRange._from_boxes(boxes)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PCIAddressRange):
+            return NotImplemented
+        size = len(self)
+        return size == len(other) and len(self & other) == size
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return ",".join(_format_box(box) for box in sorted(self._boxes))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self}')"
+
+
+def _bounds(name: str, value: int | range | None, limits: Bounds) -> Bounds:
+    """Get inclusive bounds of field value."""
+    if value is None:
+        return limits
+    if isinstance(value, range):
+        if value.step != 1 or not value:
+            raise ValueError(f"{name} range must be non-empty with step 1: {value}")
+        low, high = value.start, value.stop - 1
+    else:
+        low = high = value
+    if not limits[0] <= low <= high <= limits[1]:
+        raise ValueError(f"{name} value out of bounds: {value}")
+    return low, high
+
+
+def _parse_bounds(name: str, text: str, limits: Bounds) -> Bounds:
+    """Get inclusive bounds of field in notation."""
+    if text is None:
+        return 0, 0  # address without domain
+    if text == "*":
+        return limits
+    low, _, high = text.partition("-")
+    return _bounds(name, range(int(low, 16), int(high or low, 16) + 1), limits)
+
+
+def _iter_packed(box: Box) -> Iterator[int]:
+    """Generate packed addresses (see PCIAddress.packed) of box in order."""
+    domains, buses, slots, funcs = (range(low, high + 1) for low, high in box)
+    for domain in domains:  # nested loops instead of itertools.product, which would materialize all domains
+        for bus in buses:
+            for slot in slots:
+                base = PCIAddress.pack(domain, bus, slot, 0)
+                for func in funcs:
+                    yield base | func  # func is the lowest field
+
+
+def _bitmap(boxes: Iterable[Box]) -> bytes:
+    """Get bitmap (byte per address) of bus, slot and func of boxes, indexed as bus << 8 | slot << 3 | func."""
+    bitmap = bytearray(_BITMAP_SIZE)
+    for _, (bus_low, bus_high), (slot_low, slot_high), (func_low, func_high) in boxes:
+        run = b"\x01" * (func_high - func_low + 1)
+        for bus in range(bus_low, bus_high + 1):
+            for slot in range(slot_low, slot_high + 1):
+                start = bus << 8 | slot << 3 | func_low
+                bitmap[start : start + len(run)] = run
+    return bytes(bitmap)
+
+
+def _box_size(box: Box) -> int:
+    size = 1
+    for low, high in box:
+        size *= high - low + 1
+    return size
+
+
+def _intersect(first: Box, second: Box) -> Box | None:
+    box = tuple((max(a[0], b[0]), min(a[1], b[1])) for a, b in zip(first, second))
+    return box if all(low <= high for low, high in box) else None
+
+
+def _subtract(box: Box, other: Box) -> list[Box]:
+    """Split part of box which is not in other box into disjoint boxes."""
+    if _intersect(box, other) is None:
+        return [box]
+    pieces = []
+    remaining = list(box)
+    for index, ((low, high), (other_low, other_high)) in enumerate(zip(box, other)):
+        if low < other_low:
+            pieces.append(tuple(remaining[:index] + [(low, other_low - 1)] + remaining[index + 1 :]))
+        if high > other_high:
+            pieces.append(tuple(remaining[:index] + [(other_high + 1, high)] + remaining[index + 1 :]))
+        remaining[index] = (max(low, other_low), min(high, other_high))
+    return pieces
+
+
+def _format_box(box: Box) -> str:
+    fields = []
+    for (low, high), limits, width in zip(box, _LIMITS, _WIDTHS):
+        if (low, high) == limits:
+            fields.append("*")
+        elif low == high:
+            fields.append(f"{low:0{width}x}")
+        else:
+            fields.append(f"{low:0{width}x}-{high:0{width}x}")
+    domain, bus, slot, func = fields
+    return f"{domain}:{bus}:{slot}.{func}"
@@ -0,0 +1,374 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for decoding PCI configuration space: header fields, PCIDevice and capability lists.
+
+Config space is the `config` file of device in sysfs (64 bytes when read without root privileges, 256 or 4096
+otherwise) or hexdump printed by `lspci -x`/`-xxx`/`-xxxx`. PCIConfigSpace keeps memoryview over passed buffer,
+fields are unpacked from it on access without copying; capability lists are walked lazily by generators.
+
+>>> config = PCIConfigSpace(Path("/sys/bus/pci/devices/0000:18:00.0/config").read_bytes())
+>>> config.pci_device, config.find_extended_capability(ExtendedCapabilityID.SRIOV)
+"""
+
+import os
+import re
+import struct
+from enum import IntEnum
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from .pci_address import PCIAddress, pci_address_full_hex_regex
+from .pci_device import PCIDevice
+
+SYS_BUS_PCI_DEVICES = "sys/bus/pci/devices"
+SYS_DEVICES = "sys/devices"
+
+HEADER_SIZE = 64
+CONFIG_SIZE = 256
+EXTENDED_CONFIG_SIZE = 4096
+
+# vendor, device, revision with class code, header type, subsystem vendor, subsystem (type 0 header)
+_header = struct.Struct("<HH4xI2xBx28xHH")
+_capabilities_pointer = 0x34
+_cardbus_capabilities_pointer = 0x14
+_status_capabilities_list = 0x10
+_header_type_mask = 0x7F
+_multifunction = 0x80
+
+_pci_address_regex = re.compile(pci_address_full_hex_regex)
+_hexdump_device_line = re.compile(
+    r"^(?:(?P<domain>[0-9a-fA-F]{4,8}):)?(?P<bus>[0-9a-fA-F]{2}):(?P<slot>[0-9a-fA-F]{2})\.(?P<func>[0-7])\s"
+)
+_hexdump_data_line = re.compile(r"^(?P<offset>[0-9a-fA-F]{2,3}):(?P<data>(?: [0-9a-fA-F]{2}){1,16})\s*$")
+
+
+class HeaderType(IntEnum):
+    """Layout of configuration space header."""
+
+    ENDPOINT = 0
+    BRIDGE = 1
+    CARDBUS_BRIDGE = 2
+
+
+class CapabilityID(IntEnum):
+    """IDs of capabilities in standard capability list."""
+
+    POWER_MANAGEMENT = 0x01
+    AGP = 0x02
+    VPD = 0x03
+    MSI = 0x05
+    PCIX = 0x07
+    VENDOR_SPECIFIC = 0x09
+    SUBSYSTEM_ID = 0x0D
+    PCI_EXPRESS = 0x10
+    MSIX = 0x11
+
+
+class ExtendedCapabilityID(IntEnum):
+    """IDs of capabilities in PCI Express extended capability list."""
+
+    AER = 0x0001
+    VIRTUAL_CHANNEL = 0x0002
+    DEVICE_SERIAL_NUMBER = 0x0003
+    POWER_BUDGETING = 0x0004
+    VENDOR_SPECIFIC = 0x000B
+    ACS = 0x000D
+    ARI = 0x000E
+    ATS = 0x000F
+    SRIOV = 0x0010
+    LTR = 0x0018
+    SECONDARY_PCIE = 0x0019
+    PASID = 0x001B
+    DATA_LINK_FEATURE = 0x0025
+
+
+class Capability(NamedTuple):
+    """Capability in standard capability list."""
+
+    id: int
+    offset: int
+
+
+class ExtendedCapability(NamedTuple):
+    """Capability in PCI Express extended capability list."""
+
+    id: int
+    version: int
+    offset: int
+
+
+class PCIHeader(NamedTuple):
+    """Identification fields of configuration space header."""
+
+    pci_device: PCIDevice
+    class_code: int  # base class, subclass and programming interface, e.g. 0x020000 for Ethernet controller
+    revision: int
+    header_type: int
+
+
+class PCIConfigSpace:
+    """Read-only view of configuration space of PCI device."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        """
+        Initialize view, buffer isn't copied.
+
+        :param data: Configuration space, at least 64 bytes of header.
+        :raises PCIConfigSpaceError: When data is shorter than header or no device is present (vendor ID 0xffff).
+        """
+        data = memoryview(data).cast("B")
+        if len(data) < HEADER_SIZE:
+            raise PCIConfigSpaceError(f"Configuration space must have at least {HEADER_SIZE} bytes, got {len(data)}")
+        if data[0] == data[1] == 0xFF:
+            raise PCIConfigSpaceError("No device present, vendor ID is 0xffff")
+        self.data = data
+
+    def read_u8(self, offset: int) -> int:
+        """Read byte register at offset."""
+        return self.data[offset]
+
+    def read_u16(self, offset: int) -> int:
+        """Read 16-bit little-endian register at offset."""
+        return self.data[offset] | self.data[offset + 1] << 8
+
+    def read_u32(self, offset: int) -> int:
+        """Read 32-bit little-endian register at offset."""
+        return struct.unpack_from("<I", self.data, offset)[0]
+
+    @property
+    def vendor_id(self) -> int:
+        """Vendor ID."""
+        return self.read_u16(0x00)
+
+    @property
+    def device_id(self) -> int:
+        """Device ID."""
+        return self.read_u16(0x02)
+
+    @property
+    def command(self) -> int:
+        """Command register."""
+        return self.read_u16(0x04)
+
+    @property
+    def status(self) -> int:
+        """Status register."""
+        return self.read_u16(0x06)
+
+    @property
+    def revision(self) -> int:
+        """Revision ID."""
+        return self.data[0x08]
+
+    @property
+    def class_code(self) -> int:
+        """Class code: base class, subclass and programming interface, e.g. 0x020000."""
+        return self.read_u32(0x08) >> 8
+
+    @property
+    def header_type(self) -> int:
+        """Header layout, one of HeaderType."""
+        return self.data[0x0E] & _header_type_mask
+
+    @property
+    def multifunction(self) -> bool:
+        """Whether device has more functions."""
+        return bool(self.data[0x0E] & _multifunction)
+
+    @property
+    def subsystem_ids(self) -> tuple[int, int] | None:
+        """
+        Subsystem vendor ID and subsystem ID, None when not reported.
+
+        Endpoint has them in header, bridge in Subsystem ID capability.
+        """
+        if self.header_type == HeaderType.ENDPOINT:
+            sub_vendor_id, sub_device_id = self.read_u16(0x2C), self.read_u16(0x2E)
+        else:
+            capability = self.find_capability(CapabilityID.SUBSYSTEM_ID)
+            if capability is None or capability.offset + 8 > len(self.data):
+                return None
+            sub_vendor_id, sub_device_id = self.read_u16(capability.offset + 4), self.read_u16(capability.offset + 6)
+        if sub_vendor_id in (0x0000, 0xFFFF):
+            return None
+        return sub_vendor_id, sub_device_id
+
+    @property
+    def pci_device(self) -> PCIDevice:
+        """PCI device with vendor, device and subsystem IDs."""
+        sub_ids = self.subsystem_ids or (None, None)
+        return PCIDevice.from_ids(self.vendor_id, self.device_id, *sub_ids)
+
+    @property
+    def header(self) -> PCIHeader:
+        """Identification fields of header."""
+        return PCIHeader(self.pci_device, self.class_code, self.revision, self.header_type)
+
+    def capabilities(self) -> Iterator[Capability]:
+        """
+        Walk standard capability list.
+
+        Walk stops at end of available data, e.g. when only header was readable, and on loop in list.
+
+        :return: Generator of capabilities in list order.
+        """
+        if not self.status & _status_capabilities_list:
+            return
+        pointer_offset = (
+            _cardbus_capabilities_pointer if self.header_type == HeaderType.CARDBUS_BRIDGE else _capabilities_pointer
+        )
+        offset = self.data[pointer_offset] & 0xFC
+        for _ in range((CONFIG_SIZE - HEADER_SIZE) // 4):  # bound of list length, guards against loop
+            if offset < HEADER_SIZE or offset + 2 > len(self.data):
+                return
+            yield Capability(self.data[offset], offset)
+            offset = self.data[offset + 1] & 0xFC
+
+    def extended_capabilities(self) -> Iterator[ExtendedCapability]:
+        """
+        Walk PCI Express extended capability list, empty when extended config space isn't available.
+
+        :return: Generator of capabilities in list order.
+        """
+        offset = CONFIG_SIZE
+        for _ in range((EXTENDED_CONFIG_SIZE - CONFIG_SIZE) // 4):  # bound of list length, guards against loop
+            if offset < CONFIG_SIZE or offset + 4 > len(self.data):
+                return
+            header = self.read_u32(offset)
+            if header in (0, 0xFFFFFFFF):
+                return
+            yield ExtendedCapability(header & 0xFFFF, header >> 16 & 0xF, offset)
+            offset = header >> 20 & 0xFFC
+
+    def find_capability(self, capability_id: int) -> Capability | None:
+        """Get first capability with ID from standard list, None when not present."""
+        return next((capability for capability in self.capabilities() if capability.id == capability_id), None)
+
+    def find_extended_capability(self, capability_id: int) -> ExtendedCapability | None:
+        """Get first capability with ID from extended list, None when not present."""
+        return next((capability for capability in self.extended_capabilities() if capability.id == capability_id), None)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.vendor_id:04x}:{self.device_id:04x}, "
+            f"class={self.class_code:06x}, size={len(self.data)})"
+        )
+
+
+def decode_headers(configs: Iterable[bytes | bytearray | memoryview]) -> list[PCIHeader]:
+    """
+    Decode identification fields of many configuration spaces.
+
+    Fields are unpacked by single struct call per device, devices with the same IDs share one PCIDevice object.
+
+    :param configs: Configuration spaces, each at least 64 bytes.
+    :return: Headers in order of configs.
+    :raises PCIConfigSpaceError: When config is shorter than header or no device is present.
+    """
+    devices: dict[tuple, PCIDevice] = {}
+    headers = []
+    for data in configs:
+        try:
+            vendor_id, device_id, revision_class, header_type, sub_vendor_id, sub_device_id = _header.unpack_from(data)
+        except struct.error:
+            raise PCIConfigSpaceError(
+                f"Configuration space must have at least {HEADER_SIZE} bytes, got {len(data)}"
+            ) from None
+        header_type &= _header_type_mask
+        if vendor_id == 0xFFFF:
+            raise PCIConfigSpaceError("No device present, vendor ID is 0xffff")
+        if header_type != HeaderType.ENDPOINT:
+            sub_ids = PCIConfigSpace(data).subsystem_ids  # bridge has them in capability
+        elif sub_vendor_id in (0x0000, 0xFFFF):
+            sub_ids = None
+        else:
+            sub_ids = sub_vendor_id, sub_device_id
+        key = (vendor_id << 16 | device_id, sub_ids)
+        pci_device = devices.get(key)
+        if pci_device is None:
+            pci_device = devices[key] = PCIDevice.from_ids(vendor_id, device_id, *(sub_ids or (None, None)))
+        headers.append(PCIHeader(pci_device, revision_class >> 8, revision_class & 0xFF, header_type))
+    return headers
+
+
+def parse_lspci_hexdump(output: str) -> dict[PCIAddress, PCIConfigSpace]:
+    """
+    Parse configuration spaces from `lspci -x`, `-xxx` or `-xxxx` output, with or without `-D`.
+
+    :param output: Output, device line followed by `00: 86 80 92 15 ...` lines of each device.
+    :return: Configuration space of every device, in output order.
+    :raises PCIConfigSpaceError: When data line is out of order or data of device is shorter than header.
+    """
+    configs: dict[PCIAddress, bytearray] = {}
+    data = None
+    for line in output.splitlines():
+        match = _hexdump_data_line.match(line)
+        if match and data is not None:
+            if int(match.group("offset"), 16) != len(data):
+                raise PCIConfigSpaceError(f"Unexpected offset of hexdump line: {line}")
+            data += bytes.fromhex(match.group("data"))
+            continue
+        match = _hexdump_device_line.match(line)
+        if match:
+            pci_address = PCIAddress(*(int(match.group(name) or "0", 16) for name in ("domain", "bus", "slot", "func")))
+            data = configs[pci_address] = bytearray()
+        elif not line.strip():
+            data = None
+    return {pci_address: PCIConfigSpace(data) for pci_address, data in configs.items()}
+
+
+def read_config_spaces(root: str | Path = "/") -> dict[PCIAddress, PCIConfigSpace]:
+    """
+    Read configuration spaces of all PCI devices from sysfs.
+
+    :param root: Root of file system.
+    :return: Configuration space of every device, sorted by address.
+    """
+    devices_path = os.path.join(root, SYS_BUS_PCI_DEVICES)
+    try:
+        entries = sorted(os.listdir(devices_path))
+    except FileNotFoundError:
+        return {}
+    configs = {}
+    for entry in entries:
+        match = _pci_address_regex.match(entry)
+        if not match:
+            continue
+        try:
+            with open(os.path.join(devices_path, entry, "config"), "rb") as file:
+                data = file.read()
+        except OSError:
+            continue
+        pci_address = PCIAddress(*(int(match.group(name), 16) for name in ("domain", "bus", "slot", "func")))
+        configs[pci_address] = PCIConfigSpace(data)
+    return configs
+
+
+def create_fake_pci_config(root: str | Path, pci_address: PCIAddress, config: bytes) -> None:
+    """
+    Create fake sysfs `config` file of PCI device, in layout read by read_config_spaces, e.g. for tests.
+
+    Device directory is the same as created by numa_locality.create_fake_pci_locality.
+
+    :param root: Root of fake file system.
+    :param pci_address: Address of device.
+    :param config: Configuration space.
+    """
+    root = Path(root)
+    device_path = root / SYS_DEVICES / f"pci{pci_address.domain:04x}:00" / pci_address.lspci
+    device_path.mkdir(parents=True, exist_ok=True)
+    (device_path / "config").write_bytes(config)
+    link = root / SYS_BUS_PCI_DEVICES / pci_address.lspci
+    if not link.is_symlink():
+        link.parent.mkdir(parents=True, exist_ok=True)
+        link.symlink_to(device_path)
+
+
+class PCIConfigSpaceError(Exception):
+    """Exception raised for incorrect configuration space."""
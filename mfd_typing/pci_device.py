@@ -3,11 +3,11 @@
 """Module for PCI Device."""
 
 import re
-from dataclasses import dataclass, fields, InitVar
+from dataclasses import dataclass, InitVar
 from typing import Optional, Union, Any
 
-from mfd_typing import VendorID, DeviceID, SubVendorID, SubDeviceID
-from mfd_typing.dataclass_utils import convert_value_field_to_typehint_type
+from .vendor_device_id import VendorID, DeviceID, SubVendorID, SubDeviceID
+from .dataclass_utils import convert_fields_to_typehint_types
 
 hex_reg_4 = r"[0-9a-fA-F]{4}"
 _pci_vendor_device_regex = rf"(?P<vendor_id>{hex_reg_4}):(?P<device_id>{hex_reg_4})"
@@ -52,8 +52,7 @@ class PCIDevice:
                     "VendorID and DeviceID are mandatory! Device details can be also passed in 'data' parameter"
                 )
             )
-        for field in fields(self):
-            convert_value_field_to_typehint_type(self, field)
+        convert_fields_to_typehint_types(self)
 
     def __eq__(self, other: Any):
         if other is None:
@@ -69,6 +68,51 @@ class PCIDevice:
             and (not all([self.sub_device_id, other.sub_device_id]) or self.sub_device_id == other.sub_device_id)
         )
 
+    @classmethod
+    def from_ids(
+        cls,
+        vendor_id: int,
+        device_id: int,
+        sub_vendor_id: int | None = None,
+        sub_device_id: int | None = None,
+    ) -> "PCIDevice":
+        """
+        Create PCIDevice from int IDs without parsing and checks done by constructor, e.g. IDs read from config space.
+
+        IDs are only wrapped in VendorID, DeviceID, SubVendorID and SubDeviceID, which check their range.
+
+        :param vendor_id: Vendor ID.
+        :param device_id: Device ID.
+        :param sub_vendor_id: Subsystem vendor ID or None.
+        :param sub_device_id: Subsystem device ID or None.
+        :return: PCIDevice.
+        """
+        pci_device = object.__new__(cls)
+        pci_device.__dict__.update(
+            vendor_id=VendorID(vendor_id),
+            device_id=DeviceID(device_id),
+            sub_vendor_id=None if sub_vendor_id is None else SubVendorID(sub_vendor_id),
+            sub_device_id=None if sub_device_id is None else SubDeviceID(sub_device_id),
+        )
+        return pci_device
+
+    def __reduce__(self) -> tuple:
+        # pickled as `vendor << 16 | device` int and sub IDs as ints (or None), instead of class and field dict
+        sub_ids = tuple(None if _id is None else int(_id) for _id in (self.sub_vendor_id, self.sub_device_id))
+        packed = int(self.vendor_id) << 16 | int(self.device_id)
+        args = (packed,) if sub_ids == (None, None) else (packed, *sub_ids)
+        return (_unpickle_pci_device, args if type(self) is PCIDevice else (packed, *sub_ids, type(self)))
+
+
+def _unpickle_pci_device(
+    packed: int,
+    sub_vendor_id: int | None = None,
+    sub_device_id: int | None = None,
+    cls: type[PCIDevice] = PCIDevice,
+) -> PCIDevice:
+    """Rebuild pickled PCIDevice, IDs were validated when pickled object was created."""
+    return cls.from_ids(packed >> 16, packed & 0xFFFF, sub_vendor_id, sub_device_id)
+
 
 class PCIDeviceMissingData(Exception):
     """Exception raised for wrong input data providing."""
@@ -0,0 +1,127 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for parsing PowerShell output into WindowsInterfaceInfo.
+
+Parses `Get-CimInstance Win32_NetworkAdapter` output formatted with `Format-List`, `ConvertTo-Csv`
+or `ConvertTo-Json`, using win_interface_properties mapping of fields to PowerShell property names.
+"""
+
+import csv
+import json
+from typing import Any, Callable, Iterable, Iterator
+
+from .mac_address import MACAddress
+from .network_interface import WindowsInterfaceInfo, win_interface_properties
+from .utils import strtobool
+
+# fields which value isn't stored as str
+_field_converters: dict[str, Callable[[Any], Any]] = {
+    "mac_address": MACAddress,
+    "installed": strtobool,
+}
+
+# PowerShell property name: (WindowsInterfaceInfo field name, converter of property value)
+property_converters: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    property_name: (field_name, _field_converters.get(field_name, str))
+    for field_name, property_name in win_interface_properties.items()
+}
+
+
+def _build_interface(properties: Iterable[tuple[str, Any]]) -> WindowsInterfaceInfo:
+    """
+    Build WindowsInterfaceInfo from PowerShell properties, unknown properties and empty values are skipped.
+
+    :param properties: Pairs of property name and value.
+    :return: Interface info.
+    """
+    kwargs = {}
+    for property_name, value in properties:
+        converter = property_converters.get(property_name)
+        if converter is None or value is None or value == "":
+            continue
+        field_name, convert = converter
+        kwargs[field_name] = convert(value)
+    return WindowsInterfaceInfo(**kwargs)
+
+
+def _iter_lines(output: str | Iterable[str]) -> Iterable[str]:
+    return output.splitlines() if isinstance(output, str) else output
+
+
+def parse_format_list(output: str | Iterable[str]) -> Iterator[WindowsInterfaceInfo]:
+    """
+    Parse `Format-List` output, records are separated by empty lines.
+
+    Values wrapped by PowerShell into indented continuation lines are joined. PowerShell wraps at whitespace, which
+    is dropped, so lines are joined with one space; only word longer than line is broken inside, so line which is
+    a part of single word (no whitespace) is joined without space.
+
+    :param output: Whole output or iterable of its lines, e.g. opened file.
+    :return: Iterator over interfaces.
+    """
+    properties: list[list[str]] = []
+    wrapped_line = ""  # value part of last line of last property
+    for line in _iter_lines(output):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            if properties:
+                yield _build_interface(properties)
+                properties = []
+        elif line[0].isspace() and properties:
+            separator = " " if wrapped_line[-1:].isspace() or len(wrapped_line.split()) > 1 else ""
+            properties[-1][1] += separator + line.strip()
+            wrapped_line = line.lstrip()
+        else:
+            name, _, value = line.partition(":")
+            properties.append([name.strip(), value.strip()])
+            wrapped_line = value.lstrip()
+    if properties:
+        yield _build_interface(properties)
+
+
+def parse_csv(output: str | Iterable[str]) -> Iterator[WindowsInterfaceInfo]:
+    """
+    Parse `ConvertTo-Csv` / `Export-Csv` output, with or without `#TYPE` line.
+
+    :param output: Whole output or iterable of its lines, e.g. opened file.
+    :return: Iterator over interfaces.
+    """
+    lines = iter(_iter_lines(output))
+    header = None
+    for row in csv.reader(lines):
+        if not row or (header is None and row[0].startswith("#TYPE")):
+            continue
+        if header is None:
+            header = row
+            continue
+        yield _build_interface(zip(header, row))
+
+
+def parse_json(output: str | bytes) -> Iterator[WindowsInterfaceInfo]:
+    """
+    Parse `ConvertTo-Json` output, which is a single object for one adapter or list of objects.
+
+    :param output: Whole output.
+    :return: Iterator over interfaces.
+    """
+    data = json.loads(output)
+    if isinstance(data, dict):
+        data = [data]
+    for adapter in data:
+        yield _build_interface(adapter.items())
+
+
+def parse_windows_interfaces(output: str) -> list[WindowsInterfaceInfo]:
+    """
+    Parse PowerShell output of any supported format, detected from its first character.
+
+    :param output: Output of `Format-List`, `ConvertTo-Csv` or `ConvertTo-Json`.
+    :return: Interfaces.
+    """
+    stripped = output.lstrip()
+    if stripped.startswith(("[", "{")):
+        return list(parse_json(output))
+    if stripped.startswith(('"', "#TYPE")):
+        return list(parse_csv(output))
+    return list(parse_format_list(output))
@@ -0,0 +1,160 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for batching sed substitutions into one command per file.
+
+Substitutions are collected per file in SedEditPlan and compiled into single `sed -i` invocation with multiple
+`-e` expressions (or script passed via here-doc), instead of one `sed -i` per substitution as get_sed_inline does.
+
+>>> plan = SedEditPlan()
+>>> plan.substitute("/etc/sysctl.conf", "net.core.rmem_max = .*", "net.core.rmem_max = 16777216")
+>>> plan.substitute("/etc/sysctl.conf", "1.5", "2.0", literal=True)
+>>> connection.execute_command(plan.command())
+"""
+
+import shlex
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+# escape chars special in sed regex (BRE) and in replacement, "/" is used as separator of literal substitutions
+_REGEX_ESCAPE_TABLE = str.maketrans({c: rf"\{c}" for c in r"\$.*/[]^"})
+_REPLACEMENT_ESCAPE_TABLE = str.maketrans({c: rf"\{c}" for c in "\\&/"})
+_HEREDOC_DELIMITER = "MFD_SED_SCRIPT"
+
+
+def escape_sed_regex(text: str) -> str:
+    """
+    Escape text to be matched literally by sed regex.
+
+    :param text: Text to escape.
+    :return: Escaped text.
+    """
+    return text.translate(_REGEX_ESCAPE_TABLE)
+
+
+def escape_sed_replacement(text: str) -> str:
+    """
+    Escape text to be used literally as sed replacement.
+
+    :param text: Text to escape.
+    :return: Escaped text.
+    """
+    return text.translate(_REPLACEMENT_ESCAPE_TABLE)
+
+
+@dataclass(frozen=True)
+class SedSubstitution:
+    """Single substitution of sed edit plan."""
+
+    act_line: str
+    new_line: str
+    line_idx: int | str = 0
+    literal: bool = False
+
+    @property
+    def expression(self) -> str:
+        """Get sed expression, in the same form as used by get_sed_inline."""
+        line_idx = self.line_idx or ""
+        if self.literal:
+            return f"{line_idx}s/{escape_sed_regex(self.act_line)}/{escape_sed_replacement(self.new_line)}/g"
+        sep = "|" if "/" in f"{self.act_line}{self.new_line}" else "/"
+        return sep.join([f"{line_idx}s", self.act_line, self.new_line, "g"])
+
+
+class SedEditPlan:
+    """Substitutions collected per file, compiled into single sed command per file."""
+
+    def __init__(self) -> None:
+        """Initialize empty plan."""
+        self._edits: dict[str, list[SedSubstitution]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(substitutions) for substitutions in self._edits.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._edits)
+
+    @property
+    def files(self) -> list[str]:
+        """Get files in order of first substitution."""
+        return list(self._edits)
+
+    def substitute(
+        self, filename: "str | Path", act_line: str, new_line: str, line_idx: int | str = 0, literal: bool = False
+    ) -> "SedEditPlan":
+        """
+        Add substitution, substitutions of file are applied in order of adding.
+
+        :param filename: File to edit.
+        :param act_line: Regex (or literal text, if literal is set) to replace.
+        :param new_line: Replacement.
+        :param line_idx: Number of line to edit, all lines if not passed.
+        :param literal: Whether act_line and new_line should be escaped to be used literally.
+        :return: Plan, so calls can be chained.
+        """
+        self._edits.setdefault(str(filename), []).append(SedSubstitution(act_line, new_line, line_idx, literal))
+        return self
+
+    def substitutions(self, filename: "str | Path") -> list[SedSubstitution]:
+        """
+        Get substitutions of file.
+
+        :param filename: File.
+        :return: Substitutions in order of applying.
+        """
+        return list(self._edits.get(str(filename), ()))
+
+    def compile_file(self, filename: "str | Path", script: bool = False) -> str:
+        """
+        Compile substitutions of file into single sed command.
+
+        :param filename: File.
+        :param script: Whether expressions should be passed as script via here-doc, instead of `-e` options.
+                       Script avoids limits of command line length for many substitutions.
+        :return: sed command.
+        :raises KeyError: When plan has no substitutions of file.
+        """
+        expressions = [substitution.expression for substitution in self._edits[str(filename)]]
+        if script:
+            return "\n".join(
+                [f"sed -i -f /dev/stdin {shlex.quote(str(filename))} <<'{_HEREDOC_DELIMITER}'"]
+                + expressions
+                + [_HEREDOC_DELIMITER]
+            )
+        options = " ".join(f"-e {shlex.quote(expression)}" for expression in expressions)
+        return f"sed -i {options} {shlex.quote(str(filename))}"
+
+    def compile(self, script: bool = False) -> list[str]:
+        """
+        Compile plan into sed commands, one per file.
+
+        :param script: Whether expressions should be passed as script via here-doc.
+        :return: sed commands.
+        """
+        return [self.compile_file(filename, script) for filename in self._edits]
+
+    def command(self, script: bool = False) -> str:
+        """
+        Compile plan into single shell command editing all files, so it needs one remote round trip.
+
+        :param script: Whether expressions should be passed as script via here-doc.
+        :return: Command, sed commands of files are joined with `&&`.
+        """
+        if script:
+            # "&&" has to be on the line starting here-doc, next command starts after delimiter line
+            commands = self.compile(script=True)
+            return "\n".join([command.replace("\n", " &&\n", 1) for command in commands[:-1]] + commands[-1:])
+        return " && ".join(self.compile())
+
+
+def apply_locally(plan: SedEditPlan, script: bool = False) -> None:
+    """
+    Apply plan to local files using sed, e.g. to verify plan in tests.
+
+    :param plan: Plan to apply.
+    :param script: Whether expressions should be passed as script via here-doc.
+    :raises subprocess.CalledProcessError: When sed fails.
+    """
+    if plan:
+        subprocess.run(plan.command(script), shell=True, check=True, capture_output=True)
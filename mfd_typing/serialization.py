@@ -0,0 +1,271 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for dict/JSON codecs of MFD structures.
+
+Encoder and decoder of dataclass are compiled once per class from its fields and map value types
+(PCIAddress, PCIDevice, MACAddress, (Sub)Vendor/Device IDs, UUID, enums) to JSON primitives:
+canonical strings by default or packed ints in compact mode.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, IO, Iterable, Iterator, TypeVar
+from uuid import UUID
+
+from .dataclass_utils import resolve_field_type
+from .mac_address import MACAddress
+from .pci_address import PCIAddress
+from .pci_device import PCIDevice
+from .vendor_device_id import VendorID, DeviceID, SubVendorID, SubDeviceID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+T = TypeVar("T")
+Encoder = Callable[[Any], Any]
+Decoder = Callable[[Any], Any]
+
+
+_MISSING_ID = "-"
+
+
+def _pci_device_to_str(pci_device: PCIDevice) -> str:
+    # vvvv:dddd without sub IDs, vvvv:dddd:ssss:ssss with any of them - missing one is written as "-"
+    ids = [pci_device.vendor_id, pci_device.device_id]
+    if pci_device.sub_vendor_id is not None or pci_device.sub_device_id is not None:
+        ids += [pci_device.sub_vendor_id, pci_device.sub_device_id]
+    return ":".join(_MISSING_ID if _id is None else str(_id) for _id in ids)
+
+
+def _pci_device_from_str(value: str) -> PCIDevice:
+    if _MISSING_ID not in value:
+        return PCIDevice(data=value)
+    ids = value.split(":")
+    if len(ids) != 4 or _MISSING_ID in ids[:2]:
+        raise ValueError(f"Incorrect format was provided as input to PCIDevice object creation: {value}")
+    return PCIDevice(*(None if _id == _MISSING_ID else int(_id, 16) for _id in ids))
+
+
+def _pack_pci_device(pci_device: PCIDevice) -> int | list:
+    # 32 bits without sub IDs, 64 bits with both of them - vendor ID 0000 is not valid PCI vendor, so they don't
+    # overlap; with only one sub ID there is no room for presence bits, so it is [32 bits, sub vendor, sub device]
+    value = int(pci_device.vendor_id) << 16 | int(pci_device.device_id)
+    sub_vendor_id, sub_device_id = pci_device.sub_vendor_id, pci_device.sub_device_id
+    if sub_vendor_id is None and sub_device_id is None:
+        return value
+    if sub_vendor_id is None or sub_device_id is None:
+        return [
+            value,
+            None if sub_vendor_id is None else int(sub_vendor_id),
+            None if sub_device_id is None else int(sub_device_id),
+        ]
+    return value << 32 | int(sub_vendor_id) << 16 | int(sub_device_id)
+
+
+def _unpack_pci_device(value: int | list) -> PCIDevice:
+    if isinstance(value, list):
+        value, sub_vendor_id, sub_device_id = value
+        return PCIDevice(value >> 16, value & 0xFFFF, sub_vendor_id, sub_device_id)
+    if value > 0xFFFFFFFF:
+        return PCIDevice(value >> 48, value >> 32 & 0xFFFF, value >> 16 & 0xFFFF, value & 0xFFFF)
+    return PCIDevice(value >> 16, value & 0xFFFF)
+
+
+# value type: (encoder, decoder) used for canonical strings
+_string_codecs: dict[type, tuple[Encoder, Decoder]] = {
+    PCIAddress: (str, lambda value: PCIAddress(data=value)),
+    PCIDevice: (_pci_device_to_str, _pci_device_from_str),
+    MACAddress: (str, MACAddress),
+    UUID: (str, UUID),
+    VendorID: (str, VendorID),
+    DeviceID: (str, DeviceID),
+    SubVendorID: (str, SubVendorID),
+    SubDeviceID: (str, SubDeviceID),
+}
+
+# value type: (encoder, decoder) used for packed ints, all fitting in 64 bits supported by JSON backends
+_compact_codecs: dict[type, tuple[Encoder, Decoder]] = {
+    PCIAddress: (attrgetter("packed"), PCIAddress.from_packed),
+    PCIDevice: (_pack_pci_device, _unpack_pci_device),
+    MACAddress: (int, MACAddress),
+    UUID: (str, UUID),
+    VendorID: (int, VendorID),
+    DeviceID: (int, DeviceID),
+    SubVendorID: (int, SubVendorID),
+    SubDeviceID: (int, SubDeviceID),
+}
+
+
+def get_value_codec(field_type: type | None, compact: bool = False) -> tuple[Encoder, Decoder] | None:
+    """
+    Get (encoder, decoder) pair for value of given type.
+
+    :param field_type: Type of value, as resolved from type hint.
+    :param compact: Whether to use packed ints instead of canonical strings.
+    :return: Pair of functions or None if value is already a JSON primitive.
+    """
+    if field_type is None:
+        return None
+    codecs = _compact_codecs if compact else _string_codecs
+    for value_type, codec in codecs.items():
+        if issubclass(field_type, value_type):
+            return codec
+    if issubclass(field_type, Enum):
+        return (lambda value: value.name), (lambda value, enum=field_type: enum[value])
+    if is_dataclass(field_type):
+        return get_encoder(field_type, compact), get_decoder(field_type, compact)
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_encoder(cls: type[T], compact: bool = False) -> Callable[[T], dict]:
+    """
+    Get encoder of dataclass objects to dicts of JSON primitives, compiled once per class.
+
+    :param cls: Dataclass to get encoder for.
+    :param compact: Whether to encode value types as packed ints instead of canonical strings.
+    :return: Encoder function.
+    """
+    plain_fields = []
+    converted_fields = []
+    for field in fields(cls):
+        codec = get_value_codec(resolve_field_type(field, cls), compact)
+        if codec is None:
+            plain_fields.append(field.name)
+        else:
+            converted_fields.append((field.name, codec[0]))
+
+    def encode(obj: T) -> dict:
+        obj_dict = {name: getattr(obj, name) for name in plain_fields}
+        for name, encode_value in converted_fields:
+            value = getattr(obj, name)
+            obj_dict[name] = None if value is None else encode_value(value)
+        return obj_dict
+
+    return encode
+
+
+@lru_cache(maxsize=None)
+def get_decoder(cls: type[T], compact: bool = False) -> Callable[[dict], T]:
+    """
+    Get decoder of dicts of JSON primitives to dataclass objects, compiled once per class.
+
+    Keys missing in dict are left to their default values, keys unknown to class are rejected.
+
+    :param cls: Dataclass to get decoder for.
+    :param compact: Whether value types are encoded as packed ints instead of canonical strings.
+    :return: Decoder function.
+    :raises ValueError: When decoded dict has key that is not a field of class.
+    """
+    decoders = {}
+    for field in fields(cls):
+        codec = get_value_codec(resolve_field_type(field, cls), compact)
+        decoders[field.name] = None if codec is None else codec[1]
+
+    def decode(obj_dict: dict) -> T:
+        kwargs = {}
+        for name, value in obj_dict.items():
+            try:
+                decode_value = decoders[name]
+            except KeyError:
+                raise ValueError(f"Cannot decode {cls.__name__}: unknown field {name!r}") from None
+            kwargs[name] = value if decode_value is None or value is None else decode_value(value)
+        return cls(**kwargs)
+
+    return decode
+
+
+def to_dict(obj: Any, compact: bool = False) -> dict:
+    """
+    Encode dataclass object to dict of JSON primitives.
+
+    :param obj: Dataclass object.
+    :param compact: Whether to encode value types as packed ints instead of canonical strings.
+    :return: Encoded dict.
+    """
+    return get_encoder(type(obj), compact)(obj)
+
+
+def from_dict(obj_dict: dict, cls: type[T], compact: bool = False) -> T:
+    """
+    Decode dataclass object from dict of JSON primitives.
+
+    :param obj_dict: Encoded dict.
+    :param cls: Dataclass to decode.
+    :param compact: Whether value types are encoded as packed ints instead of canonical strings.
+    :return: Dataclass object.
+    """
+    return get_decoder(cls, compact)(obj_dict)
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _json_loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, compact: bool = False) -> str:
+    """
+    Encode dataclass object to JSON, using orjson when it is installed.
+
+    :param obj: Dataclass object.
+    :param compact: Whether to encode value types as packed ints instead of canonical strings.
+    :return: JSON string.
+    """
+    return _json_dumps(to_dict(obj, compact))
+
+
+def loads(data: str | bytes, cls: type[T], compact: bool = False) -> T:
+    """
+    Decode dataclass object from JSON, using orjson when it is installed.
+
+    :param data: JSON string.
+    :param cls: Dataclass to decode.
+    :param compact: Whether value types are encoded as packed ints instead of canonical strings.
+    :return: Dataclass object.
+    """
+    return from_dict(_json_loads(data), cls, compact)
+
+
+def dump_jsonl(objects: Iterable[Any], stream: IO[str], compact: bool = False) -> int:
+    """
+    Write dataclass objects to stream as JSON Lines, one object per line.
+
+    :param objects: Dataclass objects, e.g. whole interface inventory.
+    :param stream: Text stream to write to.
+    :param compact: Whether to encode value types as packed ints instead of canonical strings.
+    :return: Number of written objects.
+    """
+    count = 0
+    for obj in objects:
+        stream.write(_json_dumps(to_dict(obj, compact)))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def iter_jsonl(stream: Iterable[str | bytes], cls: type[T], compact: bool = False) -> Iterator[T]:
+    """
+    Read dataclass objects from JSON Lines stream lazily, one object per line.
+
+    :param stream: Text or binary stream (or any iterable of lines) to read from.
+    :param cls: Dataclass to decode.
+    :param compact: Whether value types are encoded as packed ints instead of canonical strings.
+    :return: Iterator over dataclass objects.
+    """
+    decode = get_decoder(cls, compact)
+    for line in stream:
+        if line.strip():
+            yield decode(_json_loads(line))
@@ -0,0 +1,277 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for sharing interface inventories with worker processes through `multiprocessing.shared_memory`.
+
+Inventory is stored once in shared memory block as packed columns, one column per value of flattened wire format
+record layout (see wire_format module), and string table. Workers attach to block by its name and read records
+and columns in place, without copying and unpickling whole inventory:
+
+* header: magic, format version, record class code, column count, record count,
+* offsets of presence mask column, value columns and string table,
+* presence mask column (uint64 per record) and value columns, each aligned to 8 bytes,
+* string table, as in wire format.
+
+SharedInventory itself is pickled as name of block, so it can be passed to process pool tasks directly:
+
+>>> with SharedInventory.create(interfaces) as inventory, ProcessPoolExecutor() as pool:
+...     results = list(pool.map(check_interfaces, [inventory] * workers, range(workers)))
+...     inventory.unlink()
+"""
+
+import os
+import re
+import struct
+import sys
+from collections.abc import Sequence
+from multiprocessing import parent_process, resource_tracker, shared_memory
+from typing import Any, Iterable
+
+from .wire_format import (
+    StringTableView,
+    StringTableWriter,
+    get_record_layout,
+    record_class_codes,
+    record_classes,
+)
+
+MAGIC = b"MFDS"
+VERSION = 1
+
+_header = struct.Struct("<4sHHII")  # magic, version, class code, column count, record count
+_mask = struct.Struct("<Q")
+_ALIGNMENT = 8
+
+_created_names: set[str] = set()  # blocks created by this process, registered in its resource tracker
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _column_structs(codes: str) -> list[struct.Struct]:
+    """Split struct codes of record layout to one struct per value, e.g. "IBBB16s" to I, B, B, B and 16s."""
+    return [struct.Struct(f"<{code}") for code in re.findall(r"\d*[a-zA-Z?]", codes)]
+
+
+class SharedInventory(Sequence):
+    """Read-only inventory of records of one class, stored as packed columns in shared memory block."""
+
+    def __init__(self, memory: shared_memory.SharedMemory) -> None:
+        """
+        Initialize view over block, only header and offsets are read.
+
+        Use create() or attach() instead of calling it directly.
+
+        :param memory: Shared memory block with inventory.
+        :raises SharedInventoryError: When block doesn't contain supported inventory.
+        """
+        self._memory = memory
+        self._buffer = memory.buf.cast("B")
+        try:
+            self._read_header()
+        except BaseException:
+            self._buffer.release()
+            self._buffer = None
+            raise
+
+    def _read_header(self) -> None:
+        if len(self._buffer) < _header.size:
+            raise SharedInventoryError("Block too short to contain inventory")
+        magic, version, class_code, column_count, self._count = _header.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise SharedInventoryError(f"Incorrect magic: {magic!r}")
+        if version != VERSION:
+            raise SharedInventoryError(f"Unsupported shared inventory version: {version}")
+        if class_code not in record_classes:
+            raise SharedInventoryError(f"Unknown record class code: {class_code}")
+        self.record_class = record_classes[class_code]
+        self._layout = get_record_layout(self.record_class).layout
+        self._columns = _column_structs(self._layout.codes)
+        if column_count != len(self._columns):
+            raise SharedInventoryError(f"Column count {column_count} doesn't match {self.record_class.__name__}")
+        offsets = struct.unpack_from(f"<{column_count + 2}Q", self._buffer, _header.size)
+        self._mask_offset, self._column_offsets = offsets[0], offsets[1:-1]
+        self._strings = StringTableView(self._buffer, offsets[-1])
+
+    @classmethod
+    def create(cls, records: Iterable[Any], record_class: type | None = None) -> "SharedInventory":
+        """
+        Store records in new shared memory block.
+
+        Creator owns the block: it has to call unlink() when workers don't need it anymore.
+
+        :param records: Objects of one of wire format record classes.
+        :param record_class: Class of records, required when records are empty, taken from first record otherwise.
+        :return: Inventory stored in block.
+        :raises ValueError: When class is not known or records are not of one class.
+        """
+        records = list(records)
+        if record_class is None:
+            if not records:
+                raise ValueError("Class of records is required for empty inventory")
+            record_class = type(records[0])
+        if record_class not in record_class_codes:
+            raise ValueError(f"{record_class.__name__} is not supported record class")
+        layout = get_record_layout(record_class).layout
+        columns = _column_structs(layout.codes)
+        strings = StringTableWriter()
+        masks = []
+        values = []
+        for obj in records:
+            if type(obj) is not record_class:
+                raise ValueError(f"All records must be {record_class.__name__}, got {type(obj).__name__}")
+            record_values = []
+            masks.append(layout.pack(obj, record_values, strings))
+            values.append(record_values)
+        string_table = strings.to_bytes()
+
+        count = len(records)
+        offset = _align(_header.size + (len(columns) + 2) * 8)
+        offsets = [offset]
+        offset = _align(offset + count * _mask.size)
+        for column in columns:
+            offsets.append(offset)
+            offset = _align(offset + count * column.size)
+        offsets.append(offset)
+        memory = shared_memory.SharedMemory(create=True, size=max(offset + len(string_table), 1))
+        try:
+            buffer = memory.buf
+            _header.pack_into(buffer, 0, MAGIC, VERSION, record_class_codes[record_class], len(columns), count)
+            struct.pack_into(f"<{len(offsets)}Q", buffer, _header.size, *offsets)
+            struct.pack_into(f"<{count}Q", buffer, offsets[0], *masks)
+            for position, (column, column_offset) in enumerate(zip(columns, offsets[1:-1])):
+                code = column.format[1:]
+                if not code.endswith("s"):  # whole column packed at once, count would be read as length of bytes
+                    struct.pack_into(f"<{count}{code}", buffer, column_offset, *(v[position] for v in values))
+                else:
+                    for index, record_values in enumerate(values):
+                        column.pack_into(buffer, column_offset + index * column.size, record_values[position])
+            buffer[offset : offset + len(string_table)] = string_table
+            del buffer
+            inventory = cls(memory)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+        _created_names.add(memory.name)
+        return inventory
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedInventory":
+        """
+        Attach to shared memory block created by create(), e.g. in worker process.
+
+        Attached block is not tracked by resource tracker of worker, so it isn't destroyed when worker exits.
+
+        :param name: Name of block.
+        :return: Inventory stored in block.
+        """
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            # before 3.13 attaching registers block in resource tracker, which destroys it when process exits;
+            # multiprocessing children share tracker with their parent, where block is already registered by creator
+            if os.name != "nt" and parent_process() is None and memory.name not in _created_names:
+                # tracker gets POSIX name of block, name property has its leading "/" stripped
+                resource_tracker.unregister(f"/{memory.name}", "shared_memory")
+        return cls(memory)
+
+    @property
+    def name(self) -> str:
+        """Name of shared memory block, used by workers to attach."""
+        return self._memory.name
+
+    @property
+    def block_size(self) -> int:
+        """Size of shared memory block in bytes, may be rounded up to page size by OS."""
+        return self._memory.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _values(self, index: int, first: int, last: int) -> list:
+        """Read values of columns [first, last) of record, values of other columns are None."""
+        values = [None] * len(self._columns)
+        for position in range(first, last):
+            column = self._columns[position]
+            values[position] = column.unpack_from(self._buffer, self._column_offsets[position] + index * column.size)[0]
+        return values
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        return index
+
+    def _mask_of(self, index: int) -> int:
+        return _mask.unpack_from(self._buffer, self._mask_offset + index * _mask.size)[0]
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        index = self._check_index(index)
+        values = self._values(index, 0, len(self._columns))
+        return self._layout.unpack(values, self._mask_of(index), self._strings)
+
+    def column(self, field_name: str) -> list:
+        """
+        Read single field of all records, only columns of that field are read.
+
+        :param field_name: Name of field of record class, e.g. "mac_address".
+        :return: Values of field, None for records without it.
+        :raises KeyError: When record class has no such field.
+        """
+        for name, bit, nested, kind, position in self._layout.members:
+            if name == field_name:
+                break
+        else:
+            raise KeyError(f"{self.record_class.__name__} has no field {field_name}")
+        last = nested.next_position if nested is not None else position + len(kind.empty)
+        result = []
+        for index in range(self._count):
+            mask = self._mask_of(index)
+            if not mask >> bit & 1:
+                result.append(None)
+                continue
+            values = self._values(index, position, last)
+            result.append(
+                nested.unpack(values, mask, self._strings)
+                if nested is not None
+                else kind.unpack(values, position, self._strings)
+            )
+        return result
+
+    def close(self) -> None:
+        """Release views and close block in this process, block still exists for other processes."""
+        if self._buffer is None:
+            return
+        self._strings.release()
+        self._buffer.release()
+        self._buffer = None
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Destroy block, called once by its creator after all workers finished."""
+        self._memory.unlink()
+        _created_names.discard(self._memory.name)
+
+    def __enter__(self) -> "SharedInventory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_buffer", None) is not None:
+            self.close()
+
+    def __reduce__(self) -> tuple:
+        # only name of block is sent to worker, which attaches to block on unpickling
+        return SharedInventory.attach, (self.name,)
+
+
+class SharedInventoryError(Exception):
+    """Exception raised for shared memory block which doesn't contain supported inventory."""
@@ -0,0 +1,228 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for calculating PCI addresses of SR-IOV virtual functions from SR-IOV capability of physical function.
+
+Routing ID (RID) of device is `bus << 8 | slot << 3 | func`. PCI Express defines RID of VF with index N (from 0) as
+`PF RID + First VF Offset + N * VF Stride`, so addresses of all VFs are computed from PF address without listing
+`virtfn*` links. RIDs are 16-bit numbers, VFs above last function of bus roll over to next bus numbers.
+With ARI (Alternative Routing-ID Interpretation) function number is 8-bit and spans slot and func fields of
+PCIAddress, the same as in lspci; First VF Offset and VF Stride reported by PF already reflect ARI Capable Hierarchy
+setting and NumVFs, so they should be read after VFs are configured.
+
+>>> vf_addresses(PCIAddress(data="0000:18:00.0"), first_vf_offset=0x108, vf_stride=1, vf_count=256)[-1]
+PCIAddress(domain=0, bus=26, slot=0, func=7)
+"""
+
+from array import array
+from typing import NamedTuple
+
+from .pci_address import PCIAddress
+from .pci_config import ExtendedCapabilityID, PCIConfigSpace
+
+_MAX_ROUTING_ID = 0xFFFF
+
+# offsets of registers in SR-IOV extended capability
+_SRIOV_CONTROL = 0x08
+_SRIOV_TOTAL_VFS = 0x0E
+_SRIOV_NUM_VFS = 0x10
+_SRIOV_FIRST_VF_OFFSET = 0x14
+_SRIOV_VF_STRIDE = 0x16
+_SRIOV_VF_DEVICE_ID = 0x1A
+_SRIOV_CAPABILITY_SIZE = 0x40
+_ARI_CAPABLE_HIERARCHY = 0x10
+
+
+class SRIOVCapability(NamedTuple):
+    """Registers of SR-IOV capability of PF used to locate its VFs."""
+
+    total_vfs: int
+    num_vfs: int  # number of enabled VFs
+    first_vf_offset: int
+    vf_stride: int
+    vf_device_id: int
+    ari_capable_hierarchy: bool
+
+    @classmethod
+    def from_config(cls, config: PCIConfigSpace) -> "SRIOVCapability | None":
+        """
+        Read SR-IOV capability from config space of PF.
+
+        :param config: Config space of PF, with extended config space.
+        :return: Capability, None when PF has no SR-IOV capability.
+        """
+        capability = config.find_extended_capability(ExtendedCapabilityID.SRIOV)
+        if capability is None or capability.offset + _SRIOV_CAPABILITY_SIZE > len(config):
+            return None
+        offset = capability.offset
+        return cls(
+            total_vfs=config.read_u16(offset + _SRIOV_TOTAL_VFS),
+            num_vfs=config.read_u16(offset + _SRIOV_NUM_VFS),
+            first_vf_offset=config.read_u16(offset + _SRIOV_FIRST_VF_OFFSET),
+            vf_stride=config.read_u16(offset + _SRIOV_VF_STRIDE),
+            vf_device_id=config.read_u16(offset + _SRIOV_VF_DEVICE_ID),
+            ari_capable_hierarchy=bool(config.read_u16(offset + _SRIOV_CONTROL) & _ARI_CAPABLE_HIERARCHY),
+        )
+
+
+def routing_id(pci_address: PCIAddress) -> int:
+    """Get routing ID of PCI address, `bus << 8 | slot << 3 | func`."""
+    return pci_address.bus << 8 | pci_address.slot << 3 | pci_address.func
+
+
+def vf_routing_ids(pf_routing_id: int, first_vf_offset: int, vf_stride: int, vf_count: int) -> range:
+    """
+    Calculate routing IDs of VFs.
+
+    :param pf_routing_id: Routing ID of PF.
+    :param first_vf_offset: First VF Offset of SR-IOV capability.
+    :param vf_stride: VF Stride of SR-IOV capability.
+    :param vf_count: Number of VFs, e.g. NumVFs or TotalVFs.
+    :return: Routing IDs of VFs in order of VF index.
+    :raises ValueError: When parameters are not correct or routing ID of last VF is beyond bus 255.
+    """
+    if vf_count == 0:
+        return range(0)  # PF with SR-IOV disabled may report offset and stride 0
+    if vf_count < 0 or first_vf_offset < 1 or (vf_stride < 1 and vf_count > 1):
+        raise ValueError(f"Incorrect SR-IOV parameters: offset {first_vf_offset}, stride {vf_stride}, count {vf_count}")
+    first = pf_routing_id + first_vf_offset
+    last = first + (vf_count - 1) * vf_stride
+    if last > _MAX_ROUTING_ID:
+        raise ValueError(f"Routing ID of last VF {last:#x} is beyond bus 255")
+    return range(first, last + 1, vf_stride or 1)
+
+
+def _pack(domain: int, rid: int) -> int:
+    """Pack routing ID with domain as PCIAddress.packed."""
+    return PCIAddress.pack(domain, rid >> 8, rid >> 3 & 0x1F, rid & 0x7)
+
+
+def vf_addresses(
+    pf_address: PCIAddress, first_vf_offset: int, vf_stride: int, vf_count: int, packed: bool = False
+) -> list[PCIAddress] | array:
+    """
+    Calculate addresses of VFs of PF.
+
+    :param pf_address: Address of PF.
+    :param first_vf_offset: First VF Offset of SR-IOV capability.
+    :param vf_stride: VF Stride of SR-IOV capability.
+    :param vf_count: Number of VFs, e.g. NumVFs or TotalVFs.
+    :param packed: Whether to return array of packed addresses (see PCIAddress.packed) instead of PCIAddress
+                   objects.
+    :return: Addresses in order of VF index.
+    :raises ValueError: When parameters are not correct or routing ID of last VF is beyond bus 255.
+    """
+    domain = pf_address.domain
+    rids = vf_routing_ids(routing_id(pf_address), first_vf_offset, vf_stride, vf_count)
+    if packed:
+        return array("Q", [_pack(domain, rid) for rid in rids])
+    return [PCIAddress.from_packed(_pack(domain, rid)) for rid in rids]
+
+
+def unpack_address(packed: int) -> PCIAddress:
+    """Get PCIAddress from packed address returned by vf_addresses."""
+    return PCIAddress.from_packed(packed)
+
+
+class VFAddressMap:
+    """
+    Addresses of VFs of many PFs and reverse map from VF address to its PF and VF index.
+
+    >>> vf_map = VFAddressMap.from_config_spaces(read_config_spaces())
+    >>> vf_map.pf_of(PCIAddress(data="0000:18:01.0"))
+    (PCIAddress(domain=0, bus=24, slot=0, func=0), 0)
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty map."""
+        # keyed by packed address, as hashing and comparing PCIAddress is much slower than int
+        self._pfs: dict[int, tuple[PCIAddress, range]] = {}  # PF: its address and routing IDs of its VFs
+        self._vfs: dict[int, tuple[int, int]] = {}  # VF: packed PF address and VF index
+
+    def add(self, pf_address: PCIAddress, first_vf_offset: int, vf_stride: int, vf_count: int) -> None:
+        """
+        Add VFs of PF, replacing VFs added for it before.
+
+        :param pf_address: Address of PF.
+        :param first_vf_offset: First VF Offset of SR-IOV capability.
+        :param vf_stride: VF Stride of SR-IOV capability.
+        :param vf_count: Number of VFs.
+        :raises ValueError: When parameters are not correct or routing ID of last VF is beyond bus 255.
+        """
+        rids = vf_routing_ids(routing_id(pf_address), first_vf_offset, vf_stride, vf_count)
+        pf_key = _pack(pf_address.domain, routing_id(pf_address))
+        self.remove(pf_address)
+        self._pfs[pf_key] = (pf_address, rids)
+        domain = pf_address.domain
+        self._vfs.update((_pack(domain, rid), (pf_key, index)) for index, rid in enumerate(rids))
+
+    def remove(self, pf_address: PCIAddress) -> None:
+        """Remove VFs of PF, if added."""
+        pf_key = _pack(pf_address.domain, routing_id(pf_address))
+        entry = self._pfs.pop(pf_key, None)
+        if entry is not None:
+            for rid in entry[1]:
+                vf_key = _pack(pf_address.domain, rid)
+                if self._vfs.get(vf_key, (None,))[0] == pf_key:
+                    del self._vfs[vf_key]
+
+    @classmethod
+    def from_config_spaces(cls, configs: dict[PCIAddress, PCIConfigSpace], all_vfs: bool = False) -> "VFAddressMap":
+        """
+        Create map of all PFs with SR-IOV capability.
+
+        :param configs: Config spaces of devices, e.g. from pci_config.read_config_spaces().
+        :param all_vfs: Whether to map TotalVFs VFs instead of enabled ones (NumVFs); offset and stride are the ones
+                        reported for current NumVFs, PFs with SR-IOV disabled which report offset 0 are mapped
+                        without VFs.
+        :return: Map.
+        """
+        vf_map = cls()
+        for pci_address, config in configs.items():
+            capability = SRIOVCapability.from_config(config)
+            if capability is not None:
+                vf_count = capability.total_vfs if all_vfs and capability.first_vf_offset else capability.num_vfs
+                vf_map.add(pci_address, capability.first_vf_offset, capability.vf_stride, vf_count)
+        return vf_map
+
+    def pf_of(self, vf_address: PCIAddress) -> tuple[PCIAddress, int]:
+        """
+        Get PF of VF.
+
+        :param vf_address: Address of VF.
+        :return: Address of PF and index of VF.
+        :raises KeyError: When address isn't address of VF of any added PF.
+        """
+        entry = self._vfs.get(_pack(vf_address.domain, routing_id(vf_address)))
+        if entry is None:
+            raise KeyError(f"{vf_address} is not VF of any known PF")
+        pf_key, index = entry
+        return self._pfs[pf_key][0], index
+
+    def vfs_of(self, pf_address: PCIAddress, packed: bool = False) -> list[PCIAddress] | array:
+        """
+        Get addresses of VFs of PF.
+
+        :param pf_address: Address of PF.
+        :param packed: Whether to return array of packed addresses, see vf_addresses.
+        :return: Addresses in order of VF index.
+        :raises KeyError: When PF wasn't added.
+        """
+        entry = self._pfs.get(_pack(pf_address.domain, routing_id(pf_address)))
+        if entry is None:
+            raise KeyError(f"{pf_address} is not known PF")
+        domain = pf_address.domain
+        if packed:
+            return array("Q", [_pack(domain, rid) for rid in entry[1]])
+        return [PCIAddress.from_packed(_pack(domain, rid)) for rid in entry[1]]
+
+    @property
+    def pfs(self) -> list[PCIAddress]:
+        """Sorted addresses of added PFs."""
+        return sorted(pf_address for pf_address, _ in self._pfs.values())
+
+    def __contains__(self, vf_address: PCIAddress) -> bool:
+        return _pack(vf_address.domain, routing_id(vf_address)) in self._vfs
+
+    def __len__(self) -> int:
+        return len(self._vfs)
@@ -0,0 +1,218 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for scanning network interfaces from Linux sysfs.
+
+Interfaces listed in `/sys/class/net` are read in parallel and classified with interface_type_rules,
+which follow rules described in InterfaceType.
+Root of file system is configurable, so fake sysfs tree (see create_fake_sysfs_interface) can be scanned as well.
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from .mac_address import MACAddress
+from .network_interface import InterfaceType, LinuxInterfaceInfo, VlanInterfaceInfo
+from .pci_address import PCIAddress, pci_address_full_hex_regex
+from .pci_device import PCIDevice
+from .sysfs_utils import read_sysfs, write_sysfs
+
+SYS_CLASS_NET = "sys/class/net"
+SYS_DEVICES = "sys/devices"
+PROC_NET_VLAN_CONFIG = "proc/net/vlan/config"
+
+_pci_address_regex = re.compile(pci_address_full_hex_regex)
+_pci_id_files = ("vendor", "device", "subsystem_vendor", "subsystem_device")
+
+
+class SysfsInterface(NamedTuple):
+    """Attributes of interface read from sysfs, used for classification."""
+
+    name: str
+    path: str  # resolved path of /sys/class/net/<name>
+    mac_address: str | None
+    pci_address: str | None
+    pci_ids: tuple[str, ...]
+    is_vf: bool
+    is_bond: bool
+    is_bond_slave: bool
+    vlan: tuple[int, str] | None  # VLAN ID, parent
+
+
+# decision table: first matching rule decides about interface type, order matters
+interface_type_rules: tuple[tuple[Callable[[SysfsInterface], bool], InterfaceType], ...] = (
+    (lambda interface: interface.vlan is not None, InterfaceType.VLAN),
+    (lambda interface: interface.is_bond, InterfaceType.BOND),
+    (lambda interface: interface.is_bond_slave, InterfaceType.BOND_SLAVE),
+    (lambda interface: interface.name.startswith("nac"), InterfaceType.BTS),
+    (lambda interface: interface.is_vf, InterfaceType.VF),
+    (lambda interface: "/devices/virtual/net/" in interface.path, InterfaceType.VIRTUAL_DEVICE),
+    (lambda interface: interface.pci_address is not None, InterfaceType.PF),
+)
+
+
+def classify_interface(interface: SysfsInterface) -> InterfaceType:
+    """
+    Get type of interface using interface_type_rules.
+
+    :param interface: Attributes of interface read from sysfs.
+    :return: Type of first matching rule, GENERIC if none matches.
+    """
+    for matches, interface_type in interface_type_rules:
+        if matches(interface):
+            return interface_type
+    return InterfaceType.GENERIC
+
+
+def read_vlan_config(root: str | Path = "/") -> dict[str, tuple[int, str]]:
+    """
+    Read VLAN interfaces from /proc/net/vlan/config.
+
+    :param root: Root of file system.
+    :return: VLAN interface name: (VLAN ID, parent interface name).
+    """
+    config = read_sysfs(os.path.join(root, PROC_NET_VLAN_CONFIG), missing_ok=True)
+    vlans = {}
+    for line in (config or "").splitlines()[2:]:  # skip header lines
+        columns = [column.strip() for column in line.split("|")]
+        if len(columns) == 3 and columns[1].isdigit():
+            vlans[columns[0]] = int(columns[1]), columns[2]
+    return vlans
+
+
+def read_sysfs_interface(class_net_path: str, name: str, vlans: dict[str, tuple[int, str]]) -> SysfsInterface:
+    """
+    Read attributes of interface needed for classification.
+
+    :param class_net_path: Path of sys/class/net directory.
+    :param name: Name of interface.
+    :param vlans: VLAN configuration read by read_vlan_config.
+    :return: Attributes of interface.
+    """
+    interface_path = os.path.join(class_net_path, name)
+    device_path = os.path.join(interface_path, "device")
+    pci_address = None
+    pci_ids = ()
+    is_vf = False
+    if os.path.exists(device_path):
+        device_name = os.path.basename(os.path.realpath(device_path))
+        if _pci_address_regex.match(device_name):
+            pci_address = device_name
+            pci_ids = tuple(
+                read_sysfs(os.path.join(device_path, file_name), missing_ok=True) for file_name in _pci_id_files
+            )
+            is_vf = os.path.exists(os.path.join(device_path, "physfn"))
+    return SysfsInterface(
+        name=name,
+        path=os.path.realpath(interface_path),
+        mac_address=read_sysfs(os.path.join(interface_path, "address"), missing_ok=True),
+        pci_address=pci_address,
+        pci_ids=pci_ids,
+        is_vf=is_vf,
+        is_bond=os.path.isdir(os.path.join(interface_path, "bonding")),
+        is_bond_slave=os.path.isdir(os.path.join(interface_path, "bonding_slave")),
+        vlan=vlans.get(name),
+    )
+
+
+def _to_interface_info(interface: SysfsInterface, namespace: str | None) -> LinuxInterfaceInfo:
+    try:
+        mac_address = MACAddress(interface.mac_address) if interface.mac_address else None
+    except ValueError:  # e.g. 20-byte InfiniBand hardware address
+        mac_address = None
+    pci_device = None
+    if interface.pci_ids[:2] and all(interface.pci_ids[:2]):
+        pci_device = PCIDevice(*interface.pci_ids) if all(interface.pci_ids) else PCIDevice(*interface.pci_ids[:2])
+    return LinuxInterfaceInfo(
+        pci_address=PCIAddress(data=interface.pci_address) if interface.pci_address else None,
+        pci_device=pci_device,
+        name=interface.name,
+        interface_type=classify_interface(interface),
+        mac_address=mac_address,
+        vlan_info=VlanInterfaceInfo(*interface.vlan) if interface.vlan else None,
+        namespace=namespace,
+    )
+
+
+def scan_interfaces(
+    root: str | Path = "/", namespace: str | None = None, max_workers: int | None = None
+) -> list[LinuxInterfaceInfo]:
+    """
+    Scan all interfaces from sysfs in parallel.
+
+    :param root: Root of file system, which contains sys/class/net and proc/net/vlan.
+    :param namespace: Network namespace which sysfs belongs to, stored in scanned interfaces.
+    :param max_workers: Number of threads reading interfaces, default of ThreadPoolExecutor if not passed.
+    :return: Interfaces sorted by name.
+    """
+    class_net_path = os.path.join(root, SYS_CLASS_NET)
+    vlans = read_vlan_config(root)
+    with os.scandir(class_net_path) as entries:
+        names = sorted(entry.name for entry in entries)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        interfaces = executor.map(lambda name: read_sysfs_interface(class_net_path, name, vlans), names)
+        return [_to_interface_info(interface, namespace) for interface in interfaces]
+
+
+def create_fake_sysfs_interface(
+    root: str | Path,
+    name: str,
+    mac_address: str | None = None,
+    pci_address: PCIAddress | None = None,
+    pci_device: PCIDevice | None = None,
+    physfn: PCIAddress | None = None,
+    bond: bool = False,
+    bond_slave: bool = False,
+) -> None:
+    """
+    Create fake sysfs entries of interface, in layout read by scan_interfaces, e.g. for tests and benchmarks.
+
+    :param root: Root of fake file system.
+    :param name: Name of interface.
+    :param mac_address: Content of address file.
+    :param pci_address: PCI Address of device, virtual device is created if not passed.
+    :param pci_device: IDs of PCI device.
+    :param physfn: PCI Address of PF, if interface is VF.
+    :param bond: Whether interface is bonding master.
+    :param bond_slave: Whether interface is bonding slave.
+    """
+    root = Path(root)
+    if pci_address is not None:
+        device_path = root / SYS_DEVICES / f"pci{pci_address.domain:04x}:00" / pci_address.lspci
+        interface_path = device_path / "net" / name
+        interface_path.mkdir(parents=True, exist_ok=True)
+        (interface_path / "device").symlink_to(device_path)
+        if pci_device is not None:
+            ids = [pci_device.vendor_id, pci_device.device_id, pci_device.sub_vendor_id, pci_device.sub_device_id]
+            for file_name, pci_id in zip(_pci_id_files, ids):
+                if pci_id is not None:
+                    write_sysfs(device_path / file_name, f"0x{int(pci_id):04x}")
+        if physfn is not None:
+            (device_path / "physfn").symlink_to(device_path.parent / physfn.lspci)
+    else:
+        interface_path = root / SYS_DEVICES / "virtual" / "net" / name
+        interface_path.mkdir(parents=True, exist_ok=True)
+    if mac_address is not None:
+        write_sysfs(interface_path / "address", mac_address)
+    if bond:
+        (interface_path / "bonding").mkdir()
+    if bond_slave:
+        (interface_path / "bonding_slave").mkdir()
+    class_net_path = root / SYS_CLASS_NET
+    class_net_path.mkdir(parents=True, exist_ok=True)
+    (class_net_path / name).symlink_to(interface_path)
+
+
+def create_fake_vlan_config(root: str | Path, vlans: dict[str, tuple[int, str]]) -> None:
+    """
+    Create fake /proc/net/vlan/config.
+
+    :param root: Root of fake file system.
+    :param vlans: VLAN interface name: (VLAN ID, parent interface name).
+    """
+    lines = ["VLAN Dev name    | VLAN ID", "Name-Type: VLAN_NAME_TYPE_RAW_PLUS_VID_NO_PAD"]
+    lines += [f"{name:<15}| {vlan_id:<4}| {parent}" for name, (vlan_id, parent) in vlans.items()]
+    write_sysfs(Path(root) / PROC_NET_VLAN_CONFIG, "\n".join(lines))
@@ -0,0 +1,34 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for reading sysfs/procfs attribute files and building fake trees of them."""
+
+from pathlib import Path
+
+
+def read_sysfs(path: str, missing_ok: bool = False) -> str | None:
+    """
+    Read attribute file, with surrounding whitespace (trailing newline) stripped.
+
+    :param path: Path of file.
+    :param missing_ok: Whether to return None instead of raising when file can't be read, for optional attributes.
+    :return: Content of file.
+    :raises OSError: When file can't be read and missing_ok is False.
+    """
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        if missing_ok:
+            return None
+        raise
+
+
+def write_sysfs(path: Path, content: str) -> None:
+    """
+    Write attribute file of fake tree, with trailing newline as in sysfs, creating parent directories.
+
+    :param path: Path of file.
+    :param content: Content without trailing newline.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{content}\n")
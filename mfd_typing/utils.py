@@ -2,8 +2,8 @@
 # SPDX-License-Identifier: MIT
 """Utils."""
 
+from functools import lru_cache
 from typing import Union, TYPE_CHECKING
-from netaddr import ipv6_verbose
 from mfd_typing.exceptions import UnknownWindowsKernelVersionError, InvalidWindowsKernelError
 from mfd_typing.os_values import WindowsFlavour
 import re
@@ -123,6 +123,8 @@ def convert_ip_dc_to_ip_hex(ip: "IPAddress", pad_ipv6_len: bool = False) -> str:
     :param pad_to_v6: If ipv4, add extra 00 to match the length of an ipv6 address
     :return: converted hexadecimal IP value separated by comma.
     """
+    from netaddr import ipv6_verbose  # imported on use, so utils doesn't load netaddr
+
     new_hex = ""
     if ip.version == 6:
         expand_ip = ip.format(ipv6_verbose).replace(":", "")
@@ -281,6 +283,12 @@ def get_sed_inline(act_line: str, new_line: str, filename: "str | Path", line_id
     return sep.join([f"sed -i '{line_idx}s", act_line, new_line, f"g' {filename}"])
 
 
+@lru_cache(maxsize=64)
+def _sed_escape_table(pattern: str) -> dict[int, str]:
+    """Get translation table escaping chars of pattern with backslash."""
+    return str.maketrans({c: rf"\{c}" for c in pattern})
+
+
 def prepare_sed_string(input_str: str, pattern: str) -> str:
     """
     Prepare `str` to be parsed as a literal string by sed.
@@ -289,6 +297,8 @@ def prepare_sed_string(input_str: str, pattern: str) -> str:
     :param pattern: the set of chars to be escaped
     :return: 'escaped' string
     """
+    if "\\" not in input_str:
+        return input_str.translate(_sed_escape_table(pattern))
     new_str = []
     for idx, c in enumerate(input_str):
         if c in pattern:
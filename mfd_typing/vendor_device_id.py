@@ -95,6 +95,10 @@ class _VendorDeviceID:
     def __int__(self) -> int:
         return self._value
 
+    def __reduce__(self) -> tuple:
+        # pickled as class and int, instead of class and instance dict
+        return type(self), (self._value,)
+
 
 class VendorID(_VendorDeviceID):
     """Vendor ID representation."""
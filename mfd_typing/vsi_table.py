@@ -0,0 +1,279 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for columnar table of VSI Info.
+
+Integer fields of VsiInfo are stored as arrays and boolean fields as packed bits. Filters are evaluated
+as bitwise operations on bitsets of whole columns (Python ints, bit N is row N) and VsiInfo objects
+are built only for selected rows.
+"""
+
+import re
+from array import array
+from typing import Iterable, Iterator
+
+from .network_interface import VsiInfo
+
+INT_COLUMNS = ("fn_id", "host_id", "vsi_id", "vport_id")
+BOOL_COLUMNS = ("is_vf", "is_created", "is_enabled")
+
+# line of VSI dump, e.g.:
+# fn_id: 0x1   host_id: 0x4   is_vf: yes vsi_id: 0x12  vport_id 0x3   is_created: yes is_enabled: yes mac addr: ...
+vsi_dump_regex = re.compile(
+    r"fn_id:?\s*(?P<fn_id>\w+)\s+host_id:?\s*(?P<host_id>\w+)\s+is_vf:?\s*(?P<is_vf>\w+)\s+"
+    r"vsi_id:?\s*(?P<vsi_id>\w+)\s+vport_id:?\s*(?P<vport_id>\w+)\s+"
+    r"is_created:?\s*(?P<is_created>\w+)\s+is_enabled:?\s*(?P<is_enabled>\w+)"
+)
+_true_values = frozenset({"yes", "true", "1", "y"})
+
+
+def _rows_to_bits(rows: Iterable[int], count: int) -> int:
+    """Build bitset of rows through packed bytes, in O(count / 8 + len(rows))."""
+    packed = bytearray((count + 7) // 8)
+    for row in rows:
+        packed[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(packed, "little")
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    """Iterate over positions of set bits, from the lowest."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class VsiSelection:
+    """Selection of rows of VsiTable, VsiInfo objects are built only when iterated."""
+
+    def __init__(self, table: "VsiTable", bits: int) -> None:
+        """
+        Initialize selection.
+
+        :param table: Table which rows are selected.
+        :param bits: Bitset of selected rows.
+        """
+        self.table = table
+        self.bits = bits
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return bool(self.bits)
+
+    def __iter__(self) -> Iterator[VsiInfo]:
+        return (self.table[row] for row in _iter_bits(self.bits))
+
+    def __and__(self, other: "VsiSelection") -> "VsiSelection":
+        return VsiSelection(self.table, self.bits & other.bits)
+
+    def __or__(self, other: "VsiSelection") -> "VsiSelection":
+        return VsiSelection(self.table, self.bits | other.bits)
+
+    def __invert__(self) -> "VsiSelection":
+        return VsiSelection(self.table, self.table.all_rows & ~self.bits)
+
+    def rows(self) -> Iterator[int]:
+        """Get indexes of selected rows."""
+        return _iter_bits(self.bits)
+
+    def values(self, column: str) -> list[int | bool]:
+        """
+        Get values of column for selected rows, without building VsiInfo objects.
+
+        :param column: Name of VsiInfo field.
+        :return: Values in order of rows.
+        """
+        return [self.table.value(row, column) for row in _iter_bits(self.bits)]
+
+
+class VsiTable:
+    """
+    Columnar table of VsiInfo records.
+
+    >>> table = VsiTable.from_dump(cli_client_output)
+    >>> list(table.where(host_id=4, is_vf=True, is_enabled=True))
+    >>> table.get_by_vsi_id(0x12)
+    """
+
+    def __init__(self, vsi_infos: Iterable[VsiInfo] = ()) -> None:
+        """
+        Initialize table.
+
+        :param vsi_infos: Initial records.
+        """
+        self._count = 0
+        self._int_columns = {column: array("q") for column in INT_COLUMNS}
+        self._bool_columns = {column: bytearray() for column in BOOL_COLUMNS}  # packed bits, bit N is row N
+        # column: value: rows, hash indexes of all int columns
+        self._value_rows: dict[str, dict[int, list[int]]] = {column: {} for column in INT_COLUMNS}
+        # (column, value): bitset of rows, cleared when rows are appended
+        self._masks: dict[tuple[str, int | bool], int] = {}
+        self.extend(vsi_infos)
+
+    @classmethod
+    def from_dump(cls, output: str) -> "VsiTable":
+        """
+        Load table from VSI dump text, with hex (0x) or decimal IDs and yes/no flags.
+
+        :param output: VSI dump output, lines not matching vsi_dump_regex are skipped.
+        :return: Table.
+        """
+        table = cls()
+        for match in vsi_dump_regex.finditer(output):
+            values = match.groupdict()
+            table.append_values(
+                *(int(values[column], 0) for column in INT_COLUMNS),
+                *(values[column].lower() in _true_values for column in BOOL_COLUMNS),
+            )
+        return table
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, row: int) -> VsiInfo:
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError("row index out of range")
+        return VsiInfo(**{column: self.value(row, column) for column in INT_COLUMNS + BOOL_COLUMNS})
+
+    def __iter__(self) -> Iterator[VsiInfo]:
+        return (self[row] for row in range(self._count))
+
+    @property
+    def all_rows(self) -> int:
+        """Bitset of all rows."""
+        return (1 << self._count) - 1
+
+    def append_values(
+        self,
+        fn_id: int,
+        host_id: int,
+        vsi_id: int,
+        vport_id: int,
+        is_vf: bool,
+        is_created: bool,
+        is_enabled: bool,
+    ) -> None:
+        """
+        Append row from values of VsiInfo fields, without building VsiInfo object.
+
+        :param fn_id: Function ID.
+        :param host_id: Host ID.
+        :param vsi_id: VSI ID.
+        :param vport_id: vport ID.
+        :param is_vf: Whether function is VF.
+        :param is_created: Whether VSI is created.
+        :param is_enabled: Whether VSI is enabled.
+        """
+        row = self._count
+        for column, value in zip(INT_COLUMNS, (fn_id, host_id, vsi_id, vport_id)):
+            self._int_columns[column].append(value)
+            self._value_rows[column].setdefault(value, []).append(row)
+        byte_index, bit = row >> 3, 1 << (row & 7)
+        for column, value in zip(BOOL_COLUMNS, (is_vf, is_created, is_enabled)):
+            packed = self._bool_columns[column]
+            if byte_index == len(packed):
+                packed.append(0)
+            if value:
+                packed[byte_index] |= bit
+        self._count += 1
+        self._masks.clear()
+
+    def append(self, vsi_info: VsiInfo) -> None:
+        """
+        Append row.
+
+        :param vsi_info: Record to append.
+        """
+        self.append_values(
+            *(getattr(vsi_info, column) for column in INT_COLUMNS),
+            *(getattr(vsi_info, column) for column in BOOL_COLUMNS),
+        )
+
+    def extend(self, vsi_infos: Iterable[VsiInfo]) -> None:
+        """
+        Append rows.
+
+        :param vsi_infos: Records to append.
+        """
+        for vsi_info in vsi_infos:
+            self.append(vsi_info)
+
+    def value(self, row: int, column: str) -> int | bool:
+        """
+        Get single value from table.
+
+        :param row: Index of row.
+        :param column: Name of VsiInfo field.
+        :return: Value.
+        """
+        if column in self._int_columns:
+            return self._int_columns[column][row]
+        return bool(self._bool_columns[column][row >> 3] >> (row & 7) & 1)
+
+    def column(self, column: str) -> array | int:
+        """
+        Get whole column.
+
+        :param column: Name of VsiInfo field.
+        :return: Array of values for int columns, bitset of rows for bool columns.
+        """
+        if column in self._int_columns:
+            return self._int_columns[column]
+        return self.mask(column, True)
+
+    def mask(self, column: str, value: int | bool) -> int:
+        """
+        Get bitset of rows with given value in column.
+
+        :param column: Name of VsiInfo field.
+        :param value: Expected value.
+        :return: Bitset of rows.
+        :raises KeyError: When column doesn't exist.
+        """
+        bits = self._masks.get((column, value))
+        if bits is None:
+            if column in self._value_rows:
+                bits = _rows_to_bits(self._value_rows[column].get(value, ()), self._count)
+            else:
+                bits = int.from_bytes(self._bool_columns[column], "little")
+                if not value:
+                    bits = self.all_rows & ~bits
+            self._masks[(column, value)] = bits
+        return bits
+
+    def where(self, **criteria: int | bool) -> VsiSelection:
+        """
+        Select rows with all columns equal to given values.
+
+        :param criteria: Columns with expected values, e.g. host_id=4, is_vf=True, is_enabled=True.
+        :return: Selection of matching rows.
+        """
+        bits = self.all_rows
+        for column, value in criteria.items():
+            bits &= self.mask(column, value)
+            if not bits:
+                break
+        return VsiSelection(self, bits)
+
+    def get_by_vsi_id(self, vsi_id: int) -> VsiInfo | None:
+        """
+        Get record by VSI ID using hash index.
+
+        :param vsi_id: VSI ID.
+        :return: First record with given VSI ID or None if not found.
+        """
+        rows = self._value_rows["vsi_id"].get(vsi_id)
+        return self[rows[0]] if rows else None
+
+    def get_by_vport_id(self, vport_id: int) -> VsiSelection:
+        """
+        Get records by vport ID using hash index.
+
+        :param vport_id: vport ID.
+        :return: Selection of records with given vport ID.
+        """
+        return VsiSelection(self, self.mask("vport_id", vport_id))
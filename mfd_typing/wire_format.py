@@ -0,0 +1,342 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Module for compact binary wire format of interface inventories.
+
+Inventory is a homogeneous list of records of one class (InterfaceInfo subclasses, PCIDevice, VsiInfo) stored as:
+
+* header: magic, format version, record class code, record size, record count,
+* fixed-width records packed with `struct`, each starting with presence bitmask of optional values,
+* string table: count, offsets and UTF-8 blob, referenced from records by index.
+
+Records are decoded lazily from `memoryview` over the buffer, only when accessed.
+"""
+
+import struct
+from collections.abc import Sequence
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+from uuid import UUID
+
+from .dataclass_utils import resolve_field_type
+from .mac_address import MACAddress
+from .network_interface import InterfaceInfo, LinuxInterfaceInfo, WindowsInterfaceInfo, VsiInfo
+from .pci_address import PCIAddress
+from .pci_device import PCIDevice
+from .vendor_device_id import _VendorDeviceID
+
+MAGIC = b"MFDW"
+VERSION = 1
+
+_header = struct.Struct("<4sHHII")  # magic, version, class code, record size, record count
+_string_count = struct.Struct("<I")
+
+# class code: record class, codes must not be changed within the same VERSION
+record_classes: dict[int, type] = {
+    1: InterfaceInfo,
+    2: LinuxInterfaceInfo,
+    3: WindowsInterfaceInfo,
+    4: PCIDevice,
+    5: VsiInfo,
+}
+# record class: class code
+record_class_codes: dict[type, int] = {cls: code for code, cls in record_classes.items()}
+
+
+class StringTableWriter:
+    """Deduplicating table of strings referenced from records by index."""
+
+    def __init__(self) -> None:
+        """Initialize empty table."""
+        self.indexes: dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        """Add string if not added yet, return its index."""
+        index = self.indexes.get(value)
+        if index is None:
+            index = self.indexes[value] = len(self.indexes)
+        return index
+
+    def to_bytes(self) -> bytes:
+        """Encode table: count, offsets and UTF-8 blob."""
+        encoded = [value.encode() for value in self.indexes]
+        offsets = [0]
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        return _string_count.pack(len(encoded)) + struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+
+class StringTableView:
+    """Lazy view over string table, strings are decoded on first access."""
+
+    def __init__(self, buffer: memoryview, offset: int) -> None:
+        """
+        Initialize view, only offsets are read.
+
+        :param buffer: Buffer with encoded table, not copied.
+        :param offset: Offset of table in buffer.
+        :raises WireFormatError: When buffer is too short for table, e.g. truncated.
+        """
+        if len(buffer) < offset + _string_count.size:
+            raise WireFormatError("Data truncated before string table")
+        (count,) = _string_count.unpack_from(buffer, offset)
+        blob_offset = offset + _string_count.size + 4 * (count + 1)
+        if len(buffer) < blob_offset:
+            raise WireFormatError("Data truncated in string table offsets")
+        self._offsets = struct.unpack_from(f"<{count + 1}I", buffer, offset + _string_count.size)
+        self._blob = buffer[blob_offset:]
+        if self._offsets[-1] != len(self._blob):
+            raise WireFormatError(f"String table size {len(self._blob)} doesn't match its offsets")
+        self._cache: dict[int, str] = {}
+
+    def __getitem__(self, index: int) -> str:
+        value = self._cache.get(index)
+        if value is None:
+            value = self._cache[index] = str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+        return value
+
+    def release(self) -> None:
+        """Release view over buffer, so buffer can be closed; already decoded strings stay available."""
+        self._blob.release()
+
+
+class _ValueKind(NamedTuple):
+    """Fixed-width representation of value type."""
+
+    codes: str
+    empty: tuple
+    pack: Callable[[Any, StringTableWriter], tuple]
+    unpack: Callable[[list, int, StringTableView], Any]  # (record values, position of first value, strings)
+
+
+_value_kinds: dict[type, _ValueKind] = {
+    str: _ValueKind(
+        "I", (0,), lambda value, strings: (strings.add(value),), lambda values, i, strings: strings[values[i]]
+    ),
+    bool: _ValueKind("?", (False,), lambda value, strings: (value,), lambda values, i, strings: values[i]),
+    int: _ValueKind("q", (0,), lambda value, strings: (value,), lambda values, i, strings: values[i]),
+    PCIAddress: _ValueKind(
+        "IBBB",
+        (0, 0, 0, 0),
+        lambda value, strings: (value.domain, value.bus, value.slot, value.func),
+        lambda values, i, strings: PCIAddress.from_packed(
+            PCIAddress.pack(values[i], values[i + 1], values[i + 2], values[i + 3])
+        ),
+    ),
+    MACAddress: _ValueKind(
+        "Q", (0,), lambda value, strings: (int(value),), lambda values, i, strings: MACAddress.from_int(values[i])
+    ),
+    UUID: _ValueKind(
+        "16s", (b"",), lambda value, strings: (value.bytes,), lambda values, i, strings: UUID(bytes=values[i])
+    ),
+}
+
+
+def _get_value_kind(field_type: type | None) -> _ValueKind:
+    """
+    Get fixed-width representation of value of given type.
+
+    :param field_type: Type of value, as resolved from type hint.
+    :return: Value kind.
+    :raises TypeError: When type cannot be represented in wire format.
+    """
+    if field_type in _value_kinds:
+        return _value_kinds[field_type]
+    if isinstance(field_type, type) and issubclass(field_type, _VendorDeviceID):
+        decoded_ids: dict[int, _VendorDeviceID] = {}  # IDs are immutable, so records share decoded ones
+
+        def unpack_id(values: list, i: int, strings: StringTableView) -> _VendorDeviceID:
+            vendor_device_id = decoded_ids.get(values[i])
+            if vendor_device_id is None:
+                vendor_device_id = decoded_ids[values[i]] = field_type(values[i])
+            return vendor_device_id
+
+        return _ValueKind("H", (0,), lambda value, strings: (int(value),), unpack_id)
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        members = tuple(field_type)
+        ordinals = {member: ordinal for ordinal, member in enumerate(members)}
+        return _ValueKind(
+            "H", (0,), lambda value, strings: (ordinals[value],), lambda values, i, strings: members[values[i]]
+        )
+    raise TypeError(f"{field_type} cannot be represented in wire format")
+
+
+class _Layout:
+    """
+    Flattened fixed-width layout of dataclass, nested dataclasses are stored inline.
+
+    Presence bit and position of every value in record are computed once, when layout is built.
+    """
+
+    def __init__(self, cls: type, first_bit: int = 0, first_position: int = 0) -> None:
+        self.cls = cls
+        self.codes = ""
+        # (field name, presence bit, nested layout or None, value kind or None, position of first value)
+        self.members: list[tuple[str, int, "_Layout | None", _ValueKind | None, int]] = []
+        bit = first_bit
+        position = first_position
+        for field in fields(cls):
+            field_type = resolve_field_type(field, cls)
+            if is_dataclass(field_type) and field_type not in _value_kinds:
+                nested = _Layout(field_type, first_bit=bit + 1, first_position=position)
+                self.members.append((field.name, bit, nested, None, position))
+                self.codes += nested.codes
+                bit, position = nested.next_bit, nested.next_position
+            else:
+                kind = _get_value_kind(field_type)
+                self.members.append((field.name, bit, None, kind, position))
+                self.codes += kind.codes
+                bit, position = bit + 1, position + len(kind.empty)
+        self.next_bit = bit
+        self.next_position = position
+        # objects with instance dict are built as unpickled ones, without __init__ and __post_init__, values were
+        # validated when encoded objects were created and are decoded to types of fields already
+        self._build_from_dict = bool(getattr(cls, "__dictoffset__", 0))
+
+    def pack(self, obj: Any, values: list, strings: StringTableWriter) -> int:
+        """Append struct values of object to values, return presence mask."""
+        mask = 0
+        for name, bit, nested, kind, _ in self.members:
+            value = None if obj is None else getattr(obj, name)
+            if value is not None:
+                mask |= 1 << bit
+            if nested is not None:
+                mask |= nested.pack(value, values, strings)
+            elif value is None:
+                values.extend(kind.empty)
+            else:
+                values.extend(kind.pack(value, strings))
+        return mask
+
+    def unpack(self, values: list, mask: int, strings: StringTableView) -> Any:
+        """Build object from struct values of record."""
+        kwargs = {}
+        for name, bit, nested, kind, position in self.members:
+            if not mask >> bit & 1:
+                kwargs[name] = None
+            elif nested is not None:
+                kwargs[name] = nested.unpack(values, mask, strings)
+            else:
+                kwargs[name] = kind.unpack(values, position, strings)
+        if not self._build_from_dict:
+            return self.cls(**kwargs)
+        obj = object.__new__(self.cls)
+        obj.__dict__.update(kwargs)
+        return obj
+
+
+class RecordLayout(NamedTuple):
+    """Layout of values of record class and struct of whole record, with presence mask."""
+
+    layout: _Layout
+    record: struct.Struct
+
+
+@lru_cache(maxsize=None)
+def get_record_layout(cls: type) -> RecordLayout:
+    """
+    Get layout of record class, computed once per class.
+
+    :param cls: Record class.
+    :return: Layout.
+    :raises TypeError: When class has more optional values than bits of presence mask.
+    """
+    layout = _Layout(cls)
+    if layout.next_bit > 64:
+        raise TypeError(f"{cls.__name__} has too many values to be represented in wire format")
+    return RecordLayout(layout, struct.Struct(f"<Q{layout.codes}"))
+
+
+def encode_records(records: Iterable[Any], cls: type | None = None) -> bytes:
+    """
+    Encode records of one class to binary wire format.
+
+    :param records: Objects of one of record_classes.
+    :param cls: Class of records, required when records are empty, taken from first record otherwise.
+    :return: Encoded inventory.
+    :raises ValueError: When class is not known or records are not of one class.
+    """
+    records = list(records)
+    if cls is None:
+        if not records:
+            raise ValueError("Class of records is required for empty inventory")
+        cls = type(records[0])
+    if cls not in record_class_codes:
+        raise ValueError(f"{cls.__name__} is not supported record class")
+    layout, record = get_record_layout(cls)
+    strings = StringTableWriter()
+    chunks = [_header.pack(MAGIC, VERSION, record_class_codes[cls], record.size, len(records))]
+    for obj in records:
+        if type(obj) is not cls:
+            raise ValueError(f"All records must be {cls.__name__}, got {type(obj).__name__}")
+        values = []
+        mask = layout.pack(obj, values, strings)
+        chunks.append(record.pack(mask, *values))
+    chunks.append(strings.to_bytes())
+    return b"".join(chunks)
+
+
+class RecordTable(Sequence):
+    """Lazy read-only view over inventory encoded in binary wire format."""
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        """
+        Initialize view, only header and string table offsets are read.
+
+        :param data: Encoded inventory, not copied.
+        :raises WireFormatError: When data is not a supported inventory.
+        """
+        self._buffer = memoryview(data).cast("B")
+        if len(self._buffer) < _header.size:
+            raise WireFormatError("Data too short to be wire format inventory")
+        magic, version, class_code, record_size, self._count = _header.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise WireFormatError(f"Incorrect magic: {magic!r}")
+        if version != VERSION:
+            raise WireFormatError(f"Unsupported wire format version: {version}")
+        if class_code not in record_classes:
+            raise WireFormatError(f"Unknown record class code: {class_code}")
+        self.record_class = record_classes[class_code]
+        self._layout, self._record = get_record_layout(self.record_class)
+        if record_size != self._record.size:
+            raise WireFormatError(f"Record size {record_size} doesn't match {self.record_class.__name__} layout")
+        strings_offset = _header.size + self._count * record_size
+        if len(self._buffer) < strings_offset:
+            raise WireFormatError(f"Data truncated in records, {self._count} records expected")
+        self._strings = StringTableView(self._buffer, strings_offset)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        mask, *values = self._record.unpack_from(self._buffer, _header.size + index * self._record.size)
+        return self._layout.unpack(values, mask, self._strings)
+
+    def __iter__(self) -> Iterator[Any]:
+        # records are unpacked in one pass over their region, without index checks and offset computation per record
+        records = self._buffer[_header.size : _header.size + self._count * self._record.size]
+        unpack, strings = self._layout.unpack, self._strings
+        for mask, *values in self._record.iter_unpack(records):
+            yield unpack(values, mask, strings)
+
+
+def decode_records(data: bytes | bytearray | memoryview) -> RecordTable:
+    """
+    Get lazy view over inventory encoded in binary wire format.
+
+    :param data: Encoded inventory.
+    :return: Sequence of records, decoded on access.
+    """
+    return RecordTable(data)
+
+
+class WireFormatError(Exception):
+    """Exception raised for data which is not a supported wire format inventory."""
@@ -0,0 +1,43 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from benchmarks.suite import compare
+
+
+def _results(calibration_s=1.0, **per_item_ns):
+    return {
+        "meta": {"calibration_s": calibration_s},
+        "results": {name.replace("_", "."): {"per_item_ns": value} for name, value in per_item_ns.items()},
+    }
+
+
+class TestCompare:
+    def test_within_threshold(self):
+        baseline = _results(pci_parse=100.0, mac_parse=200.0)
+        current = _results(pci_parse=109.0, mac_parse=150.0)
+        assert compare(baseline, current, threshold=0.1) == []
+
+    def test_beyond_threshold(self):
+        baseline = _results(pci_parse=100.0, mac_parse=200.0)
+        current = _results(pci_parse=120.0, mac_parse=200.0)
+        ((name, base, new, change),) = compare(baseline, current, threshold=0.1)
+        assert (name, base, new) == ("pci.parse", 100.0, 120.0)
+        assert change == pytest.approx(0.2)
+
+    @pytest.mark.parametrize(
+        "baseline, current",
+        [
+            (_results(pci_parse=100.0), _results(pci_parse=100.0, mac_parse=1000.0)),
+            (_results(pci_parse=100.0, mac_parse=100.0), _results(pci_parse=100.0)),
+        ],
+        ids=["missing_in_baseline", "missing_in_current"],
+    )
+    def test_benchmark_missing_on_one_side(self, baseline, current):
+        assert compare(baseline, current, threshold=0.1) == []
+
+    def test_normalized_by_calibration(self):
+        baseline = _results(calibration_s=1.0, pci_parse=100.0)
+        current = _results(calibration_s=2.0, pci_parse=180.0)  # twice slower machine
+        assert compare(baseline, current, threshold=0.1) == []
+        assert compare(baseline, current, threshold=0.1, normalize=False)
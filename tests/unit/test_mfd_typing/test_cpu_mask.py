@@ -0,0 +1,92 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_typing.cpu_mask import (
+    cpulist_to_hex_mask,
+    cpulist_to_int,
+    cpulists_to_hex_masks,
+    cpus_to_int,
+    hex_mask_to_cpulist,
+    hex_mask_to_int,
+    hex_masks_to_cpulists,
+    hex_masks_to_ints,
+    int_to_cpulist,
+    int_to_cpus,
+    int_to_hex_mask,
+    ints_to_hex_masks,
+    spread_cpus,
+)
+
+
+class TestCPUMask:
+    @pytest.mark.parametrize(
+        "cpulist, mask",
+        [("", 0), ("0", 1), ("0-3", 0xF), ("0-3,8", 0x10F), ("1,3,5", 0x2A), ("0-15,64-79", 0xFFFF << 64 | 0xFFFF)],
+    )
+    def test_cpulist(self, cpulist, mask):
+        assert cpulist_to_int(cpulist) == mask
+        assert int_to_cpulist(mask) == cpulist
+
+    def test_cpulist_minimal_ranges(self):
+        assert int_to_cpulist(cpulist_to_int("3,0-1,2,8-9,10\n")) == "0-3,8-10"
+        assert int_to_cpulist((1 << 1024) - 1) == "0-1023"
+
+    def test_incorrect_cpulist(self):
+        for cpulist in ("3-1", "-1", "a", "1-"):
+            with pytest.raises(ValueError):
+                cpulist_to_int(cpulist)
+
+    @pytest.mark.parametrize(
+        "mask, cpu_count, hex_mask",
+        [
+            (0, None, "0"),
+            (0xFF, None, "ff"),
+            (0xFF, 8, "ff"),
+            (0xF, 40, "00,0000000f"),
+            (1 << 32, None, "1,00000000"),
+            (0xFFFF << 64 | 0xFFFF, 96, "0000ffff,00000000,0000ffff"),
+            (0, 64, "00000000,00000000"),
+        ],
+    )
+    def test_hex_mask(self, mask, cpu_count, hex_mask):
+        assert int_to_hex_mask(mask, cpu_count) == hex_mask
+        assert hex_mask_to_int(hex_mask) == mask
+
+    def test_hex_mask_short_groups(self):
+        assert hex_mask_to_int("f,f") == 0xF << 32 | 0xF
+        assert hex_mask_to_int("0x0000ffff\n") == 0xFFFF
+        assert hex_mask_to_int("FF,0000FFFF") == 0xFF0000FFFF
+
+    def test_incorrect_hex_mask(self):
+        for hex_mask in ("", "fg", "1,000000000", "f,,f"):
+            with pytest.raises(ValueError):
+                hex_mask_to_int(hex_mask)
+        with pytest.raises(ValueError):
+            int_to_hex_mask(1 << 64, cpu_count=64)
+
+    def test_cpus(self):
+        assert cpus_to_int([5, 4, 7, 4]) == 0xB0
+        assert int_to_cpus(0xB0) == [4, 5, 7]
+        assert int_to_cpus(0) == []
+        with pytest.raises(ValueError):
+            cpus_to_int([-1])
+
+    def test_cpulist_hex_mask(self):
+        assert cpulist_to_hex_mask("0-15,32-39") == "ff,0000ffff"
+        assert hex_mask_to_cpulist("000000ff,0000ffff") == "0-15,32-39"
+
+    def test_batch(self):
+        cpulists = ["0", "1", "0", "32-33"] * 1000
+        hex_masks = cpulists_to_hex_masks(cpulists, cpu_count=64)
+        assert hex_masks[:4] == ["00000000,00000001", "00000000,00000002", "00000000,00000001", "00000003,00000000"]
+        assert len(hex_masks) == 4000
+        assert hex_masks_to_cpulists(hex_masks) == cpulists
+        masks = hex_masks_to_ints(hex_masks)
+        assert masks[:4] == [1, 2, 1, 3 << 32]
+        assert ints_to_hex_masks(masks, cpu_count=64) == hex_masks
+
+    def test_spread_cpus(self):
+        assert spread_cpus(cpulist_to_int("2-3,8"), 5) == [1 << 2, 1 << 3, 1 << 8, 1 << 2, 1 << 3]
+        with pytest.raises(ValueError):
+            spread_cpus(0, 1)
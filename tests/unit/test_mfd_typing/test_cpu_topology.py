@@ -0,0 +1,136 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_typing.cpu_topology import CPUSet, CPUTopology, create_fake_cpu_topology
+
+CPUINFO = """processor\t: 0
+physical id\t: 0
+core id\t\t: 0
+
+processor\t: 1
+physical id\t: 0
+core id\t\t: 1
+
+processor\t: 2
+physical id\t: 0
+core id\t\t: 0
+
+processor\t: 3
+physical id\t: 0
+core id\t\t: 1
+"""
+
+
+@pytest.fixture()
+def topology(tmp_path):
+    create_fake_cpu_topology(tmp_path, sockets=2, cores_per_socket=4, threads_per_core=2, nodes_per_socket=2)
+    return CPUTopology.from_sysfs(tmp_path)
+
+
+class TestCPUSet:
+    @pytest.mark.parametrize("cpulist", ["", "0", "0-3", "0-3,8", "1,3,5", "0-15,64-79", "511"])
+    def test_cpulist_round_trip(self, cpulist):
+        assert CPUSet.from_cpulist(cpulist).cpulist == cpulist
+
+    def test_cpulist_minimal_ranges(self):
+        assert CPUSet.from_cpulist("3,0-1,2,8-9,10\n").cpulist == "0-3,8-10"
+        assert CPUSet.from_cpus([5, 4, 7]).cpulist == "4-5,7"
+
+    def test_incorrect_cpulist(self):
+        with pytest.raises(ValueError):
+            CPUSet.from_cpulist("3-1")
+        with pytest.raises(ValueError):
+            CPUSet.from_cpulist("a")
+        with pytest.raises(ValueError):
+            CPUSet(-1)
+
+    def test_set_operations(self):
+        first, second = CPUSet.from_cpulist("0-7"), CPUSet.from_cpulist("4-11")
+        assert (first | second).cpulist == "0-11"
+        assert (first & second).cpulist == "4-7"
+        assert (first - second).cpulist == "0-3"
+        assert (first ^ second).cpulist == "0-3,8-11"
+        assert list(first & second) == [4, 5, 6, 7]
+        assert len(first | second) == 12
+        assert 7 in first and 8 not in first and -1 not in first
+        assert not CPUSet() and first
+        assert first == CPUSet(0xFF) and hash(first) == hash(CPUSet(0xFF))
+        assert repr(first) == "CPUSet('0-7')"
+
+    def test_hex_mask(self):
+        cpus = CPUSet.from_hex_mask("ff,0000ffff")
+        assert cpus.cpulist == "0-15,32-39"
+        assert cpus.hex_mask() == "ff,0000ffff"
+        assert cpus.hex_mask(cpu_count=64) == "000000ff,0000ffff"
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError):
+            CPUSet(1).mask = 2
+
+
+class TestCPUTopology:
+    def test_groups(self, topology):
+        assert topology.cpu_count == 16
+        assert topology.online.cpulist == "0-15"
+        assert len(topology.cores) == 8
+        assert topology.sockets == {0: CPUSet.from_cpulist("0-3,8-11"), 1: CPUSet.from_cpulist("4-7,12-15")}
+        assert topology.node_cpus(3).cpulist == "6-7,14-15"
+
+    def test_lookups(self, topology):
+        assert topology.socket_of(13) == 1
+        assert topology.node_of(13) == 2
+        assert topology.core_of(13) == topology.core_of(5) == 5
+        assert topology.siblings(13).cpulist == "5,13"
+        assert topology.primary_threads().cpulist == "0-7"
+        assert topology.primary_threads(topology.socket_cpus(1)).cpulist == "4-7"
+        with pytest.raises(KeyError):
+            topology.socket_of(16)
+
+    def test_caches(self, topology):
+        assert len(topology.caches) == 8 * 3 + 2
+        llc = topology.cache_of(13, 3)
+        assert llc.cpus == topology.socket_cpus(1)
+        assert llc.size == 105 * 2**20
+        assert topology.cache_of(13, 1, "Data").cpus.cpulist == "5,13"
+        assert topology.cache_of(13, 4) is None
+
+    def test_offline_cpus(self, tmp_path):
+        create_fake_cpu_topology(tmp_path, cores_per_socket=4, threads_per_core=2)
+        (tmp_path / "sys/devices/system/cpu/online").write_text("0-3,5-7\n")
+        topology = CPUTopology.load(tmp_path)
+        assert topology.online.cpulist == "0-3,5-7"
+        assert topology.siblings(0).cpulist == "0"
+        assert topology.node_cpus(0).cpulist == "0-3,5-7"
+        with pytest.raises(KeyError):
+            topology.core_of(4)
+
+    def test_large_host(self):
+        cores = [CPUSet.from_cpus([core, core + 320]) for core in range(320)]
+        sockets = {
+            socket: CPUSet.from_cpulist(
+                f"{socket * 160}-{socket * 160 + 159},{socket * 160 + 320}-{socket * 160 + 479}"
+            )
+            for socket in range(2)
+        }
+        nodes = {
+            node: CPUSet.from_cpulist(f"{node * 80}-{node * 80 + 79},{node * 80 + 320}-{node * 80 + 399}")
+            for node in range(4)
+        }
+        topology = CPUTopology(cores, sockets, nodes)
+        assert topology.cpu_count == 640
+        assert topology.node_of(639) == 3
+        assert topology.siblings(639).cpulist == "319,639"
+
+    def test_cpuinfo_fallback(self, tmp_path):
+        (tmp_path / "proc").mkdir()
+        (tmp_path / "proc/cpuinfo").write_text(CPUINFO)
+        topology = CPUTopology.load(tmp_path)
+        assert [cpus.cpulist for cpus in topology.cores] == ["0,2", "1,3"]
+        assert topology.sockets == {0: CPUSet(0xF)}
+        assert topology.node_of(3) == 0
+        assert topology.caches == ()
+
+    def test_cpuinfo_without_core_ids(self):
+        topology = CPUTopology.from_cpuinfo("processor\t: 0\n\nprocessor\t: 1\n")
+        assert [cpus.cpulist for cpus in topology.cores] == ["0", "1"]
@@ -3,7 +3,13 @@
 
 from dataclasses import dataclass, fields
 
-from mfd_typing.dataclass_utils import get_field_type, convert_value_field_to_typehint_type
+from mfd_typing.dataclass_utils import (
+    get_field_type,
+    convert_value_field_to_typehint_type,
+    convert_fields_to_typehint_types,
+    get_conversion_plan,
+    resolve_field_type,
+)
 
 
 @dataclass
@@ -31,3 +37,42 @@ class TestDataclassUtils:
         assert isinstance(obj.field2, str)
         assert isinstance(obj.field3, str)
         assert isinstance(obj.field4, int)
+
+
+@dataclass
+class ForwardRefClass:
+    field1: "int"
+    field2: "ForwardRefClass | None" = None
+    field3: "UnknownType | None" = None  # noqa: F821
+
+
+class TestConversionPlan:
+    def test_resolve_field_type_forward_ref(self):
+        field_types = {f.name: resolve_field_type(f, ForwardRefClass) for f in fields(ForwardRefClass)}
+
+        assert field_types == {"field1": int, "field2": ForwardRefClass, "field3": None}
+
+    def test_get_conversion_plan(self):
+        assert get_conversion_plan(TestClass) == (("field1", int), ("field2", str), ("field3", str), ("field4", int))
+        assert get_conversion_plan(ForwardRefClass) == (("field1", int), ("field2", ForwardRefClass))
+
+    def test_get_conversion_plan_cached(self):
+        assert get_conversion_plan(TestClass) is get_conversion_plan(TestClass)
+
+    def test_convert_fields_to_typehint_types(self):
+        obj = TestClass(field1=1.123, field2=1.123, field3=None, field4="2")
+
+        convert_fields_to_typehint_types(obj)
+
+        assert obj.field1 == 1
+        assert obj.field2 == "1.123"
+        assert obj.field3 is None
+        assert obj.field4 == 2
+
+    def test_convert_fields_to_typehint_types_unresolved_forward_ref_skipped(self):
+        obj = ForwardRefClass(field1="3", field3=1.5)
+
+        convert_fields_to_typehint_types(obj)
+
+        assert obj.field1 == 3
+        assert obj.field3 == 1.5
@@ -0,0 +1,115 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import asyncio
+import json
+import sys
+
+import pytest
+
+from mfd_typing.fleet_collector import (
+    Collection,
+    CommandError,
+    FakeTransport,
+    FleetCollector,
+    LatencyStats,
+    LocalTransport,
+    parse_uname,
+)
+from mfd_typing.network_interface import InterfaceType
+from mfd_typing.os_values import SystemInfo
+
+IP_LINK_OUTPUT = json.dumps(
+    [{"ifindex": 2, "ifname": "eth0", "link_type": "ether", "address": "6c:fe:54:40:2e:a8", "parentbus": "pci",
+      "parentdev": "0000:18:00.0"}]
+)  # fmt: skip
+OUTPUTS = {"*": {"uname -snrm": "Linux host 6.8.0-45-generic x86_64\n", "ip -json -details link show": IP_LINK_OUTPUT}}
+
+
+def _collect(collector, hosts):
+    async def run():
+        return [result async for result in collector.collect(hosts)]
+
+    return asyncio.run(run())
+
+
+class TestFleetCollector:
+    def test_parse_uname(self):
+        assert parse_uname("Linux host-1 6.8.0-45-generic x86_64\n") == SystemInfo(
+            host_name="host-1", os_name="Linux", kernel_version="6.8.0-45-generic", architecture_info="x86_64"
+        )
+
+    def test_collect_parses_results(self):
+        collector = FleetCollector(FakeTransport(OUTPUTS))
+        results = asyncio.run(collector.collect_all(["host-1", "host-2"]))
+        assert set(results) == {"host-1", "host-2"}
+        result = results["host-1"]
+        assert result.ok
+        assert result.data["system_info"].kernel_version == "6.8.0-45-generic"
+        assert result.data["interfaces"][0].interface_type is InterfaceType.PF
+        assert set(result.command_latencies) == {"system_info", "interfaces"}
+
+    def test_concurrency_limit(self):
+        transport = FakeTransport(OUTPUTS, delays={"*": 0.01})
+        results = _collect(FleetCollector(transport, concurrency=3), (f"host-{i}" for i in range(10)))
+        assert len(results) == 10
+        assert transport.max_in_flight == 3
+
+    def test_results_in_order_of_completion(self):
+        transport = FakeTransport(OUTPUTS, delays={"slow": 0.05, "*": 0})
+        results = _collect(FleetCollector(transport, concurrency=2), ["slow", "fast-1", "fast-2"])
+        assert [result.host for result in results] == ["fast-1", "fast-2", "slow"]
+
+    def test_timeout_and_errors_per_host(self):
+        transport = FakeTransport({**OUTPUTS, "broken": {}}, delays={"stuck": 10, "*": 0})
+        results = asyncio.run(FleetCollector(transport, timeout=0.05).collect_all(["stuck", "broken", "ok"]))
+        assert isinstance(results["stuck"].error, TimeoutError)
+        assert isinstance(results["broken"].error, CommandError)
+        assert results["ok"].ok
+
+    def test_backpressure(self):
+        transport = FakeTransport(OUTPUTS)
+        collector = FleetCollector(transport, concurrency=2, max_pending_results=1)
+
+        async def run():
+            started = []
+
+            async def hosts():
+                for i in range(20):
+                    started.append(i)
+                    yield f"host-{i}"
+
+            iterator = collector.collect(hosts())
+            await anext(iterator)
+            await asyncio.sleep(0.01)
+            count = len(started)
+            await iterator.aclose()
+            return count
+
+        assert asyncio.run(run()) <= 5
+
+    def test_latency_stats(self):
+        transport = FakeTransport(OUTPUTS, delays={"*": 0.01})
+        collector = FleetCollector(transport, collections={"uname": Collection("uname -snrm", parse_uname)})
+        _collect(collector, ["host-1", "host-2"])
+        stats = collector.latency_stats()
+        assert stats.count == 2
+        assert 0.01 <= stats.minimum <= stats.median <= stats.p95 <= stats.maximum
+
+    def test_latency_stats_from_latencies(self):
+        stats = LatencyStats.from_latencies([float(value) for value in range(1, 101)])
+        assert (stats.count, stats.minimum, stats.maximum, stats.mean, stats.p95) == (100, 1.0, 100.0, 50.5, 95.0)
+        assert LatencyStats.from_latencies([]).count == 0
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            FleetCollector(FakeTransport({}), concurrency=0)
+
+    @pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX shell required")
+    def test_local_transport(self):
+        collector = FleetCollector(LocalTransport(), collections={"echo": Collection("echo $MFD_HOST", str.strip)})
+        results = asyncio.run(collector.collect_all(["host-1"]))
+        assert results["host-1"].data["echo"] == "host-1"
+        results = asyncio.run(
+            FleetCollector(LocalTransport(), collections={"fail": Collection("exit 3", str)}).collect_all(["host-1"])
+        )
+        assert results["host-1"].error.return_code == 3
@@ -0,0 +1,110 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pickle
+import threading
+
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice, utils
+from mfd_typing import instrumentation, serialization
+from mfd_typing.network_interface import LinuxInterfaceInfo
+from mfd_typing.pci_address import PCIAddressMissingData
+from mfd_typing.wire_format import decode_records, encode_records
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self):
+        original_init = PCIAddress.__init__
+        original_strtobool = utils.strtobool
+        PCIAddress(0, 0x18, 0, 0)
+        assert not instrumentation.is_enabled()
+        assert instrumentation.snapshot() == {}
+        with instrumentation.instrumented():
+            assert PCIAddress.__init__ is not original_init
+            assert utils.strtobool is not original_strtobool
+        assert PCIAddress.__init__ is original_init
+        assert utils.strtobool is original_strtobool
+
+    def test_counts_calls_and_failures(self):
+        with instrumentation.instrumented():
+            PCIAddress(data="0000:18:00.0")
+            PCIAddress(0, 0x18, 0, 1)
+            with pytest.raises(PCIAddressMissingData):
+                PCIAddress()
+            PCIDevice(data="8086:1592")
+            MACAddress("00:00:00:00:00:01")
+            utils.strtobool("yes")
+            with pytest.raises(ValueError):
+                utils.strtobool("maybe")
+        metrics = instrumentation.snapshot()
+        assert (metrics["PCIAddress"].calls, metrics["PCIAddress"].failures) == (3, 1)
+        assert metrics["PCIDevice"].calls == 1
+        assert metrics["MACAddress"].calls == 1
+        assert (metrics["utils.strtobool"].calls, metrics["utils.strtobool"].failures) == (2, 1)
+        assert sum(metrics["PCIAddress"].buckets) == 3
+        assert metrics["PCIAddress"].total_time > 0
+
+    def test_alternative_constructors_and_decoders(self):
+        from_packed = PCIAddress.__dict__["from_packed"]
+        data = pickle.dumps([PCIAddress(0, 0x18, 0, 1), PCIDevice(data="8086:1592"), MACAddress.from_int(1)])
+        records = encode_records([LinuxInterfaceInfo(name="eth0", mac_address=MACAddress.from_int(1))])
+        with instrumentation.instrumented():
+            PCIAddress.from_packed(0x18 << 16)
+            PCIDevice.from_ids(0x8086, 0x1592)
+            MACAddress.from_int(1)
+            with pytest.raises(ValueError):
+                MACAddress.from_int(-1)
+            pickle.loads(data)
+            assert pickle.loads(pickle.dumps(PCIAddress(0, 0x18, 0, 1))) == PCIAddress(0, 0x18, 0, 1)
+            decode_records(records)[0]
+            serialization.from_dict({"name": "eth0"}, LinuxInterfaceInfo)
+        metrics = instrumentation.snapshot()
+        assert PCIAddress.__dict__["from_packed"] is from_packed
+        # alternative constructors are counted for direct calls and for unpickling and decoding which use them
+        assert metrics["PCIAddress.from_packed"].calls == 3
+        assert metrics["PCIDevice.from_ids"].calls == 2
+        assert (metrics["MACAddress.from_int"].calls, metrics["MACAddress.from_int"].failures) == (4, 1)
+        assert metrics["pci_address._unpickle_pci_address"].calls == 2
+        assert metrics["pci_device._unpickle_pci_device"].calls == 1
+        assert metrics["mac_address._unpickle_mac_address"].calls == 1
+        assert metrics["RecordTable"].calls == 1
+        assert metrics["RecordTable.__getitem__"].calls == 1
+        assert metrics["serialization.from_dict"].calls == 1
+
+    def test_custom_targets(self):
+        with instrumentation.instrumented([("mfd_typing.utils", "decimal_to_hex")]):
+            assert utils.decimal_to_hex(10) == "0x0000000a"
+            utils.strtobool("yes")
+        assert set(instrumentation.snapshot()) == {"utils.decimal_to_hex"}
+
+    def test_thread_safe_counting(self):
+        with instrumentation.instrumented([("mfd_typing.utils", "strtobool")]):
+            threads = [threading.Thread(target=lambda: [utils.strtobool("yes") for _ in range(1000)]) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert instrumentation.snapshot()["utils.strtobool"].calls == 8000
+
+    def test_reset(self):
+        with instrumentation.instrumented([("mfd_typing.utils", "strtobool")]):
+            utils.strtobool("yes")
+            assert instrumentation.reset()["utils.strtobool"].calls == 1
+            assert instrumentation.snapshot() == {}
+
+    def test_export_text(self):
+        with instrumentation.instrumented([("mfd_typing.utils", "strtobool")]):
+            utils.strtobool("yes")
+        text = instrumentation.export_text()
+        assert '# TYPE mfd_typing_calls_total counter\nmfd_typing_calls_total{target="utils.strtobool"} 1\n' in text
+        assert 'mfd_typing_failures_total{target="utils.strtobool"} 0' in text
+        assert 'mfd_typing_duration_seconds_bucket{target="utils.strtobool",le="+Inf"} 1' in text
+        assert 'mfd_typing_duration_seconds_count{target="utils.strtobool"} 1' in text
@@ -0,0 +1,108 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress
+from mfd_typing.interface_collection import InterfaceCollection
+from mfd_typing.network_interface import InterfaceType, LinuxInterfaceInfo, WindowsInterfaceInfo
+
+
+@pytest.fixture()
+def interfaces():
+    return [
+        LinuxInterfaceInfo(
+            name="eth0",
+            pci_address=PCIAddress(data="0000:18:00.0"),
+            mac_address=MACAddress("00:00:00:00:00:01"),
+            interface_type=InterfaceType.PF,
+        ),
+        LinuxInterfaceInfo(
+            name="eth0v0",
+            pci_address=PCIAddress(data="0000:18:01.0"),
+            interface_type=InterfaceType.VF,
+            namespace="ns1",
+        ),
+        LinuxInterfaceInfo(
+            name="eth0v1",
+            pci_address=PCIAddress(data="0000:18:01.1"),
+            interface_type=InterfaceType.VF,
+            namespace="ns2",
+        ),
+        LinuxInterfaceInfo(name="eth0", interface_type=InterfaceType.VF, namespace="ns1"),
+        WindowsInterfaceInfo(name="Ethernet", guid="{1}", pnp_device_id="PCI\\VEN_8086"),
+    ]
+
+
+@pytest.fixture()
+def collection(interfaces):
+    return InterfaceCollection(interfaces)
+
+
+class TestInterfaceCollection:
+    def test_len_iter_contains(self, collection, interfaces):
+        assert len(collection) == 5
+        assert list(collection) == interfaces
+        assert interfaces[0] in collection
+        assert LinuxInterfaceInfo(name="eth0") not in collection
+
+    def test_add_twice(self, collection, interfaces):
+        collection.add(interfaces[0])
+
+        assert len(collection) == 5
+        assert len(collection.find(name="eth0")) == 2
+
+    def test_find_single_index(self, collection, interfaces):
+        assert collection.find(name="eth0") == [interfaces[0], interfaces[3]]
+        assert collection.find(guid="{1}") == [interfaces[4]]
+        assert collection.find(pnp_device_id="PCI\\VEN_8086") == [interfaces[4]]
+        assert collection.find(name="eth5") == []
+
+    def test_find_normalized_values(self, collection, interfaces):
+        assert collection.find(mac_address="00-00-00-00-00-01") == [interfaces[0]]
+        assert collection.find(pci_address="0000:18:01.1") == [interfaces[2]]
+        assert collection.find(pci_address=PCIAddress(0, 0x18, 1, 1)) == [interfaces[2]]
+
+    def test_find_composite(self, collection, interfaces):
+        assert collection.find(interface_type=InterfaceType.VF, namespace="ns1") == [interfaces[1], interfaces[3]]
+        assert collection.find(interface_type=InterfaceType.VF, namespace="ns1", name="eth0") == [interfaces[3]]
+        assert collection.find(interface_type=InterfaceType.PF, namespace="ns1") == []
+
+    def test_find_not_indexed_attribute(self, collection, interfaces):
+        interfaces[2].installed = True
+
+        assert collection.find(installed=True) == [interfaces[2]]
+        assert collection.find(interface_type=InterfaceType.VF, installed=True) == [interfaces[2]]
+
+    def test_find_no_criteria(self, collection, interfaces):
+        assert collection.find() == interfaces
+
+    def test_get(self, collection, interfaces):
+        assert collection.get(name="eth0v0") is interfaces[1]
+        assert collection.get(name="eth5") is None
+        with pytest.raises(ValueError):
+            collection.get(name="eth0")
+
+    def test_remove(self, collection, interfaces):
+        collection.remove(interfaces[1])
+
+        assert len(collection) == 4
+        assert collection.find(namespace="ns1") == [interfaces[3]]
+        with pytest.raises(KeyError):
+            collection.remove(interfaces[1])
+        collection.discard(interfaces[1])
+
+    def test_update(self, collection, interfaces):
+        collection.update(interfaces[1], name="eth1", namespace="ns3")
+
+        assert interfaces[1].name == "eth1"
+        assert collection.find(namespace="ns1") == [interfaces[3]]
+        assert collection.get(name="eth1", namespace="ns3") is interfaces[1]
+
+    def test_refresh(self, collection, interfaces):
+        interfaces[0].mac_address = MACAddress("00:00:00:00:00:02")
+        collection.refresh(interfaces[0])
+
+        assert collection.find(mac_address="00:00:00:00:00:01") == []
+        assert collection.get(mac_address="00:00:00:00:00:02") is interfaces[0]
+        with pytest.raises(KeyError):
+            collection.refresh(LinuxInterfaceInfo())
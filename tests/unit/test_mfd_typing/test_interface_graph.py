@@ -0,0 +1,105 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_typing.interface_graph import InterfaceGraph, interface_key
+from mfd_typing.network_interface import InterfaceType, LinuxInterfaceInfo, VlanInterfaceInfo
+
+
+def _interface(name, interface_type, namespace=None, vlan_parent=None, vlan_id=None):
+    return LinuxInterfaceInfo(
+        name=name,
+        interface_type=interface_type,
+        namespace=namespace,
+        vlan_info=VlanInterfaceInfo(vlan_id, vlan_parent) if vlan_parent else None,
+    )
+
+
+@pytest.fixture()
+def graph():
+    interfaces = [
+        _interface("eth0", InterfaceType.PF),
+        _interface("eth1", InterfaceType.PF),
+        _interface("eth0v0", InterfaceType.VF),
+        _interface("eth1v0", InterfaceType.VF),
+        _interface("bond0", InterfaceType.BOND),
+        _interface("bond0.10", InterfaceType.VLAN, vlan_parent="bond0", vlan_id=10),
+        _interface("eth0v1", InterfaceType.VF, namespace="ns1"),
+        _interface("eth0v1.20", InterfaceType.VLAN, namespace="ns1", vlan_parent="eth0v1", vlan_id=20),
+    ]
+    links = [
+        ("eth0v0", "eth0"),
+        ("eth1v0", "eth1"),
+        ("bond0", "eth0v0"),
+        ("bond0", "eth1v0"),
+        (("ns1", "eth0v1"), "eth0"),
+    ]
+    return InterfaceGraph(interfaces, links=links)
+
+
+def _names(interfaces):
+    return sorted(interface.name for interface in interfaces)
+
+
+class TestInterfaceGraph:
+    def test_interface_key(self):
+        assert interface_key(_interface("eth0", InterfaceType.PF, namespace="ns1")) == ("ns1", "eth0")
+
+    def test_parents_and_children(self, graph):
+        assert _names(graph.parents("bond0")) == ["eth0v0", "eth1v0"]
+        assert _names(graph.children("bond0")) == ["bond0.10"]
+        assert _names(graph.children(("ns1", "eth0v1"))) == ["eth0v1.20"]
+
+    def test_ancestors(self, graph):
+        assert _names(graph.ancestors("bond0.10")) == ["bond0", "eth0", "eth0v0", "eth1", "eth1v0"]
+        assert graph.ancestors("bond0.10")[0].name == "bond0"
+
+    def test_descendants(self, graph):
+        assert _names(graph.affected_by("eth0")) == ["bond0", "bond0.10", "eth0v0", "eth0v1", "eth0v1.20"]
+        assert graph.descendants("bond0.10") == []
+
+    def test_underlying_ports(self, graph):
+        assert _names(graph.underlying_ports("bond0.10")) == ["eth0", "eth1"]
+        assert _names(graph.underlying_ports(("ns1", "eth0v1.20"))) == ["eth0"]
+        assert _names(graph.underlying_ports("eth0")) == ["eth0"]
+
+    def test_namespace(self, graph):
+        assert _names(graph.namespace("ns1")) == ["eth0v1", "eth0v1.20"]
+        assert len(graph.namespace(None)) == 6
+
+    def test_remove_and_add_again(self, graph):
+        eth1v0 = graph.remove("eth1v0")
+        assert "eth1v0" not in graph
+        assert _names(graph.underlying_ports("bond0.10")) == ["eth0"]
+        assert _names(graph.affected_by("eth1")) == []
+        graph.add(eth1v0)
+        assert _names(graph.underlying_ports("bond0.10")) == ["eth0", "eth1"]
+
+    def test_vlan_parent_changed(self, graph):
+        graph.add(_interface("bond0.10", InterfaceType.VLAN, vlan_parent="eth1", vlan_id=10))
+        assert _names(graph.parents("bond0.10")) == ["eth1"]
+        assert _names(graph.children("bond0")) == []
+
+    def test_unlink(self, graph):
+        graph.unlink("bond0", "eth0v0")
+        assert _names(graph.affected_by("eth0")) == ["eth0v0", "eth0v1", "eth0v1.20"]
+
+    def test_explicit_link_kept_when_vlan_readded_or_removed(self, graph):
+        graph.link("bond0.10", "bond0")
+
+        graph.add(_interface("bond0.10", InterfaceType.VLAN, vlan_parent="bond0", vlan_id=10))
+        assert _names(graph.parents("bond0.10")) == ["bond0"]
+        vlan = graph.remove("bond0.10")
+        graph.add(_interface("bond0.10", InterfaceType.VLAN, vlan_id=10))
+        assert _names(graph.parents("bond0.10")) == ["bond0"]
+        graph.unlink("bond0.10", "bond0")
+        assert graph.parents("bond0.10") == []
+        graph.add(vlan)
+        graph.unlink("bond0.10", "bond0")
+        assert _names(graph.parents("bond0.10")) == ["bond0"]
+
+    def test_len_iter_getitem(self, graph):
+        assert len(graph) == len(list(graph)) == 8
+        assert graph["eth0"].interface_type is InterfaceType.PF
+        with pytest.raises(KeyError):
+            graph.remove("missing")
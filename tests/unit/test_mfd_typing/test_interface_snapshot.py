@@ -0,0 +1,190 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import json
+import os
+import subprocess
+import sys
+from operator import attrgetter
+from pathlib import Path
+
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.interface_snapshot import InterfaceSnapshot, SnapshotDiff, default_identity_key
+from mfd_typing.network_interface import (
+    InterfaceInfo,
+    InterfaceType,
+    LinuxInterfaceInfo,
+    VlanInterfaceInfo,
+    VsiInfo,
+    WindowsInterfaceInfo,
+)
+
+
+def _poll(**changes):
+    pf = LinuxInterfaceInfo(
+        name="eth0",
+        pci_address=PCIAddress(data="0000:18:00.0"),
+        pci_device=PCIDevice(data="8086:1592"),
+        mac_address=MACAddress("00:00:00:00:00:01"),
+        interface_type=InterfaceType.PF,
+    )
+    vlan = LinuxInterfaceInfo(
+        name="eth0.10", interface_type=InterfaceType.VLAN, vlan_info=VlanInterfaceInfo(vlan_id=10, parent="eth0")
+    )
+    interfaces = {"pf": pf, "vlan": vlan}
+    interfaces.update(changes)
+    return [interface for interface in interfaces.values() if interface is not None]
+
+
+class TestInterfaceSnapshot:
+    def test_default_identity_key(self):
+        vsi_info = VsiInfo(fn_id=0, host_id=0, is_vf=False, vsi_id=7, vport_id=0, is_created=True, is_enabled=True)
+        pci_address = PCIAddress(data="0000:18:00.0")
+
+        assert default_identity_key(WindowsInterfaceInfo(name="Ethernet", guid="{1}")) == ("guid", "{1}")
+        assert default_identity_key(LinuxInterfaceInfo(name="eth0", pci_address=pci_address)) == ("pci", pci_address)
+        assert default_identity_key(
+            LinuxInterfaceInfo(pci_address=pci_address, interface_type=InterfaceType.VPORT, vsi_info=vsi_info)
+        ) == ("vsi", pci_address, 7)
+        assert default_identity_key(LinuxInterfaceInfo(name="br0", namespace="ns1")) == ("name", "ns1", "br0")
+
+    def test_snapshot_access(self):
+        interfaces = _poll()
+        snapshot = InterfaceSnapshot(interfaces)
+
+        assert len(snapshot) == 2
+        assert list(snapshot) == interfaces
+        assert ("name", None, "eth0.10") in snapshot
+        assert snapshot[("pci", PCIAddress(data="0000:18:00.0"))] is interfaces[0]
+        assert snapshot.content_hash(("name", None, "eth0.10")) == InterfaceSnapshot(_poll()).content_hash(
+            ("name", None, "eth0.10")
+        )
+
+    def test_content_hash_stable_between_processes(self):
+        code = (
+            "from mfd_typing.interface_snapshot import InterfaceSnapshot\n"
+            "from tests.unit.test_mfd_typing.test_interface_snapshot import _poll\n"
+            "snapshot = InterfaceSnapshot(_poll())\n"
+            "print([snapshot.content_hash(key) for key in snapshot.keys()])"
+        )
+        hashes = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                cwd=Path(__file__).parents[3],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            for seed in ("1", "2")
+        }
+        snapshot = InterfaceSnapshot(_poll())
+        assert hashes == {f"{[snapshot.content_hash(key) for key in snapshot.keys()]}\n"}
+
+    def test_identity_not_unique(self):
+        with pytest.raises(ValueError):
+            InterfaceSnapshot([LinuxInterfaceInfo(name="br0"), LinuxInterfaceInfo(name="br0")])
+
+    def test_diff_no_changes(self):
+        assert not InterfaceSnapshot(_poll()).diff(InterfaceSnapshot(_poll()))
+
+    def test_diff_changed_fields(self):
+        old = InterfaceSnapshot(_poll())
+        renamed = _poll()[0]
+        renamed.name = "ens1"
+        renamed.mac_address = MACAddress("00:00:00:00:00:02")
+
+        diff = old.diff(InterfaceSnapshot(_poll(pf=renamed)))
+
+        change = diff.changed[("pci", PCIAddress(data="0000:18:00.0"))]
+        assert not diff.added and not diff.removed
+        assert change.fields == {
+            "name": ("eth0", "ens1"),
+            "mac_address": (MACAddress("00:00:00:00:00:01"), MACAddress("00:00:00:00:00:02")),
+        }
+        assert change.changes == {"name": "ens1", "mac_address": MACAddress("00:00:00:00:00:02")}
+        assert change.key == ("pci", PCIAddress(data="0000:18:00.0"))
+        assert not hasattr(change, "old") and not hasattr(change, "new")
+
+    def test_diff_nested_and_sub_ids(self):
+        old = InterfaceSnapshot(_poll())
+        vlan = LinuxInterfaceInfo(
+            name="eth0.10", interface_type=InterfaceType.VLAN, vlan_info=VlanInterfaceInfo(vlan_id=11, parent="eth0")
+        )
+        pf = _poll()[0]
+        pf.pci_device = PCIDevice(data="8086:1592:8086:0001")
+
+        diff = old.diff(InterfaceSnapshot(_poll(pf=pf, vlan=vlan)))
+
+        assert set(diff.changed[("name", None, "eth0.10")].fields) == {"vlan_info"}
+        assert set(diff.changed[("pci", PCIAddress(data="0000:18:00.0"))].fields) == {"pci_device"}
+
+    def test_diff_added_removed(self):
+        vf = LinuxInterfaceInfo(
+            name="eth0v0", pci_address=PCIAddress(data="0000:18:01.0"), interface_type=InterfaceType.VF
+        )
+
+        diff = InterfaceSnapshot(_poll()).diff(InterfaceSnapshot(_poll(vlan=None, vf=vf)))
+
+        assert diff.added == {("pci", PCIAddress(data="0000:18:01.0")): vf}
+        assert list(diff.removed) == [("name", None, "eth0.10")]
+        assert not diff.changed
+
+    def test_apply_chained_diffs(self):
+        first = InterfaceSnapshot(_poll())
+        renamed = _poll()[0]
+        renamed.name = "ens1"
+        second = InterfaceSnapshot(_poll(pf=renamed))
+        vf = LinuxInterfaceInfo(
+            name="eth0v0", pci_address=PCIAddress(data="0000:18:01.0"), interface_type=InterfaceType.VF
+        )
+        third = InterfaceSnapshot(_poll(pf=renamed, vlan=None, vf=vf))
+
+        rebuilt = first.apply(first.diff(second)).apply(second.diff(third))
+
+        assert not rebuilt.diff(third)
+        assert list(rebuilt) == list(third)
+
+    def test_apply_record_class_changed(self):
+        old = InterfaceSnapshot([InterfaceInfo(name="eth0")], key=attrgetter("name"))
+        new = InterfaceSnapshot([LinuxInterfaceInfo(name="eth0", namespace="ns1")], key=attrgetter("name"))
+
+        diff = old.diff(new)
+        rebuilt = old.apply(diff)
+
+        assert diff.changed["eth0"].record_class is LinuxInterfaceInfo
+        assert diff.changed["eth0"].fields["namespace"] == (None, "ns1")
+        assert type(rebuilt["eth0"]) is LinuxInterfaceInfo
+        assert not rebuilt.diff(new)
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_diff_to_dict_from_dict_apply(self, compact):
+        first = InterfaceSnapshot(_poll())
+        renamed = _poll()[0]
+        renamed.name = "ens1"
+        renamed.mac_address = MACAddress("00:00:00:00:00:02")
+        vf = LinuxInterfaceInfo(
+            name="eth0v0", pci_address=PCIAddress(data="0000:18:01.0"), interface_type=InterfaceType.VF
+        )
+        second = InterfaceSnapshot(_poll(pf=renamed, vlan=None, vf=vf))
+        diff = first.diff(second)
+
+        decoded = SnapshotDiff.from_dict(json.loads(json.dumps(diff.to_dict(compact))), compact)
+
+        assert decoded == diff
+        rebuilt = first.apply(decoded)
+        assert not rebuilt.diff(second)
+        assert list(rebuilt) == list(second)
+
+    def test_diff_from_dict_unknown_class(self):
+        diff_dict = {"added": [{"key": "eth0", "class": "Unknown", "record": {}}], "removed": [], "changed": []}
+
+        with pytest.raises(ValueError, match="Unknown record class: Unknown"):
+            SnapshotDiff.from_dict(diff_dict)
+
+    def test_diff_to_dict_unsupported_key(self):
+        diff = SnapshotDiff(added={frozenset(): InterfaceInfo()})
+
+        with pytest.raises(TypeError, match="frozenset"):
+            diff.to_dict()
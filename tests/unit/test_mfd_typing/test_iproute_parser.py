@@ -0,0 +1,144 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import io
+import json
+
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress
+from mfd_typing.iproute_parser import iter_ip_links, iter_json_array, link_to_interface_info, load_ip_links
+from mfd_typing.network_interface import InterfaceType, VlanInterfaceInfo
+
+IP_LINK_OUTPUT = json.dumps(
+    [
+        {
+            "ifindex": 1,
+            "ifname": "lo",
+            "flags": ["LOOPBACK", "UP", "LOWER_UP"],
+            "mtu": 65536,
+            "link_type": "loopback",
+            "address": "00:00:00:00:00:00",
+        },
+        {
+            "ifindex": 2,
+            "ifname": "eth0",
+            "master": "bond0",
+            "link_type": "ether",
+            "address": "6c:fe:54:40:2e:a8",
+            "linkinfo": {"info_slave_kind": "bond", "info_slave_data": {"state": "ACTIVE"}},
+            "parentbus": "pci",
+            "parentdev": "0000:18:00.0",
+        },
+        {
+            "ifindex": 3,
+            "ifname": "eth1",
+            "link_type": "ether",
+            "address": "6c:fe:54:40:2e:a9",
+            "parentbus": "pci",
+            "parentdev": "0000:18:00.1",
+        },
+        {
+            "ifindex": 4,
+            "ifname": "bond0",
+            "link_type": "ether",
+            "address": "6c:fe:54:40:2e:a8",
+            "linkinfo": {"info_kind": "bond", "info_data": {"mode": "active-backup"}},
+        },
+        {
+            "ifindex": 5,
+            "link": "bond0",
+            "ifname": "bond0.10",
+            "link_type": "ether",
+            "address": "6c:fe:54:40:2e:a8",
+            "linkinfo": {"info_kind": "vlan", "info_data": {"protocol": "802.1Q", "id": 10, "flags": ["REORDER_HDR"]}},
+        },
+        {
+            "ifindex": 6,
+            "ifname": "br0",
+            "link_type": "ether",
+            "address": "aa:bb:cc:dd:ee:ff",
+            "linkinfo": {"info_kind": "bridge"},
+        },
+        {"ifindex": 7, "ifname": "ib0", "link_type": "infiniband", "address": "00:00:10:49:fe:80:00:00:00:00"},
+    ],
+    indent=4,
+)
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 65536])
+    def test_elements_decoded_regardless_of_chunk_size(self, chunk_size):
+        data = [{"a": [1, 2, {"b": "]"}]}, 12345, "x,y", [], None, 1.5]
+        assert list(iter_json_array(io.StringIO(json.dumps(data)), chunk_size=chunk_size)) == data
+
+    def test_empty_array(self):
+        assert list(iter_json_array(io.StringIO(" [ ] "))) == []
+
+    def test_not_array(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO('{"a": 1}')))
+
+    def test_truncated(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO('[{"a": 1}, {"b"'), chunk_size=4))
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 65536])
+    @pytest.mark.parametrize(
+        "data", ["[,1]", "[1,,2]", "[1,]", "[1 2]", "[1] [2]", "[1]garbage", "[1.x]", "[tru]", "["]
+    )
+    def test_malformed(self, data, chunk_size):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO(data), chunk_size=chunk_size))
+
+    def test_whitespace_after_array(self):
+        assert list(iter_json_array(io.StringIO("[1, 2.5e1 ,true]\n  \n"), chunk_size=2)) == [1, 25.0, True]
+
+    def test_malformed_element_not_read_to_end(self, mocker):
+        stream = io.StringIO('[{"a": x}, ' + ", ".join(['{"b": 1}'] * 10000) + "]")
+        read = mocker.spy(stream, "read")
+
+        with pytest.raises(ValueError):
+            list(iter_json_array(stream, chunk_size=64))
+
+        assert read.call_count < 5
+
+
+class TestIprouteParser:
+    def test_interface_types(self):
+        interfaces = {interface.name: interface for interface in iter_ip_links(IP_LINK_OUTPUT)}
+        assert {name: interface.interface_type for name, interface in interfaces.items()} == {
+            "lo": InterfaceType.VIRTUAL_DEVICE,
+            "eth0": InterfaceType.BOND_SLAVE,
+            "eth1": InterfaceType.PF,
+            "bond0": InterfaceType.BOND,
+            "bond0.10": InterfaceType.VLAN,
+            "br0": InterfaceType.VIRTUAL_DEVICE,
+            "ib0": InterfaceType.GENERIC,
+        }
+
+    def test_interface_attributes(self):
+        interfaces = {interface.name: interface for interface in iter_ip_links(IP_LINK_OUTPUT)}
+        assert interfaces["eth0"].pci_address == PCIAddress(data="0000:18:00.0")
+        assert interfaces["eth0"].mac_address == MACAddress("6c:fe:54:40:2e:a8")
+        assert interfaces["bond0.10"].vlan_info == VlanInterfaceInfo(vlan_id=10, parent="bond0")
+        assert interfaces["bond0"].pci_address is None
+        assert interfaces["lo"].mac_address is None
+        assert interfaces["ib0"].mac_address is None
+
+    def test_addr_output(self):
+        link = {
+            "ifindex": 2,
+            "ifname": "eth1",
+            "link_type": "ether",
+            "address": "6c:fe:54:40:2e:a9",
+            "addr_info": [{"family": "inet", "local": "10.10.10.1", "prefixlen": 24}],
+        }
+        interface = link_to_interface_info(link, namespace="ns1")
+        assert interface.name == "eth1"
+        assert interface.namespace == "ns1"
+        assert interface.interface_type is InterfaceType.GENERIC
+
+    def test_load_from_many_namespaces(self):
+        interfaces = load_ip_links({None: IP_LINK_OUTPUT, "ns1": io.StringIO(IP_LINK_OUTPUT)})
+        assert len(interfaces) == 14
+        assert [interface.namespace for interface in interfaces].count("ns1") == 7
@@ -0,0 +1,59 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import mfd_typing
+
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True)
+
+
+class TestLazyImports:
+    def test_import_does_not_load_heavy_dependencies(self):
+        result = _run("""
+            import sys
+            import mfd_typing
+            from mfd_typing import OSName, PCIAddress, PCIDevice
+            assert int(PCIDevice(data="8086:1592").vendor_id) == 0x8086
+            assert PCIAddress(data="0000:18:00.0").bus == 0x18
+            assert OSName.LINUX
+            assert "netaddr" not in sys.modules and "generate_mac" not in sys.modules, sorted(sys.modules)
+            mfd_typing.MACAddress("00:00:00:00:00:01")
+            assert "netaddr" in sys.modules
+            """)
+        assert result.returncode == 0, result.stderr
+
+    def test_core_types_without_netaddr(self):
+        result = _run("""
+            import sys
+            sys.modules["netaddr"] = None  # import of netaddr raises ImportError
+            from mfd_typing import OSName, OSType, PCIAddress, PCIDevice, VendorID
+            from mfd_typing.os_values import SystemInfo
+            from mfd_typing.utils import strtobool
+            assert int(PCIDevice(data="8086:1592:8086:0002").sub_device_id) == 2
+            assert PCIAddress(0, 0x18, 0, 1).lspci == "0000:18:00.1"
+            assert strtobool("yes")
+            try:
+                from mfd_typing import MACAddress
+            except ImportError:
+                pass
+            else:
+                raise AssertionError("MACAddress requires netaddr")
+            """)
+        assert result.returncode == 0, result.stderr
+
+    def test_exported_names(self):
+        assert set(mfd_typing.__all__) <= set(dir(mfd_typing))
+        for name in mfd_typing.__all__:
+            assert getattr(mfd_typing, name).__name__ == name
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            mfd_typing.NotExisting
+        with pytest.raises(ImportError):
+            from mfd_typing import NotExisting  # noqa: F401
@@ -1,8 +1,10 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
 
+import pickle
+
 import pytest
-from netaddr import mac_eui48
+from netaddr import mac_eui48, mac_unix
 from unittest import mock
 
 from mfd_typing import MACAddress
@@ -95,3 +97,22 @@ class TestMACAddress:
 
     def test_parse_mac_success(self):
         assert mac.parse_mac(MACAddress("3c:fd:fe:bc:b7:68")) == "{0xfd3c,0xbcfe,0x68b7}"
+
+    def test_from_int(self):
+        mac_address = MACAddress.from_int(0x001B774954FD)
+        assert mac_address == MACAddress("00:1b:77:49:54:fd")
+        assert repr(mac_address) == "MACAddress('00:1b:77:49:54:fd')"
+        assert str(MACAddress.from_int(0x001B774954FD, dialect=mac_unix)) == "0:1b:77:49:54:fd"
+        with pytest.raises(ValueError):
+            MACAddress.from_int(1 << 48)
+
+    def test_pickle(self):
+        mac_address = MACAddress("00:1b:77:49:54:fd")
+        restored = pickle.loads(pickle.dumps(mac_address))
+        assert restored == mac_address
+        assert str(restored) == "00:1b:77:49:54:fd"
+        assert repr(restored) == "MACAddress('00:1b:77:49:54:fd')"
+
+    def test_pickle_keeps_dialect(self):
+        restored = pickle.loads(pickle.dumps(MACAddress("00:1b:77:49:54:fd", dialect=mac_unix)))
+        assert str(restored) == "0:1b:77:49:54:fd"
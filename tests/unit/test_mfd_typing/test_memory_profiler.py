@@ -0,0 +1,55 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import sys
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.memory_profiler import measure_allocations, profile
+from mfd_typing.network_interface import InterfaceType, LinuxInterfaceInfo
+
+
+def _interface(index, pci_device=None):
+    return LinuxInterfaceInfo(
+        pci_address=PCIAddress(0, 0x18, 0, index),
+        pci_device=pci_device or PCIDevice(0x8086, 0x1592, 0x8086, 0x0002),
+        name=f"eth{index}",
+        interface_type=InterfaceType.PF,
+        mac_address=MACAddress(0x001B77000000 + index),
+        namespace="".join(["ns", "1"]),  # equal, but not the same object
+    )
+
+
+class TestMemoryProfiler:
+    def test_counts_every_object_once(self):
+        address = PCIAddress(0, 0x18, 0, 0)
+        report = profile([address, address])
+        assert report.by_type["PCIAddress"].count == 1
+        assert report.shared_count >= 1
+        assert report.total_bytes == profile([address]).total_bytes
+
+    def test_per_type_and_per_field(self):
+        report = profile([_interface(0), _interface(1)])
+        assert report.by_type["LinuxInterfaceInfo"].count == 2
+        interface = _interface(0)
+        assert report.by_type["LinuxInterfaceInfo"].bytes == 2 * (
+            sys.getsizeof(interface) + sys.getsizeof(vars(interface))
+        )
+        assert report.by_type["VendorID"].count == 2
+        assert "InterfaceType" not in report.by_type  # enum members are shared, not owned by records
+        assert "type" not in report.by_type  # netaddr dialect of MACAddress
+        assert report.by_field["LinuxInterfaceInfo.pci_device"] > report.by_field["PCIDevice.vendor_id"] > 0
+        assert report.total_bytes == sum(stats.bytes for stats in report.by_type.values())
+
+    def test_shared_objects_are_not_duplicates(self):
+        shared_device = PCIDevice(0x8086, 0x1592, 0x8086, 0x0002)
+        shared = profile([_interface(0, shared_device), _interface(1, shared_device)])
+        separate = profile([_interface(0), _interface(1)])
+        assert "PCIDevice" not in shared.duplicates
+        assert separate.duplicates["PCIDevice"].count == 1
+        assert separate.duplicates["str"].count == 1  # namespace
+        assert separate.total_bytes > shared.total_bytes
+
+    def test_measure_allocations(self):
+        interfaces, allocated, statistics = measure_allocations(lambda: [_interface(index) for index in range(100)])
+        assert len(interfaces) == 100
+        assert allocated > 100 * sys.getsizeof(interfaces[0])
+        assert statistics
@@ -1,9 +1,87 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-from mfd_typing.network_interface import InterfaceType
+from dataclasses import fields, MISSING
+
+import pytest
+
+from mfd_typing.network_interface import (
+    InterfaceType,
+    InterfaceInfo,
+    LinuxInterfaceInfo,
+    WindowsInterfaceInfo,
+    VlanInterfaceInfo,
+    VsiInfo,
+    ClusterInfo,
+    SlottedInterfaceInfo,
+    SlottedLinuxInterfaceInfo,
+    SlottedWindowsInterfaceInfo,
+    SlottedVlanInterfaceInfo,
+    SlottedVsiInfo,
+    SlottedClusterInfo,
+)
+from mfd_typing.dataclass_utils import to_dict_based, to_slotted
 
 
 def test_interface_type():
     """Test InterfaceType enum."""
     assert InterfaceType.BOND
     assert InterfaceType.BOND_SLAVE
+
+
+INFO_CLASSES = [
+    (InterfaceInfo, SlottedInterfaceInfo),
+    (LinuxInterfaceInfo, SlottedLinuxInterfaceInfo),
+    (WindowsInterfaceInfo, SlottedWindowsInterfaceInfo),
+    (VlanInterfaceInfo, SlottedVlanInterfaceInfo),
+    (VsiInfo, SlottedVsiInfo),
+    (ClusterInfo, SlottedClusterInfo),
+]
+
+
+@pytest.mark.parametrize("cls, slotted", INFO_CLASSES)
+def test_info_dict_based(cls, slotted):
+    """Test info structures keep per-instance __dict__ and accept ad-hoc attributes."""
+    obj = cls(*[0] * len([f for f in fields(cls) if f.default is MISSING]))
+    assert vars(obj) == {f.name: getattr(obj, f.name) for f in fields(cls)}
+    obj.not_a_field = 1
+    assert obj.not_a_field == 1
+
+
+@pytest.mark.parametrize("cls, slotted", INFO_CLASSES)
+def test_info_slotted_variant(cls, slotted):
+    """Test slotted variants have the same fields and don't have per-instance __dict__."""
+    assert slotted.__name__ == f"Slotted{cls.__name__}"
+    assert [(f.name, f.type, f.default) for f in fields(slotted)] == [(f.name, f.type, f.default) for f in fields(cls)]
+    obj = slotted(*[0] * len([f for f in fields(slotted) if f.default is MISSING]))
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.not_a_field = 1
+
+
+def test_slotted_interface_info_inheritance():
+    """Test slotted interface info subclasses keep inheritance chain."""
+    interface = SlottedLinuxInterfaceInfo(name="eth0", namespace="ns1")
+    assert isinstance(interface, SlottedInterfaceInfo)
+    assert not isinstance(interface, InterfaceInfo)
+    assert [f.name for f in fields(SlottedLinuxInterfaceInfo)][-3:] == ["namespace", "vsi_info", "uuid"]
+    interface.interface_type = InterfaceType.PF
+    assert interface == SlottedLinuxInterfaceInfo(name="eth0", namespace="ns1", interface_type=InterfaceType.PF)
+
+
+def test_to_slotted_round_trip():
+    """Test conversion to slotted variant and back, with nested info structures."""
+    interface = WindowsInterfaceInfo(
+        name="Ethernet", vlan_info=VlanInterfaceInfo(vlan_id=10), cluster_info=ClusterInfo()
+    )
+    slotted = to_slotted(interface)
+    assert type(slotted) is SlottedWindowsInterfaceInfo
+    assert type(slotted.vlan_info) is SlottedVlanInterfaceInfo
+    assert type(slotted.cluster_info) is SlottedClusterInfo
+    assert slotted.name == "Ethernet" and slotted.vlan_info.vlan_id == 10
+    assert to_dict_based(slotted) == interface
+
+
+def test_to_slotted_unknown_class():
+    """Test conversion of class without slotted variant."""
+    with pytest.raises(TypeError):
+        to_slotted(InterfaceType.PF)
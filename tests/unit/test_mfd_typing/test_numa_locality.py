@@ -0,0 +1,107 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import os
+
+import pytest
+
+from mfd_typing import PCIAddress
+from mfd_typing.cpu_topology import CPUSet, CPUTopology, create_fake_cpu_topology
+from mfd_typing.network_interface import LinuxInterfaceInfo
+from mfd_typing.numa_locality import (
+    DeviceLocality,
+    NUMALocalityMap,
+    create_fake_pci_locality,
+    get_locality_map,
+    invalidate_locality_cache,
+)
+
+NODE0_CPUS = CPUSet.from_cpulist("0-15,32-47")
+NODE1_CPUS = CPUSet.from_cpulist("16-31,48-63")
+
+
+@pytest.fixture()
+def root(tmp_path):
+    create_fake_pci_locality(tmp_path, PCIAddress(0, 0x18, 0, 0), 0, NODE0_CPUS)
+    create_fake_pci_locality(tmp_path, PCIAddress(0, 0x18, 0, 1), 0, NODE0_CPUS)
+    create_fake_pci_locality(tmp_path, PCIAddress(0, 0xAF, 0, 0), 1, NODE1_CPUS)
+    create_fake_pci_locality(tmp_path, PCIAddress(0, 0, 0x1F, 0), None, CPUSet.from_cpulist("0-63"))
+    (tmp_path / "sys/bus/pci/devices/not_a_device").mkdir()
+    return tmp_path
+
+
+class TestNUMALocalityMap:
+    def test_lookups(self, root):
+        locality_map = NUMALocalityMap(root)
+        assert len(locality_map) == 4
+        assert locality_map.locality(PCIAddress(data="0000:af:00.0")) == DeviceLocality(1, NODE1_CPUS)
+        assert locality_map.numa_node(PCIAddress(0, 0x18, 0, 1)) == 0
+        assert locality_map.numa_node(PCIAddress(0, 0, 0x1F, 0)) is None
+        assert locality_map.local_cpus(PCIAddress(0, 0x18, 0, 1)) == NODE0_CPUS
+        assert locality_map.devices_on_node(0) == [PCIAddress(0, 0x18, 0, 0), PCIAddress(0, 0x18, 0, 1)]
+
+    def test_cpusets_shared(self, root):
+        locality_map = NUMALocalityMap(root)
+        assert locality_map.local_cpus(PCIAddress(0, 0x18, 0, 0)) is locality_map.local_cpus(PCIAddress(0, 0x18, 0, 1))
+
+    def test_interface_locality(self, root):
+        locality_map = NUMALocalityMap(root)
+        interface = LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(0, 0xAF, 0, 0))
+        assert locality_map.interface_locality(interface).numa_node == 1
+        with pytest.raises(ValueError):
+            locality_map.interface_locality(LinuxInterfaceInfo(name="lo"))
+
+    def test_local_cpus_from_topology(self, tmp_path):
+        create_fake_cpu_topology(tmp_path, sockets=2, cores_per_socket=4, threads_per_core=2)
+        create_fake_pci_locality(tmp_path, PCIAddress(0, 0xAF, 0, 0), 1)
+        locality_map = NUMALocalityMap(tmp_path, topology=CPUTopology.from_sysfs(tmp_path))
+        assert locality_map.local_cpus(PCIAddress(0, 0xAF, 0, 0)).cpulist == "4-7,12-15"
+        assert NUMALocalityMap(tmp_path).local_cpus(PCIAddress(0, 0xAF, 0, 0)) == CPUSet()
+
+    def test_hot_plug(self, root):
+        locality_map = NUMALocalityMap(root)
+        new_device = PCIAddress(0, 0xB0, 0, 0)
+        assert new_device not in locality_map
+        create_fake_pci_locality(root, new_device, 1, NODE1_CPUS)
+        assert locality_map.numa_node(new_device) == 1  # missing address refreshes map
+        (root / "sys/bus/pci/devices/0000:18:00.1").unlink()
+        assert locality_map.refresh() == ([], [PCIAddress(0, 0x18, 0, 1)])
+        with pytest.raises(KeyError):
+            locality_map.locality(PCIAddress(0, 0x18, 0, 1))
+
+    def test_missing_address_cached_until_refresh(self, root, mocker):
+        locality_map = NUMALocalityMap(root)
+        new_device = PCIAddress(0, 0xB0, 0, 0)
+        listdir = mocker.spy(os, "listdir")
+        for _ in range(100):
+            with pytest.raises(KeyError):
+                locality_map.locality(new_device)
+        assert listdir.call_count == 1
+        create_fake_pci_locality(root, new_device, 1, NODE1_CPUS)
+        with pytest.raises(KeyError):
+            locality_map.locality(new_device)
+        locality_map.refresh()
+        assert locality_map.numa_node(new_device) == 1
+
+    def test_missing_sysfs(self, tmp_path):
+        assert len(NUMALocalityMap(tmp_path)) == 0
+
+    def test_cache(self, root):
+        invalidate_locality_cache()
+        locality_map = get_locality_map(root)
+        assert get_locality_map(root) is locality_map
+        invalidate_locality_cache(root)
+        assert get_locality_map(root) is not locality_map
+        invalidate_locality_cache()
+
+    def test_cache_with_topology(self, tmp_path):
+        invalidate_locality_cache()
+        create_fake_cpu_topology(tmp_path, sockets=2, cores_per_socket=4, threads_per_core=2)
+        create_fake_pci_locality(tmp_path, PCIAddress(0, 0xAF, 0, 0), 1)
+        topology = CPUTopology.from_sysfs(tmp_path)
+        assert get_locality_map(tmp_path).local_cpus(PCIAddress(0, 0xAF, 0, 0)) == CPUSet()
+        locality_map = get_locality_map(tmp_path, topology)
+        assert locality_map.topology is topology
+        assert locality_map.local_cpus(PCIAddress(0, 0xAF, 0, 0)).cpulist == "4-7,12-15"
+        assert get_locality_map(tmp_path) is locality_map
+        assert get_locality_map(tmp_path, topology) is locality_map
+        invalidate_locality_cache()
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 import pytest
 
-from mfd_typing.os_values import OSName, OSType, OSBitness, SWITCHES_OS_NAME_REGEXES
+from mfd_typing.os_values import OSName, OSType, OSBitness, SWITCHES_OS_NAME_REGEXES, SystemInfo, SlottedSystemInfo
 
 
 class TestOSValues:
@@ -20,3 +20,9 @@ class TestOSValues:
 
     def test_switches_os_name_regexes(self):
         assert OSName.MELLANOX in SWITCHES_OS_NAME_REGEXES
+
+    def test_system_info_dict_based(self):
+        assert vars(SystemInfo(host_name="host"))["host_name"] == "host"
+
+    def test_system_info_slotted_variant(self):
+        assert not hasattr(SlottedSystemInfo(host_name="host"), "__dict__")
@@ -0,0 +1,118 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.network_interface import InterfaceType, LinuxInterfaceInfo
+from mfd_typing.parallel_ingest import (
+    ChunkedRecords,
+    ingest,
+    parse_ip_json_lines,
+    parse_lspci,
+    record_formats,
+    split_chunks,
+)
+from mfd_typing.powershell_parser import parse_format_list
+from mfd_typing.serialization import dump_jsonl
+
+FORMAT_LIST_RECORD = """Description         : Intel(R) Ethernet Network Adapter E810-C-Q2 #{index}
+Installed           : True
+MACAddress          : 6C:FE:54:40:2E:{index:02X}
+NetConnectionID     : SLOT 3 Port {index}
+"""
+
+
+def _link(index: int) -> dict:
+    return {
+        "ifname": f"eth{index}",
+        "link_type": "ether",
+        "address": f"6c:fe:54:00:00:{index:02x}",
+        "parentbus": "pci",
+        "parentdev": f"0000:18:00.{index % 8}",
+    }
+
+
+@pytest.fixture()
+def lspci_file(tmp_path):
+    path = tmp_path / "lspci.txt"
+    path.write_text(
+        "".join(
+            f"0000:{bus:02x}:00.{func} 0200: 8086:{0x1590 + func:04x} (rev 02)\n"
+            for bus in range(256)
+            for func in range(8)
+        )
+    )
+    return path
+
+
+class TestParallelIngest:
+    def test_parse_lspci(self):
+        assert parse_lspci("0000:18:00.0 0200: 8086:1592 (rev 02)\n10000:3b:00.1 0200: 8086:1889\nnot a device\n") == [
+            (PCIAddress(0, 0x18, 0, 0), PCIDevice(0x8086, 0x1592)),
+            (PCIAddress(0x10000, 0x3B, 0, 1), PCIDevice(0x8086, 0x1889)),
+        ]
+
+    def test_parse_ip_json_lines(self):
+        output = "\n".join(json.dumps([_link(index), _link(index + 1)]) for index in (0, 2)) + "\n"
+        interfaces = parse_ip_json_lines(output)
+        assert [interface.name for interface in interfaces] == ["eth0", "eth1", "eth2", "eth3"]
+        assert interfaces[1].interface_type is InterfaceType.PF
+        assert interfaces[1].mac_address == MACAddress("6c:fe:54:00:00:01")
+
+    def test_split_chunks(self, lspci_file):
+        data = lspci_file.read_bytes()
+        chunks = split_chunks(lspci_file, rb"\n", chunk_size=1000)
+        assert len(chunks) > 10
+        assert chunks[0][0] == 0 and chunks[-1][1] == len(data)
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            assert end == start
+            assert data[end - 1 : end] == b"\n"
+
+    def test_split_chunks_empty_file(self, tmp_path):
+        (tmp_path / "empty").write_bytes(b"")
+        assert split_chunks(tmp_path / "empty", rb"\n") == []
+        assert ingest(tmp_path / "empty", "lspci", workers=2).records == []
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_ingest_keeps_order(self, lspci_file, workers):
+        result = ingest(lspci_file, "lspci", workers=workers, chunk_size=4096)
+        assert result.records == parse_lspci(lspci_file.read_text())
+        assert result.stats.records == 2048
+        assert result.stats.bytes == lspci_file.stat().st_size
+        assert result.stats.chunks > 1
+        assert result.stats.bytes_per_second > 0
+
+    def test_ingest_format_list(self, tmp_path):
+        output = "\r\n".join(FORMAT_LIST_RECORD.format(index=index).replace("\n", "\r\n") for index in range(200))
+        path = tmp_path / "adapters.txt"
+        path.write_bytes(output.encode())
+        result = ingest(path, "powershell_format_list", workers=2, chunk_size=512)
+        assert result.stats.chunks > 1
+        assert result.records == list(parse_format_list(output))
+
+    def test_ingest_packed(self, tmp_path):
+        interfaces = [
+            LinuxInterfaceInfo(pci_address=PCIAddress(0, 0x18, index, 0), name=f"eth{index}", namespace="ns1")
+            for index in range(100)
+        ]
+        stream = io.StringIO()
+        dump_jsonl(interfaces, stream, compact=True)
+        path = tmp_path / "interfaces.jsonl"
+        path.write_text(stream.getvalue())
+        with ThreadPoolExecutor(2) as executor:
+            result = ingest(path, "jsonl", chunk_size=256, packed=True, executor=executor)
+        assert isinstance(result.records, ChunkedRecords)
+        assert len(result.records.tables) == result.stats.chunks > 1
+        assert list(result.records) == interfaces
+        assert result.records[-1] == interfaces[-1]
+        with pytest.raises(IndexError):
+            result.records[100]
+
+    def test_packed_requires_record_class(self, lspci_file):
+        assert record_formats["lspci"].record_class is None
+        with pytest.raises(ValueError):
+            ingest(lspci_file, "lspci", packed=True)
@@ -1,5 +1,7 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import pickle
+
 import pytest
 
 from mfd_typing import PCIAddress, PCIDevice
@@ -117,3 +119,28 @@ class TestPCIAddress:
             PCIDAddressIncomparableObject, match="Incorrect object passed for comparison with PCIAddress"
         ):
             PCIAddress(data="0000:20:00.0") < PCIDevice(data="8086:1592")
+
+    def test_pickle(self):
+        pci_address = PCIAddress(0x10000, 0x3B, 0x1F, 7)
+        restored = pickle.loads(pickle.dumps(pci_address))
+        assert restored == pci_address
+        assert hash(restored) == hash(pci_address)
+        assert restored.lspci == "10000:3b:1f.7"
+
+    def test_packed(self):
+        pci_address = PCIAddress(0x10000, 0x3B, 0x1F, 7)
+        assert pci_address.packed == 0x10000 << 24 | 0x3B << 16 | 0x1F << 8 | 7
+        assert PCIAddress.pack(0x10000, 0x3B, 0x1F, 7) == pci_address.packed
+        restored = PCIAddress.from_packed(pci_address.packed)
+        assert restored == pci_address
+        assert restored.lspci == "10000:3b:1f.7"
+        assert PCIAddress(0, 1, 0, 0).packed > PCIAddress(0, 0, 0x1F, 7).packed
+
+    @pytest.mark.parametrize("packed", [-1, 1 << 56])
+    def test_from_packed_out_of_bounds(self, packed):
+        with pytest.raises(ValueError, match="out of bounds"):
+            PCIAddress.from_packed(packed)
+
+    def test_pickle_smaller_than_fields(self):
+        addresses = [PCIAddress(0, bus, slot, 0) for bus in range(16) for slot in range(32)]
+        assert len(pickle.dumps(addresses)) < len(pickle.dumps([vars(address) for address in addresses]))
@@ -0,0 +1,127 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from itertools import islice
+
+import pytest
+
+from mfd_typing import PCIAddress
+from mfd_typing.pci_address_range import PCIAddressRange
+
+
+class TestPCIAddressRange:
+    def test_wildcards(self):
+        bus_range = PCIAddressRange(domain=0, bus=0x3B)
+        assert PCIAddress(data="0000:3b:00.1") in bus_range
+        assert PCIAddress(data="0000:3b:1f.7") in bus_range
+        assert PCIAddress(data="0000:3c:00.0") not in bus_range
+        assert PCIAddress(data="0001:3b:00.0") not in bus_range
+        assert len(bus_range) == 256
+        assert str(bus_range) == "0000:3b:*.*"
+
+    def test_ranges(self):
+        slot_range = PCIAddressRange(domain=1, slot=range(0, 5))
+        assert PCIAddress(1, 0xAF, 4, 7) in slot_range
+        assert PCIAddress(1, 0xAF, 5, 0) not in slot_range
+        assert len(slot_range) == 256 * 5 * 8
+        assert repr(slot_range) == "PCIAddressRange('0001:*:00-04.*')"
+
+    def test_incorrect(self):
+        for kwargs in ({"bus": 0x100}, {"slot": 0x20}, {"func": 8}, {"bus": range(3, 3)}, {"bus": range(0, 8, 2)}):
+            with pytest.raises(ValueError):
+                PCIAddressRange(**kwargs)
+        with pytest.raises(AttributeError):
+            PCIAddressRange()._boxes = ()
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("0000:3b:*.*", PCIAddressRange(0, 0x3B)),
+            ("0000:3b:00.0-7", PCIAddressRange(0, 0x3B, 0)),
+            ("0000:3b:00.0-3", PCIAddressRange(0, 0x3B, 0, range(0, 4))),
+            ("3b:00.1", PCIAddressRange(0, 0x3B, 0, 1)),
+            ("*:18-1A:00.0", PCIAddressRange(bus=range(0x18, 0x1B), slot=0, func=0)),
+            ("0001-0002:00:00.0", PCIAddressRange(range(1, 3), 0, 0, 0)),
+        ],
+    )
+    def test_parse(self, text, expected):
+        assert PCIAddressRange.parse(text) == expected
+
+    def test_parse_incorrect(self):
+        for text in ("", "3b", "0000:3b:00", "0000:3b:00.8", "0000:3b:20.0", "0000:3b:02-01.0", "0000:3g:00.0"):
+            with pytest.raises(ValueError):
+                PCIAddressRange.parse(text)
+
+    def test_iteration_order(self):
+        address_range = PCIAddressRange.parse("0000:3b:01.0-1,0000:18:00.1,0000:3b:00.7")
+        assert [address.lspci for address in address_range] == [
+            "0000:18:00.1",
+            "0000:3b:00.7",
+            "0000:3b:01.0",
+            "0000:3b:01.1",
+        ]
+        assert list(address_range) == sorted(address_range)
+
+    def test_lazy_iteration(self):
+        address_range = PCIAddressRange()
+        assert len(address_range) == 2**32 * 256 * 32 * 8
+        assert list(islice(address_range, 2)) == [PCIAddress(0, 0, 0, 0), PCIAddress(0, 0, 0, 1)]
+
+    def test_intersection(self):
+        address_range = PCIAddressRange.parse("0000:3b:*.*") & PCIAddressRange.parse("0000:*:00-01.0")
+        assert str(address_range) == "0000:3b:00-01.0"
+        assert not PCIAddressRange.parse("0000:3b:*.*") & PCIAddressRange.parse("0000:3c:*.*")
+
+    def test_union(self):
+        address_range = PCIAddressRange.parse("0000:3b:00-03.*") | PCIAddressRange.parse("0000:3b:02-05.0")
+        assert len(address_range) == 4 * 8 + 2
+        assert len(list(address_range)) == len(address_range)
+        assert list(address_range) == sorted(set(address_range), key=lambda address: address.lspci)
+        assert PCIAddress(0, 0x3B, 5, 0) in address_range and PCIAddress(0, 0x3B, 5, 1) not in address_range
+        assert address_range == PCIAddressRange.parse("0000:3b:04-05.0,0000:3b:00-03.*")
+        assert address_range != PCIAddressRange.parse("0000:3b:00-05.*")
+
+    def test_from_address(self):
+        pci_address = PCIAddress(data="0000:af:00.1")
+        address_range = PCIAddressRange.from_address(pci_address)
+        assert list(address_range) == [pci_address]
+        assert str(address_range) == "0000:af:00.1"
+
+    def test_filter(self):
+        address_range = PCIAddressRange(domain=0, bus=0x3B, slot=range(0, 2))
+        addresses = [PCIAddress(0, 0x3B, 1, 7), PCIAddress(0, 0x3B, 2, 0), PCIAddress(1, 0x3B, 0, 0)]
+        assert address_range.filter(addresses) == [PCIAddress(0, 0x3B, 1, 7)]
+        assert address_range.filter(reversed(addresses)) == [PCIAddress(0, 0x3B, 1, 7)]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "0000:3b:00-03.*,0000:3b:02-05.0,0002-0003:18:1f.7",
+            "*:3b:00.0,0001:*:01.1-2",
+            "0001:00-01:*.0,0005:ff:1f.*",
+        ],
+    )
+    def test_contains_many_boxes(self, text):
+        address_range = PCIAddressRange.parse(text)
+        boxes = address_range._boxes
+        addresses = [
+            PCIAddress(domain, bus, slot, func)
+            for domain in (0, 1, 2, 3, 4, 5, 2**32 - 1)
+            for bus in (0, 1, 0x18, 0x3B, 0xFF)
+            for slot in (0, 1, 2, 5, 0x1F, 0x20, 0xFF)
+            for func in (0, 1, 2, 7, 8, 0xFF)
+        ]
+        expected = [
+            address
+            for address in addresses
+            if any(
+                all(low <= value <= high for value, (low, high) in zip(vars(address).values(), box)) for box in boxes
+            )
+        ]
+        assert expected
+        assert [address for address in addresses if address in address_range] == expected
+        assert address_range.filter(addresses) == expected
+
+    def test_contains_empty(self):
+        address_range = PCIAddressRange.parse("0000:3b:*.*") & PCIAddressRange.parse("0000:3c:*.*")
+        assert PCIAddress(0, 0x3B, 0, 0) not in address_range
+        assert address_range.filter([PCIAddress(0, 0x3B, 0, 0)]) == []
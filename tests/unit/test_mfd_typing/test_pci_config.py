@@ -0,0 +1,178 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import struct
+
+import pytest
+
+from mfd_typing import PCIAddress, PCIDevice
+from mfd_typing.pci_config import (
+    CapabilityID,
+    ExtendedCapabilityID,
+    HeaderType,
+    PCIConfigSpace,
+    PCIConfigSpaceError,
+    create_fake_pci_config,
+    decode_headers,
+    parse_lspci_hexdump,
+    read_config_spaces,
+)
+
+# `lspci -xxx -s 18:00.0` of E810 port: PM -> MSI -> MSI-X -> PCI Express capabilities
+LSPCI_XXX = """18:00.0 Ethernet controller: Intel Corporation Ethernet Controller E810-C for QSFP (rev 02)
+00: 86 80 92 15 06 05 10 00 02 00 00 02 10 00 80 00
+10: 0c 00 00 a0 c7 00 00 00 00 00 00 00 0c 00 00 a4
+20: c7 00 00 00 00 00 00 00 00 00 00 00 86 80 02 00
+30: 00 00 b0 ab 40 00 00 00 00 00 00 00 ff 01 00 00
+40: 01 50 23 c8 08 00 00 00 00 00 00 00 00 00 00 00
+50: 05 70 80 01 00 00 00 00 00 00 00 00 00 00 00 00
+60: 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+70: 11 a0 ff 87 03 00 00 00 03 80 00 00 00 00 00 00
+80: 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+90: 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+a0: 10 00 02 00 e2 8c 00 10 37 29 09 00 04 f1 43 00
+b0: 40 00 04 10 00 00 00 00 00 00 00 00 00 00 00 00
+c0: 00 00 00 00 9f 13 00 00 00 00 00 00 0e 00 00 00
+d0: 03 00 1f 00 00 00 00 00 00 00 00 00 00 00 00 00
+e0: 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+f0: 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+
+18:00.1 Ethernet controller: Intel Corporation Ethernet Controller E810-C for QSFP (rev 02)
+00: 86 80 92 15 06 05 10 00 02 00 00 02 10 00 80 00
+10: 0c 00 00 9e c7 00 00 00 00 00 00 00 0c 00 00 a4
+20: c7 00 00 00 00 00 00 00 00 00 00 00 86 80 02 00
+30: 00 00 b0 ab 40 00 00 00 00 00 00 00 ff 02 00 00
+"""
+
+# extended capabilities: AER -> ARI -> SR-IOV -> DSN
+EXTENDED = [(0x100, 0x0001, 2, 0x148), (0x148, 0x000E, 1, 0x150), (0x150, 0x0010, 1, 0x190), (0x190, 0x0003, 1, 0)]
+
+
+def _extended_config() -> bytes:
+    config = bytearray(parse_lspci_hexdump(LSPCI_XXX)[PCIAddress(0, 0x18, 0, 0)].data) + bytes(3840)
+    for offset, capability_id, version, next_offset in EXTENDED:
+        struct.pack_into("<I", config, offset, capability_id | version << 16 | next_offset << 20)
+    return bytes(config)
+
+
+def _hexdump(pci_address: PCIAddress, config: bytes) -> str:
+    lines = [f"{pci_address.lspci} Ethernet controller: Intel Corporation Device 1592"]
+    for offset in range(0, len(config), 16):
+        lines.append(f"{offset:02x}: {config[offset:offset + 16].hex(' ')}")
+    return "\n".join(lines) + "\n"
+
+
+class TestPCIConfigSpace:
+    def test_header(self):
+        config = parse_lspci_hexdump(LSPCI_XXX)[PCIAddress(0, 0x18, 0, 0)]
+        assert len(config) == 256
+        assert (config.vendor_id, config.device_id, config.revision) == (0x8086, 0x1592, 2)
+        assert config.class_code == 0x020000
+        assert config.header_type == HeaderType.ENDPOINT and config.multifunction
+        assert config.subsystem_ids == (0x8086, 0x0002)
+        assert config.pci_device == PCIDevice(data="8086:1592:8086:0002")
+        assert config.header.class_code == 0x020000
+        assert repr(config) == "PCIConfigSpace(8086:1592, class=020000, size=256)"
+
+    def test_zero_copy(self):
+        data = bytearray(_extended_config())
+        config = PCIConfigSpace(data)
+        data[0x08] = 3
+        assert config.revision == 3
+        assert config.data.obj is data
+
+    def test_capabilities(self):
+        config = PCIConfigSpace(_extended_config())
+        assert [(capability.id, capability.offset) for capability in config.capabilities()] == [
+            (CapabilityID.POWER_MANAGEMENT, 0x40),
+            (CapabilityID.MSI, 0x50),
+            (CapabilityID.MSIX, 0x70),
+            (CapabilityID.PCI_EXPRESS, 0xA0),
+        ]
+        assert config.find_capability(CapabilityID.MSIX).offset == 0x70
+        assert config.find_capability(CapabilityID.VPD) is None
+
+    def test_extended_capabilities(self):
+        config = PCIConfigSpace(_extended_config())
+        assert [tuple(capability) for capability in config.extended_capabilities()] == [
+            (capability_id, version, offset) for offset, capability_id, version, _ in EXTENDED
+        ]
+        assert config.find_extended_capability(ExtendedCapabilityID.SRIOV).offset == 0x150
+        assert config.find_extended_capability(ExtendedCapabilityID.ACS) is None
+        assert list(PCIConfigSpace(_extended_config()[:256]).extended_capabilities()) == []
+
+    def test_capabilities_lazy(self):
+        assert next(PCIConfigSpace(_extended_config()).capabilities()).id == CapabilityID.POWER_MANAGEMENT
+
+    def test_header_only(self):
+        config = parse_lspci_hexdump(LSPCI_XXX)[PCIAddress(0, 0x18, 0, 1)]
+        assert len(config) == 64
+        assert config.pci_device == PCIDevice(data="8086:1592:8086:0002")
+        assert list(config.capabilities()) == []
+
+    def test_capability_loop(self):
+        data = bytearray(_extended_config())
+        data[0x71] = 0x40  # MSI-X points back to PM
+        struct.pack_into("<I", data, 0x190, 0x0003 | 1 << 16 | 0x100 << 20)
+        config = PCIConfigSpace(data)
+        assert len(list(config.capabilities())) == 48
+        assert len(list(config.extended_capabilities())) == 960
+
+    def test_bridge_subsystem_from_capability(self):
+        data = bytearray(64 + 192)
+        struct.pack_into("<HHHHI", data, 0, 0x8086, 0x347A, 0, 0x10, 0x060400 << 8 | 4)
+        data[0x0E], data[0x34] = HeaderType.BRIDGE, 0x40
+        struct.pack_into("<BBxxHH", data, 0x40, CapabilityID.SUBSYSTEM_ID, 0, 0x8086, 0x0000)
+        config = PCIConfigSpace(data)
+        assert config.subsystem_ids == (0x8086, 0x0000)
+        assert decode_headers([data])[0] == (PCIDevice(0x8086, 0x347A, 0x8086, 0x0000), 0x060400, 4, 1)
+
+    def test_no_subsystem(self):
+        data = bytearray(64)
+        struct.pack_into("<HH", data, 0, 0x8086, 0x09A2)
+        assert PCIConfigSpace(data).subsystem_ids is None
+        assert decode_headers([data])[0].pci_device.sub_vendor_id is None
+
+    def test_incorrect(self):
+        with pytest.raises(PCIConfigSpaceError):
+            PCIConfigSpace(bytes(63))
+        with pytest.raises(PCIConfigSpaceError):
+            PCIConfigSpace(b"\xff" * 64)
+        with pytest.raises(PCIConfigSpaceError):
+            decode_headers([bytes(10)])
+        with pytest.raises(PCIConfigSpaceError):
+            decode_headers([b"\xff" * 64])
+
+
+class TestDecode:
+    def test_decode_headers(self):
+        config = _extended_config()
+        headers = decode_headers([config, memoryview(config)[:64], config])
+        assert [header.pci_device for header in headers] == [PCIDevice(data="8086:1592:8086:0002")] * 3
+        assert headers[0].pci_device is headers[2].pci_device
+        assert headers[0] == PCIConfigSpace(config).header
+
+    def test_parse_extended_hexdump(self):
+        config = _extended_config()
+        pci_address = PCIAddress(1, 0xAF, 0, 0)
+        parsed = parse_lspci_hexdump(_hexdump(pci_address, config))
+        assert list(parsed) == [pci_address]
+        assert bytes(parsed[pci_address].data) == config
+
+    def test_parse_hexdump_without_domain(self):
+        parsed = parse_lspci_hexdump(LSPCI_XXX)
+        assert list(parsed) == [PCIAddress(0, 0x18, 0, 0), PCIAddress(0, 0x18, 0, 1)]
+
+    def test_parse_incorrect_hexdump(self):
+        with pytest.raises(PCIConfigSpaceError):
+            parse_lspci_hexdump(LSPCI_XXX.replace("10: 0c 00 00 a0", "20: 0c 00 00 a0"))
+        with pytest.raises(PCIConfigSpaceError):
+            parse_lspci_hexdump("\n".join(LSPCI_XXX.splitlines()[:3]))
+
+    def test_read_config_spaces(self, tmp_path):
+        config = _extended_config()
+        create_fake_pci_config(tmp_path, PCIAddress(0, 0x18, 0, 1), config[:64])
+        create_fake_pci_config(tmp_path, PCIAddress(0, 0x18, 0, 0), config)
+        configs = read_config_spaces(tmp_path)
+        assert list(configs) == [PCIAddress(0, 0x18, 0, 0), PCIAddress(0, 0x18, 0, 1)]
+        assert len(configs[PCIAddress(0, 0x18, 0, 1)]) == 64
+        assert read_config_spaces(tmp_path / "missing") == {}
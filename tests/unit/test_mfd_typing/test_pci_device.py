@@ -1,5 +1,7 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import pickle
+
 from pytest import raises
 
 from mfd_typing import PCIDevice, VendorID, DeviceID, SubVendorID, SubDeviceID
@@ -49,3 +51,17 @@ class TestPCIDevice:
     def test_pci_device_incorrect_comparison(self):
         with raises(PCIDeviceIncomparableObject):
             assert PCIDevice(data="8086:1572") == "PCIDevice"
+
+    def test_from_ids(self):
+        assert PCIDevice.from_ids(0x8086, 0x1592, 0x8086, 2).__dict__ == PCIDevice(data="8086:1592:8086:0002").__dict__
+        pci_device = PCIDevice.from_ids(0x8086, 0x1592)
+        assert pci_device.__dict__ == PCIDevice(data="8086:1592").__dict__
+        assert type(pci_device.device_id) is DeviceID
+        with raises(ValueError):
+            PCIDevice.from_ids(0x10000, 0x1592)
+
+    def test_pickle(self):
+        for pci_device in (PCIDevice(data="8086:1592:8086:0002"), PCIDevice(data="8086:1592"), PCIDevice(0x8086, 1, 0)):
+            restored = pickle.loads(pickle.dumps(pci_device))
+            assert restored.__dict__ == pci_device.__dict__
+            assert type(restored.vendor_id) is VendorID
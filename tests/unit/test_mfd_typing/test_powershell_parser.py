@@ -0,0 +1,97 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import io
+
+from mfd_typing import MACAddress
+from mfd_typing.network_interface import WindowsInterfaceInfo
+from mfd_typing.powershell_parser import parse_format_list, parse_csv, parse_json, parse_windows_interfaces
+
+FORMAT_LIST_OUTPUT = """
+
+Description         : Intel(R) Ethernet Network Adapter E810-C-Q2
+Index               : 1
+Installed           : True
+MACAddress          : 6C:FE:54:40:2E:A8
+Name                : Intel(R) Ethernet Network Adapter E810-C-Q2 with very long name which is wrapped by
+                      PowerShell
+NetConnectionID     : SLOT 3 Port 1
+Availability        : 3
+
+Description         : WAN Miniport (IP)
+Index               : 3
+Installed           : False
+MACAddress          :
+NetConnectionID     :
+
+"""
+
+CSV_OUTPUT = """#TYPE Microsoft.Management.Infrastructure.CimInstance#root/cimv2/Win32_NetworkAdapter
+"Description","Index","Installed","MACAddress","Name","NetConnectionID","Availability"
+"Intel(R) Ethernet Network Adapter E810-C-Q2","1","True","6C:FE:54:40:2E:A8","E810, port 1","SLOT 3 Port 1","3"
+"WAN Miniport (IP)","3","False",,,,
+"""
+
+JSON_OUTPUT = """[
+    {"Description": "Intel(R) Ethernet Network Adapter E810-C-Q2", "Index": 1, "Installed": true,
+     "MACAddress": "6C:FE:54:40:2E:A8", "Name": "E810, port 1", "NetConnectionID": "SLOT 3 Port 1", "Speed": 1000},
+    {"Description": "WAN Miniport (IP)", "Index": 3, "Installed": false, "MACAddress": null, "NetConnectionID": null}
+]"""
+
+
+class TestPowershellParser:
+    def test_parse_format_list(self):
+        interfaces = list(parse_format_list(FORMAT_LIST_OUTPUT))
+
+        assert interfaces == [
+            WindowsInterfaceInfo(
+                description="Intel(R) Ethernet Network Adapter E810-C-Q2",
+                index="1",
+                installed=True,
+                mac_address=MACAddress("6c:fe:54:40:2e:a8"),
+                branding_string="Intel(R) Ethernet Network Adapter E810-C-Q2 with very long name which is wrapped by"
+                " PowerShell",
+                name="SLOT 3 Port 1",
+            ),
+            WindowsInterfaceInfo(description="WAN Miniport (IP)", index="3", installed=False),
+        ]
+
+    def test_parse_format_list_word_broken_inside(self):
+        output = (
+            "PNPDeviceID : PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\\n"
+            "              6CFE54FFFF402EA800\n"
+            "Name        : Intel(R) Ethernet Network Adapter\n"
+            "              E810-C-Q2\n"
+        )
+        (interface,) = parse_format_list(output)
+        assert interface.pnp_device_id == "PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\6CFE54FFFF402EA800"
+        assert interface.branding_string == "Intel(R) Ethernet Network Adapter E810-C-Q2"
+
+    def test_parse_format_list_lines(self):
+        assert list(parse_format_list(io.StringIO(FORMAT_LIST_OUTPUT))) == list(parse_format_list(FORMAT_LIST_OUTPUT))
+
+    def test_parse_csv(self):
+        interfaces = list(parse_csv(CSV_OUTPUT))
+
+        assert len(interfaces) == 2
+        assert interfaces[0].branding_string == "E810, port 1"
+        assert interfaces[0].mac_address == MACAddress("6c:fe:54:40:2e:a8")
+        assert interfaces[1] == WindowsInterfaceInfo(description="WAN Miniport (IP)", index="3", installed=False)
+
+    def test_parse_json(self):
+        interfaces = list(parse_json(JSON_OUTPUT))
+
+        assert interfaces[0].index == "1"
+        assert interfaces[0].speed == "1000"
+        assert interfaces[0].installed is True
+        assert interfaces[1] == WindowsInterfaceInfo(description="WAN Miniport (IP)", index="3", installed=False)
+
+    def test_parse_json_single_adapter(self):
+        assert list(parse_json('{"NetConnectionID": "Ethernet"}')) == [WindowsInterfaceInfo(name="Ethernet")]
+
+    def test_parse_windows_interfaces_detects_format(self):
+        from_list = parse_windows_interfaces(FORMAT_LIST_OUTPUT)
+        from_csv = parse_windows_interfaces(CSV_OUTPUT)
+        from_json = parse_windows_interfaces(JSON_OUTPUT)
+
+        assert [i.name for i in from_list] == [i.name for i in from_csv] == [i.name for i in from_json]
+        assert [i.mac_address for i in from_csv] == [i.mac_address for i in from_json]
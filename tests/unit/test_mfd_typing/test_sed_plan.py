@@ -0,0 +1,80 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import shutil
+import subprocess
+
+import pytest
+
+from mfd_typing.sed_plan import SedEditPlan, apply_locally, escape_sed_regex, escape_sed_replacement
+from mfd_typing.utils import get_sed_inline
+
+CONTENT = "net.core.rmem_max = 212992\nnet.core.wmem_max = 212992\npath = /usr/lib/a.b\nversion = 1.5 & more\n"
+requires_sed = pytest.mark.skipif(shutil.which("sed") is None, reason="sed is not available")
+
+
+class TestSedPlan:
+    def test_escaping(self):
+        assert escape_sed_regex("a.b/[c]*$^\\") == r"a\.b\/\[c\]\*\$\^\\"
+        assert escape_sed_replacement("a&b/c\\") == r"a\&b\/c\\"
+
+    def test_expression_same_as_get_sed_inline(self):
+        plan = SedEditPlan().substitute("file", "a/b", "c", line_idx=2).substitute("file", "x", "y")
+        expressions = [substitution.expression for substitution in plan.substitutions("file")]
+        for expression, (act_line, new_line, line_idx) in zip(expressions, [("a/b", "c", 2), ("x", "y", 0)]):
+            assert get_sed_inline(act_line, new_line, "file", line_idx) == f"sed -i '{expression}' file"
+
+    def test_compile_single_command_per_file(self):
+        plan = SedEditPlan()
+        plan.substitute("/etc/a.conf", "x", "y").substitute("/etc/b.conf", "p", "q").substitute("/etc/a.conf", "1", "2")
+        assert len(plan) == 3
+        assert plan.files == ["/etc/a.conf", "/etc/b.conf"]
+        assert plan.compile() == ["sed -i -e s/x/y/g -e s/1/2/g /etc/a.conf", "sed -i -e s/p/q/g /etc/b.conf"]
+        assert plan.command() == " && ".join(plan.compile())
+
+    def test_compile_script(self):
+        plan = SedEditPlan().substitute("a.conf", "x", "y").substitute("a.conf", "it's", "it is")
+        assert plan.compile_file("a.conf", script=True) == (
+            "sed -i -f /dev/stdin a.conf <<'MFD_SED_SCRIPT'\ns/x/y/g\ns/it's/it is/g\nMFD_SED_SCRIPT"
+        )
+
+    def test_empty_plan(self):
+        plan = SedEditPlan()
+        assert not plan
+        assert plan.command() == ""
+        apply_locally(plan)
+
+    @requires_sed
+    @pytest.mark.parametrize("script", [False, True])
+    def test_apply_locally(self, tmp_path, script):
+        first, second = tmp_path / "sysctl.conf", tmp_path / "other conf"
+        first.write_text(CONTENT)
+        second.write_text(CONTENT)
+        plan = SedEditPlan()
+        plan.substitute(first, "rmem_max = .*", "rmem_max = 16777216")
+        plan.substitute(first, "wmem_max = [0-9]*", "wmem_max = 16777216", line_idx=2)
+        plan.substitute(first, "/usr/lib/a.b", "/opt/lib/a&b", literal=True)
+        plan.substitute(first, "it's", "it is")
+        plan.substitute(second, "1.5 & more", "2.0 & less", literal=True)
+        apply_locally(plan, script=script)
+        assert first.read_text() == (
+            "net.core.rmem_max = 16777216\nnet.core.wmem_max = 16777216\npath = /opt/lib/a&b\nversion = 1.5 & more\n"
+        )
+        assert second.read_text() == CONTENT.replace("1.5 & more", "2.0 & less")
+
+    @requires_sed
+    def test_apply_locally_same_as_separate_commands(self, tmp_path):
+        batched, separate = tmp_path / "batched", tmp_path / "separate"
+        batched.write_text(CONTENT)
+        separate.write_text(CONTENT)
+        substitutions = [("212992", "4096", 0), ("4096", "8192", 1), ("/usr", "/opt", 0)]
+        plan = SedEditPlan()
+        for act_line, new_line, line_idx in substitutions:
+            plan.substitute(batched, act_line, new_line, line_idx)
+            subprocess.run(get_sed_inline(act_line, new_line, separate, line_idx), shell=True, check=True)
+        apply_locally(plan)
+        assert batched.read_text() == separate.read_text()
+
+    @requires_sed
+    def test_apply_locally_failure(self, tmp_path):
+        with pytest.raises(subprocess.CalledProcessError):
+            apply_locally(SedEditPlan().substitute(tmp_path / "missing", "a", "b"))
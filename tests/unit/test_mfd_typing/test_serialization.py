@@ -0,0 +1,130 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import io
+import json
+from uuid import UUID
+
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing import serialization
+from mfd_typing.network_interface import (
+    InterfaceType,
+    LinuxInterfaceInfo,
+    VlanInterfaceInfo,
+    VsiInfo,
+    WindowsInterfaceInfo,
+    ClusterInfo,
+)
+from mfd_typing.os_values import SystemInfo, OSBitness
+
+
+@pytest.fixture()
+def linux_interface():
+    return LinuxInterfaceInfo(
+        pci_address=PCIAddress(data="0000:18:00.1"),
+        pci_device=PCIDevice(data="8086:1592:8086:0002"),
+        name="eth1",
+        interface_type=InterfaceType.VF,
+        mac_address=MACAddress("00:1b:77:49:54:fd"),
+        vlan_info=VlanInterfaceInfo(vlan_id=10, parent="eth0"),
+        namespace="ns1",
+        vsi_info=VsiInfo(fn_id=1, host_id=4, is_vf=True, vsi_id=12, vport_id=3, is_created=True, is_enabled=False),
+        uuid=UUID("12345678-1234-5678-1234-567812345678"),
+    )
+
+
+class TestSerialization:
+    def test_to_dict_canonical_strings(self, linux_interface):
+        obj_dict = serialization.to_dict(linux_interface)
+
+        assert obj_dict["pci_address"] == "0000:18:00.1"
+        assert obj_dict["pci_device"] == "8086:1592:8086:0002"
+        assert obj_dict["mac_address"] == "00:1b:77:49:54:fd"
+        assert obj_dict["interface_type"] == "VF"
+        assert obj_dict["vlan_info"] == {"vlan_id": 10, "parent": "eth0"}
+        assert obj_dict["uuid"] == "12345678-1234-5678-1234-567812345678"
+        assert obj_dict["branding_string"] is None
+
+    def test_to_dict_compact(self, linux_interface):
+        obj_dict = serialization.to_dict(linux_interface, compact=True)
+
+        assert obj_dict["pci_address"] == 0x18 << 16 | 1
+        assert obj_dict["pci_device"] == 0x8086159280860002
+        assert obj_dict["mac_address"] == 0x001B774954FD
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_round_trip(self, linux_interface, compact):
+        data = serialization.dumps(linux_interface, compact=compact)
+
+        assert serialization.loads(data, LinuxInterfaceInfo, compact=compact) == linux_interface
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_round_trip_pci_device_without_sub_ids(self, compact):
+        interface = WindowsInterfaceInfo(pci_device=PCIDevice(data="8086:1592"), cluster_info=ClusterInfo(node="n1"))
+
+        decoded = serialization.from_dict(serialization.to_dict(interface, compact), WindowsInterfaceInfo, compact)
+
+        assert decoded.pci_device.sub_vendor_id is None
+        assert decoded == interface
+
+    @pytest.mark.parametrize("compact", [False, True])
+    @pytest.mark.parametrize(
+        "pci_device",
+        [
+            PCIDevice("8086", "1572", sub_vendor_id="8086"),
+            PCIDevice("8086", "1572", sub_device_id="0002"),
+            PCIDevice("8086", "1572", "8086", "0002"),
+            PCIDevice("8086", "1572"),
+        ],
+    )
+    def test_round_trip_pci_device_sub_ids_independently(self, pci_device, compact):
+        interface = LinuxInterfaceInfo(pci_device=pci_device)
+
+        data = serialization.dumps(interface, compact=compact)
+
+        assert repr(serialization.loads(data, LinuxInterfaceInfo, compact=compact).pci_device) == repr(pci_device)
+
+    def test_pci_device_single_sub_id_string(self):
+        obj_dict = serialization.to_dict(LinuxInterfaceInfo(pci_device=PCIDevice("8086", "1572", sub_device_id="2")))
+
+        assert obj_dict["pci_device"] == "8086:1572:-:0002"
+
+    def test_pci_device_missing_main_id_string(self):
+        with pytest.raises(ValueError, match="-:1572:8086:0002"):
+            serialization.from_dict({"pci_device": "-:1572:8086:0002"}, LinuxInterfaceInfo)
+
+    def test_unknown_key(self):
+        with pytest.raises(ValueError, match="LinuxInterfaceInfo: unknown field 'extra'"):
+            serialization.from_dict({"name": "eth0", "extra": 1}, LinuxInterfaceInfo)
+
+    def test_system_info(self):
+        system_info = SystemInfo(host_name="host", system_bitness=OSBitness.OS_64BIT)
+
+        data = serialization.dumps(system_info)
+
+        assert json.loads(data)["system_bitness"] == "OS_64BIT"
+        assert serialization.loads(data, SystemInfo) == system_info
+
+    def test_missing_keys_left_default(self):
+        assert serialization.from_dict({"name": "eth0"}, LinuxInterfaceInfo) == LinuxInterfaceInfo(name="eth0")
+
+    def test_encoder_cached(self):
+        assert serialization.get_encoder(LinuxInterfaceInfo) is serialization.get_encoder(LinuxInterfaceInfo)
+        assert serialization.get_decoder(LinuxInterfaceInfo) is serialization.get_decoder(LinuxInterfaceInfo)
+
+    def test_jsonl(self, linux_interface):
+        stream = io.StringIO()
+        interfaces = [linux_interface, LinuxInterfaceInfo(name="lo", interface_type=InterfaceType.VIRTUAL_DEVICE)]
+
+        assert serialization.dump_jsonl(interfaces, stream) == 2
+        assert stream.getvalue().count("\n") == 2
+        stream.seek(0)
+        assert list(serialization.iter_jsonl(stream, LinuxInterfaceInfo)) == interfaces
+
+    def test_std_json_backend(self, mocker, linux_interface):
+        mocker.patch.object(serialization, "orjson", None)
+
+        data = serialization.dumps(linux_interface)
+
+        assert serialization.loads(data, LinuxInterfaceInfo) == linux_interface
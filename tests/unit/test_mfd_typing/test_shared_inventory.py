@@ -0,0 +1,107 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from uuid import UUID
+
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.network_interface import InterfaceInfo, InterfaceType, LinuxInterfaceInfo, VlanInterfaceInfo, VsiInfo
+from mfd_typing.shared_inventory import SharedInventory, SharedInventoryError
+
+
+@pytest.fixture()
+def linux_interfaces():
+    return [
+        LinuxInterfaceInfo(
+            pci_address=PCIAddress(data="0000:18:00.1"),
+            pci_device=PCIDevice(data="8086:1592:8086:0002"),
+            name="eth1",
+            interface_type=InterfaceType.VF,
+            mac_address=MACAddress("00:1b:77:49:54:fd"),
+            installed=True,
+            vlan_info=VlanInterfaceInfo(vlan_id=10, parent="eth0"),
+            namespace="ns1",
+            vsi_info=VsiInfo(fn_id=1, host_id=4, is_vf=True, vsi_id=12, vport_id=3, is_created=True, is_enabled=False),
+            uuid=UUID("12345678-1234-5678-1234-567812345678"),
+        ),
+        LinuxInterfaceInfo(name="lo", interface_type=InterfaceType.VIRTUAL_DEVICE, installed=False),
+        LinuxInterfaceInfo(pci_device=PCIDevice(data="8086:1592"), name="eth1", namespace="ns1"),
+    ]
+
+
+@pytest.fixture()
+def shared(linux_interfaces):
+    inventory = SharedInventory.create(linux_interfaces)
+    yield inventory
+    inventory.close()
+    inventory.unlink()
+
+
+def _read_names(inventory: SharedInventory) -> list[str]:
+    return [interface.name for interface in inventory]
+
+
+class TestSharedInventory:
+    def test_records(self, shared, linux_interfaces):
+        assert shared.record_class is LinuxInterfaceInfo
+        assert len(shared) == 3
+        assert list(shared) == linux_interfaces
+        assert shared[-1] == linux_interfaces[-1]
+        assert shared[1:] == linux_interfaces[1:]
+        with pytest.raises(IndexError):
+            shared[3]
+
+    def test_column(self, shared, linux_interfaces):
+        assert shared.column("mac_address") == [MACAddress("00:1b:77:49:54:fd"), None, None]
+        assert shared.column("vlan_info") == [VlanInterfaceInfo(vlan_id=10, parent="eth0"), None, None]
+        assert shared.column("namespace") == ["ns1", None, "ns1"]
+        assert shared.column("uuid") == [interface.uuid for interface in linux_interfaces]
+        with pytest.raises(KeyError):
+            shared.column("speed")
+
+    def test_attach(self, shared, linux_interfaces):
+        with SharedInventory.attach(shared.name) as attached:
+            assert list(attached) == linux_interfaces
+        assert shared[0] == linux_interfaces[0]
+
+    def test_pickled_as_name(self, shared, linux_interfaces):
+        data = pickle.dumps(shared)
+        assert len(data) < 200
+        with pickle.loads(data) as attached:
+            assert list(attached) == linux_interfaces
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            SharedInventory.create([])
+        with SharedInventory.create([], record_class=VsiInfo) as inventory:
+            assert len(inventory) == 0
+            assert inventory.column("vsi_id") == []
+            inventory.unlink()
+
+    def test_mixed_records(self, linux_interfaces):
+        with pytest.raises(ValueError):
+            SharedInventory.create(linux_interfaces + [InterfaceInfo(name="eth0")])
+
+    def test_process_pool(self, shared):
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            assert list(pool.map(_read_names, [shared] * 2)) == [["eth1", "lo", "eth1"]] * 2
+        assert len(shared) == 3
+
+    def test_block_survives_independent_process(self, shared):
+        code = f"from mfd_typing.shared_inventory import SharedInventory as S; print(S.attach({shared.name!r})[1].name)"
+        for _ in range(2):
+            assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True).stdout == "lo\n"
+
+    def test_not_inventory(self):
+        memory = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            with pytest.raises(SharedInventoryError):
+                SharedInventory(memory)
+        finally:
+            memory.close()
+            memory.unlink()
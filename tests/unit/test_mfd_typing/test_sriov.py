@@ -0,0 +1,122 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import struct
+
+import pytest
+
+from mfd_typing import PCIAddress
+from mfd_typing.pci_config import PCIConfigSpace
+from mfd_typing.sriov import (
+    SRIOVCapability,
+    VFAddressMap,
+    routing_id,
+    unpack_address,
+    vf_addresses,
+    vf_routing_ids,
+)
+
+PF0 = PCIAddress(0, 0x18, 0, 0)
+PF1 = PCIAddress(0, 0x18, 0, 1)
+
+
+def _pf_config(total_vfs: int, num_vfs: int, offset: int, stride: int, ari: bool = True) -> PCIConfigSpace:
+    config = bytearray(4096)
+    struct.pack_into("<HHHHI", config, 0, 0x8086, 0x1592, 0x0406, 0x10, 0x020000 << 8 | 2)
+    struct.pack_into("<I", config, 0x100, 0x000E | 1 << 16 | 0x150 << 20)  # ARI -> SR-IOV
+    struct.pack_into("<I", config, 0x150, 0x0010 | 1 << 16)
+    struct.pack_into("<H", config, 0x158, 0x19 if ari else 0x09)
+    struct.pack_into("<HHHxxHHxxH", config, 0x15C, total_vfs, total_vfs, num_vfs, offset, stride, 0x1889)
+    return PCIConfigSpace(config)
+
+
+class TestVFAddresses:
+    def test_routing_ids(self):
+        assert routing_id(PCIAddress(0, 0x18, 0x1F, 7)) == 0x18FF
+        assert vf_routing_ids(0x1800, 0x108, 1, 3) == range(0x1908, 0x190B)
+        assert vf_routing_ids(0x1800, 0x80, 2, 2) == range(0x1880, 0x1884, 2)
+        assert list(vf_routing_ids(0x1800, 0x80, 0, 1)) == [0x1880]
+        assert len(vf_routing_ids(0x1800, 0x80, 1, 0)) == 0
+        assert len(vf_routing_ids(0x1800, 0, 0, 0)) == 0  # SR-IOV disabled
+
+    def test_vf_addresses(self):
+        vfs = vf_addresses(PCIAddress(1, 0x18, 0, 1), first_vf_offset=0x107, vf_stride=1, vf_count=3)
+        assert vfs == [PCIAddress(1, 0x19, 1, 0), PCIAddress(1, 0x19, 1, 1), PCIAddress(1, 0x19, 1, 2)]
+        assert [vf.lspci for vf in vfs] == ["0001:19:01.0", "0001:19:01.1", "0001:19:01.2"]
+
+    def test_stride(self):
+        vfs = vf_addresses(PF0, first_vf_offset=0x10, vf_stride=2, vf_count=4)
+        assert [vf.lspci_short for vf in vfs] == ["18:02.0", "18:02.2", "18:02.4", "18:02.6"]
+
+    def test_bus_rollover(self):
+        vfs = vf_addresses(PCIAddress(0, 0x18, 0x1F, 0), first_vf_offset=6, vf_stride=1, vf_count=4)
+        assert [vf.lspci_short for vf in vfs] == ["18:1f.6", "18:1f.7", "19:00.0", "19:00.1"]
+        assert len(vf_addresses(PCIAddress(0, 0xFE, 0, 0), 0x100, 1, 256)) == 256
+        with pytest.raises(ValueError):
+            vf_addresses(PCIAddress(0, 0xFE, 0, 0), 0x100, 1, 257)
+
+    def test_incorrect_parameters(self):
+        for offset, stride, count in ((0, 1, 4), (1, 0, 2), (1, 1, -1)):
+            with pytest.raises(ValueError):
+                vf_addresses(PF0, offset, stride, count)
+
+    def test_packed(self):
+        vfs = vf_addresses(PCIAddress(2, 0x18, 0, 0), first_vf_offset=0x100, vf_stride=1, vf_count=256, packed=True)
+        assert vfs.typecode == "Q" and len(vfs) == 256
+        assert vfs[0] == 2 << 24 | 0x19 << 16
+        assert [unpack_address(packed) for packed in vfs] == vf_addresses(PCIAddress(2, 0x18, 0, 0), 0x100, 1, 256)
+
+
+class TestSRIOVCapability:
+    def test_from_config(self):
+        capability = SRIOVCapability.from_config(_pf_config(256, 8, 0x108, 1))
+        assert capability == SRIOVCapability(256, 8, 0x108, 1, 0x1889, True)
+        assert not SRIOVCapability.from_config(_pf_config(64, 8, 0x108, 1, ari=False)).ari_capable_hierarchy
+
+    def test_no_capability(self):
+        assert SRIOVCapability.from_config(PCIConfigSpace(bytes(_pf_config(8, 8, 0x80, 1).data)[:256])) is None
+
+
+class TestVFAddressMap:
+    def test_reverse_map(self):
+        vf_map = VFAddressMap()
+        vf_map.add(PF0, 0x80, 2, 64)
+        vf_map.add(PF1, 0x80, 2, 64)  # VFs of both PFs interleave
+        assert len(vf_map) == 128
+        assert vf_map.pf_of(PCIAddress(0, 0x18, 0x10, 0)) == (PF0, 0)
+        assert vf_map.pf_of(PCIAddress(0, 0x18, 0x10, 1)) == (PF1, 0)
+        assert vf_map.pf_of(PCIAddress(0, 0x18, 0x1F, 7)) == (PF1, 63)
+        assert PCIAddress(0, 0x18, 0, 1) not in vf_map
+        with pytest.raises(KeyError):
+            vf_map.pf_of(PCIAddress(0, 0x18, 0, 1))
+        assert vf_map.vfs_of(PF1)[:2] == [PCIAddress(0, 0x18, 0x10, 1), PCIAddress(0, 0x18, 0x10, 3)]
+        assert list(vf_map.vfs_of(PF1, packed=True)) == list(vf_addresses(PF1, 0x80, 2, 64, packed=True))
+        assert vf_map.pfs == [PF0, PF1]
+
+    def test_replace_and_remove(self):
+        vf_map = VFAddressMap()
+        vf_map.add(PF0, 0x80, 1, 64)
+        vf_map.add(PF0, 0x80, 1, 4)
+        assert len(vf_map) == 4
+        vf_map.remove(PF0)
+        vf_map.remove(PF0)
+        assert len(vf_map) == 0
+        with pytest.raises(KeyError):
+            vf_map.vfs_of(PF0)
+
+    def test_from_config_spaces(self):
+        configs = {PF0: _pf_config(128, 4, 0x100, 1), PF1: _pf_config(128, 0, 0x17F, 1)}
+        vf_map = VFAddressMap.from_config_spaces(configs)
+        assert len(vf_map) == 4
+        assert vf_map.pf_of(PCIAddress(0, 0x19, 0, 3)) == (PF0, 3)
+        assert vf_map.vfs_of(PF1) == []
+        vf_map = VFAddressMap.from_config_spaces(configs, all_vfs=True)
+        assert len(vf_map) == 256
+        assert vf_map.pf_of(PCIAddress(0, 0x19, 0x10, 0)) == (PF1, 0)
+
+    def test_from_config_spaces_sriov_disabled(self):
+        configs = {PF0: _pf_config(128, 4, 0x100, 1), PF1: _pf_config(128, 0, 0, 0)}
+        for all_vfs in (False, True):
+            vf_map = VFAddressMap.from_config_spaces(configs, all_vfs=all_vfs)
+            assert vf_map.pfs == [PF0, PF1]
+            assert vf_map.vfs_of(PF1) == []
+        assert len(VFAddressMap.from_config_spaces(configs)) == 4
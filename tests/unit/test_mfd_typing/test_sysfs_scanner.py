@@ -0,0 +1,95 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.network_interface import InterfaceType, VlanInterfaceInfo
+from mfd_typing.sysfs_scanner import (
+    SysfsInterface,
+    classify_interface,
+    create_fake_sysfs_interface,
+    create_fake_vlan_config,
+    read_vlan_config,
+    scan_interfaces,
+)
+
+PF_ADDRESS = PCIAddress(data="0000:18:00.0")
+
+
+@pytest.fixture()
+def sysfs_root(tmp_path):
+    create_fake_sysfs_interface(tmp_path, "lo", mac_address="00:00:00:00:00:00")
+    create_fake_sysfs_interface(
+        tmp_path,
+        "eth0",
+        mac_address="6c:fe:54:40:2e:a8",
+        pci_address=PF_ADDRESS,
+        pci_device=PCIDevice(data="8086:1592:8086:0002"),
+        bond_slave=True,
+    )
+    create_fake_sysfs_interface(
+        tmp_path,
+        "eth0v0",
+        mac_address="6c:fe:54:40:2e:b0",
+        pci_address=PCIAddress(data="0000:18:01.0"),
+        pci_device=PCIDevice(data="8086:1889:8086:0000"),
+        physfn=PF_ADDRESS,
+    )
+    create_fake_sysfs_interface(tmp_path, "nac0", pci_address=PCIAddress(data="0000:18:00.1"))
+    create_fake_sysfs_interface(tmp_path, "bond0", mac_address="6c:fe:54:40:2e:a8", bond=True)
+    create_fake_sysfs_interface(tmp_path, "bond0.10", mac_address="6c:fe:54:40:2e:a8")
+    create_fake_sysfs_interface(
+        tmp_path, "ib0", mac_address="80:00:00:48:fe:80:00:00:00:00:00:00:00:00:00:00:00:00:00:01"
+    )
+    create_fake_vlan_config(tmp_path, {"bond0.10": (10, "bond0")})
+    return tmp_path
+
+
+class TestSysfsScanner:
+    def test_read_vlan_config(self, sysfs_root):
+        assert read_vlan_config(sysfs_root) == {"bond0.10": (10, "bond0")}
+        assert read_vlan_config(sysfs_root / "missing") == {}
+
+    def test_scan_interfaces_types(self, sysfs_root):
+        interfaces = {interface.name: interface for interface in scan_interfaces(sysfs_root, max_workers=4)}
+
+        assert {name: interface.interface_type for name, interface in interfaces.items()} == {
+            "bond0": InterfaceType.BOND,
+            "bond0.10": InterfaceType.VLAN,
+            "eth0": InterfaceType.BOND_SLAVE,
+            "eth0v0": InterfaceType.VF,
+            "ib0": InterfaceType.VIRTUAL_DEVICE,
+            "lo": InterfaceType.VIRTUAL_DEVICE,
+            "nac0": InterfaceType.BTS,
+        }
+
+    def test_scan_interfaces_attributes(self, sysfs_root):
+        interfaces = {interface.name: interface for interface in scan_interfaces(sysfs_root, namespace="ns1")}
+
+        vf = interfaces["eth0v0"]
+        assert vf.pci_address == PCIAddress(data="0000:18:01.0")
+        assert vf.pci_device == PCIDevice(data="8086:1889:8086:0000")
+        assert vf.mac_address == MACAddress("6c:fe:54:40:2e:b0")
+        assert vf.namespace == "ns1"
+        assert interfaces["nac0"].pci_device is None
+        assert interfaces["ib0"].mac_address is None
+        assert interfaces["bond0.10"].vlan_info == VlanInterfaceInfo(vlan_id=10, parent="bond0")
+        assert interfaces["lo"].pci_address is None
+
+    def test_scan_interfaces_sorted(self, sysfs_root):
+        names = [interface.name for interface in scan_interfaces(sysfs_root)]
+
+        assert names == sorted(names)
+
+    @pytest.mark.parametrize(
+        "path, pci_address, expected",
+        [
+            ("/sys/devices/pci0000:00/0000:18:00.0/net/eth0", "0000:18:00.0", InterfaceType.PF),
+            ("/sys/devices/virtual/net/br0", None, InterfaceType.VIRTUAL_DEVICE),
+            ("/sys/devices/platform/net/eth9", None, InterfaceType.GENERIC),
+        ],
+    )
+    def test_classify_interface(self, path, pci_address, expected):
+        interface = SysfsInterface("eth", path, None, pci_address, (), False, False, False, None)
+
+        assert classify_interface(interface) is expected
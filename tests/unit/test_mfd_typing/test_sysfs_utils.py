@@ -0,0 +1,21 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_typing.sysfs_utils import read_sysfs, write_sysfs
+
+
+class TestSysfsUtils:
+    def test_write_and_read(self, tmp_path):
+        path = tmp_path / "class" / "net" / "eth0" / "address"
+        write_sysfs(path, "00:1b:77:49:54:fd")
+
+        assert path.read_text() == "00:1b:77:49:54:fd\n"
+        assert read_sysfs(str(path)) == "00:1b:77:49:54:fd"
+
+    def test_read_missing(self, tmp_path):
+        path = str(tmp_path / "numa_node")
+
+        assert read_sysfs(path, missing_ok=True) is None
+        with pytest.raises(FileNotFoundError):
+            read_sysfs(path)
@@ -1,6 +1,7 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
 import collections
+import pickle
 
 import pytest
 
@@ -61,6 +62,11 @@ class TestVendorDeviceID:
     def test_cast_to_int(self):
         assert int(self.cls(0xDEAD)) == 0xDEAD
 
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(self.cls(0xDEAD)))
+        assert type(restored) is self.cls
+        assert restored == self.cls(0xDEAD)
+
 
 class _VendorDeviceIDDescendantMixin:
     """Mixin for testing descendants of _VendorDeviceID class."""
@@ -0,0 +1,78 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_typing.network_interface import VsiInfo
+from mfd_typing.vsi_table import VsiTable
+
+VSI_DUMP = (
+    "No. of VSI entries: 4\n"
+    "fn_id: 0x0   host_id: 0x0   is_vf: no  vsi_id: 0x1   vport_id 0x0   "
+    "is_created: yes is_enabled: yes mac addr: 00:00:00:00:03:14\n"
+    "fn_id: 0x1   host_id: 0x4   is_vf: yes vsi_id: 0x12  vport_id 0x3   "
+    "is_created: yes is_enabled: yes mac addr: 00:00:00:00:03:15\n"
+    "fn_id: 0x2   host_id: 0x4   is_vf: yes vsi_id: 0x13  vport_id 0x3   "
+    "is_created: yes is_enabled: no  mac addr: 00:00:00:00:03:16\n"
+    "fn_id: 0x3   host_id: 0x4   is_vf: no  vsi_id: 0x14  vport_id 0x4   "
+    "is_created: no  is_enabled: no  mac addr: 00:00:00:00:03:17\n"
+)
+
+
+@pytest.fixture()
+def table():
+    return VsiTable.from_dump(VSI_DUMP)
+
+
+class TestVsiTable:
+    def test_from_dump(self, table):
+        assert len(table) == 4
+        assert table[1] == VsiInfo(
+            fn_id=1, host_id=4, is_vf=True, vsi_id=0x12, vport_id=3, is_created=True, is_enabled=True
+        )
+        assert table[-1] == VsiInfo(
+            fn_id=3, host_id=4, is_vf=False, vsi_id=0x14, vport_id=4, is_created=False, is_enabled=False
+        )
+        with pytest.raises(IndexError):
+            table[4]
+
+    def test_round_trip_vsi_infos(self, table):
+        vsi_infos = list(table)
+
+        assert list(VsiTable(vsi_infos)) == vsi_infos
+
+    def test_where(self, table):
+        selection = table.where(host_id=4, is_vf=True, is_enabled=True)
+
+        assert len(selection) == 1
+        assert list(selection.rows()) == [1]
+        assert [vsi.vsi_id for vsi in selection] == [0x12]
+        assert list(table.where(host_id=4, is_created=False).rows()) == [3]
+        assert not table.where(host_id=7)
+        assert len(table.where()) == 4
+
+    def test_selection_operators(self, table):
+        vfs = table.where(is_vf=True)
+        enabled = table.where(is_enabled=True)
+
+        assert list((vfs & enabled).rows()) == [1]
+        assert list((vfs | enabled).rows()) == [0, 1, 2]
+        assert list((~vfs).rows()) == [0, 3]
+        assert vfs.values("vsi_id") == [0x12, 0x13]
+
+    def test_indexes(self, table):
+        assert table.get_by_vsi_id(0x13).fn_id == 2
+        assert table.get_by_vsi_id(0x99) is None
+        assert table.get_by_vport_id(3).values("fn_id") == [1, 2]
+
+    def test_columns(self, table):
+        assert list(table.column("host_id")) == [0, 4, 4, 4]
+        assert table.column("is_vf") == 0b0110
+
+    def test_append_invalidates_masks(self, table):
+        assert len(table.where(host_id=4)) == 3
+
+        table.append(VsiInfo(fn_id=4, host_id=4, is_vf=True, vsi_id=0x15, vport_id=5, is_created=True, is_enabled=True))
+
+        assert len(table.where(host_id=4)) == 4
+        assert list(table.where(is_vf=False).rows()) == [0, 3]
+        assert table.get_by_vsi_id(0x15).vport_id == 5
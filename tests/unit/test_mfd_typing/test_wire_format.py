@@ -0,0 +1,127 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import struct
+from uuid import UUID
+
+import pytest
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.network_interface import (
+    ClusterInfo,
+    InterfaceType,
+    LinuxInterfaceInfo,
+    VlanInterfaceInfo,
+    VsiInfo,
+    WindowsInterfaceInfo,
+)
+from mfd_typing.wire_format import encode_records, decode_records, WireFormatError, RecordTable
+
+
+@pytest.fixture()
+def linux_interfaces():
+    return [
+        LinuxInterfaceInfo(
+            pci_address=PCIAddress(data="0000:18:00.1"),
+            pci_device=PCIDevice(data="8086:1592:8086:0002"),
+            name="eth1",
+            interface_type=InterfaceType.VF,
+            mac_address=MACAddress("00:1b:77:49:54:fd"),
+            installed=True,
+            vlan_info=VlanInterfaceInfo(vlan_id=10, parent="eth0"),
+            namespace="ns1",
+            vsi_info=VsiInfo(fn_id=1, host_id=4, is_vf=True, vsi_id=12, vport_id=3, is_created=True, is_enabled=False),
+            uuid=UUID("12345678-1234-5678-1234-567812345678"),
+        ),
+        LinuxInterfaceInfo(name="lo", interface_type=InterfaceType.VIRTUAL_DEVICE, installed=False),
+        LinuxInterfaceInfo(pci_device=PCIDevice(data="8086:1592"), name="eth1", namespace="ns1"),
+    ]
+
+
+class TestWireFormat:
+    def test_round_trip_linux(self, linux_interfaces):
+        table = decode_records(encode_records(linux_interfaces))
+
+        assert table.record_class is LinuxInterfaceInfo
+        assert len(table) == 3
+        assert list(table) == linux_interfaces
+        assert table[2].pci_device.sub_vendor_id is None
+        assert table[1].installed is False
+        assert table[1].branding_string is None
+        assert [table[index] for index in range(len(table))] == linux_interfaces
+
+    def test_decoded_records_are_complete_objects(self, linux_interfaces):
+        first, *_ = decode_records(encode_records(linux_interfaces))
+
+        assert vars(first) == vars(linux_interfaces[0])
+        assert type(first.pci_device.vendor_id) is type(linux_interfaces[0].pci_device.vendor_id)
+        assert first.pci_address.lspci == "0000:18:00.1"
+        assert str(first.mac_address) == "00:1b:77:49:54:fd"
+
+    def test_round_trip_windows(self):
+        interfaces = [
+            WindowsInterfaceInfo(name="Ethernet 2", guid="{abc}", cluster_info=ClusterInfo(node="node1")),
+            WindowsInterfaceInfo(name="Ethernet 3", speed="10000000000"),
+        ]
+
+        assert list(decode_records(encode_records(interfaces))) == interfaces
+
+    def test_round_trip_pci_device_and_vsi_info(self):
+        devices = [PCIDevice(data="8086:1592:8086:0002"), PCIDevice(data="8086:1889")]
+        vsis = [
+            VsiInfo(fn_id=i, host_id=4, is_vf=True, vsi_id=i, vport_id=i, is_created=True, is_enabled=True)
+            for i in range(5)
+        ]
+
+        assert list(decode_records(encode_records(devices))) == devices
+        assert list(decode_records(encode_records(vsis))) == vsis
+
+    def test_strings_deduplicated(self, linux_interfaces):
+        data = encode_records(linux_interfaces)
+
+        assert data.count(b"ns1") == 1
+        assert data.count(b"eth1") == 1
+
+    def test_lazy_access(self, linux_interfaces, mocker):
+        table = decode_records(bytearray(encode_records(linux_interfaces)))
+        unpack = mocker.spy(table._layout, "unpack")
+
+        assert table[-1].name == "eth1"
+        assert unpack.call_count == 1
+        assert table[0:2] == linux_interfaces[0:2]
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_empty(self):
+        table = decode_records(encode_records([], cls=VsiInfo))
+
+        assert table.record_class is VsiInfo
+        assert len(table) == 0
+
+    def test_encode_errors(self, linux_interfaces):
+        with pytest.raises(ValueError):
+            encode_records([])
+        with pytest.raises(ValueError):
+            encode_records(linux_interfaces + [WindowsInterfaceInfo()])
+        with pytest.raises(ValueError):
+            encode_records([ClusterInfo()])
+
+    def test_decode_errors(self, linux_interfaces):
+        data = encode_records(linux_interfaces)
+
+        with pytest.raises(WireFormatError, match="magic"):
+            RecordTable(b"XXXX" + data[4:])
+        with pytest.raises(WireFormatError, match="version"):
+            RecordTable(data[:4] + struct.pack("<H", 99) + data[6:])
+        with pytest.raises(WireFormatError, match="too short"):
+            RecordTable(data[:3])
+
+    def test_truncated(self):
+        interfaces = [LinuxInterfaceInfo(name=f"eth{i}", namespace="ns1") for i in range(50)]
+        data = encode_records(interfaces)
+
+        # every region: header, records, string count, string offsets and string blob
+        for size in range(0, len(data), 5):
+            with pytest.raises(WireFormatError, match="too short|truncated|doesn't match"):
+                RecordTable(data[:size])
+        with pytest.raises(WireFormatError, match="doesn't match"):
+            RecordTable(data + b"x")